@@ -40,7 +40,8 @@ from ..portfolio.interfaces import BasePortfolioService
 from ..utils import (
     extract_market_snapshot_features,
     fetch_free_cash_from_gateway,
-    report_trade_order,
+    parse_symbols,
+    report_trade_order_nowait,
 )
 
 # Core interfaces for orchestration and portfolio service.
@@ -100,6 +101,7 @@ class DefaultDecisionCoordinator(DecisionCoordinator):
         self._history_recorder = history_recorder
         self._digest_builder = digest_builder
         self._symbols = list(dict.fromkeys(request.trading_config.symbols))
+        self._parsed_symbols = parse_symbols(self._symbols)
         self._realized_pnl: float = 0.0
         self._unrealized_pnl: float = 0.0
         self._cycle_index: int = 0
@@ -114,7 +116,7 @@ class DefaultDecisionCoordinator(DecisionCoordinator):
         try:
             if self._request.exchange_config.trading_mode == TradingMode.LIVE:
                 free_cash, total_cash = await fetch_free_cash_from_gateway(
-                    self._execution_gateway, self._symbols
+                    self._execution_gateway, parsed=self._parsed_symbols
                 )
                 logger.info(
                     "Synced balance from exchange: free_cash={}, total_cash={}",
@@ -316,7 +318,7 @@ class DefaultDecisionCoordinator(DecisionCoordinator):
                     
                     # Report asynchronously (don't wait for completion)
                     try:
-                        await report_trade_order(
+                        report_trade_order_nowait(
                             strategy_id=self.strategy_id,
                             model_provider=self._request.llm_model_config.provider,
                             model_id=self._request.llm_model_config.model_id,
@@ -0,0 +1,175 @@
+import asyncio
+
+import pytest
+
+from valuecell.agents.common.trading import utils
+from valuecell.agents.common.trading.constants import (
+    FEATURE_GROUP_BY_KEY,
+    FEATURE_GROUP_BY_MARKET_SNAPSHOT,
+)
+from valuecell.agents.common.trading.models import FeatureVector, InstrumentRef
+
+
+def _feature(symbol, values, group=FEATURE_GROUP_BY_MARKET_SNAPSHOT):
+    return FeatureVector(
+        ts=0,
+        instrument=InstrumentRef(symbol=symbol),
+        values=values,
+        meta={FEATURE_GROUP_BY_KEY: group},
+    )
+
+
+class _WeexGateway:
+    exchange_id = "weex"
+
+    def __init__(self, assets, balance=None):
+        self._assets = assets
+        self._balance = balance
+        self.balance_calls = 0
+
+    async def fetch_assets(self):
+        return self._assets
+
+    async def fetch_balance(self):
+        self.balance_calls += 1
+        return self._balance
+
+
+@pytest.mark.asyncio
+async def test_free_cash_uses_weex_assets():
+    gateway = _WeexGateway(
+        [{"coinName": "usdt", "available": "40", "equity": "100"}],
+    )
+
+    free, total = await utils.fetch_free_cash_from_gateway(gateway, ["BTC/USDT"])
+
+    assert (free, total) == (40.0, 100.0)
+    assert gateway.balance_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_free_cash_empty_weex_assets_is_zero():
+    gateway = _WeexGateway([], balance={"free": {"USDT": 5.0}})
+
+    assert await utils.fetch_free_cash_from_gateway(gateway, ["BTC/USDT"]) == (
+        0.0,
+        0.0,
+    )
+    assert gateway.balance_calls == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("assets", [None, {"data": []}])
+async def test_free_cash_falls_back_to_balance_on_unusable_assets(assets):
+    gateway = _WeexGateway(
+        assets, balance={"free": {"USDT": 5.0}, "total": {"USDT": 8.0}}
+    )
+
+    free, _ = await utils.fetch_free_cash_from_gateway(gateway, ["BTC/USDT"])
+
+    assert free == 5.0
+    assert gateway.balance_calls == 1
+
+
+def test_parse_symbols_dedupes_quotes_in_order():
+    parsed = utils.parse_symbols(["btc/usdt", "ETH-USDT", "SOL/USDC", "BROKEN"])
+
+    assert parsed.quotes == ["USDT", "USDC"]
+
+
+def test_extract_market_snapshot_features_filters_group():
+    snapshot = _feature("BTC-USDT", {"price.last": 1.0})
+    candle = _feature("BTC-USDT", {"close": 1.0}, group="interval_1m")
+
+    assert utils.extract_market_snapshot_features([snapshot, candle, None]) == [
+        snapshot
+    ]
+
+
+def test_extract_price_map_prefers_last_price():
+    features = [
+        _feature("BTC-USDT", {"price.last": 100.0, "price.mark": 99.0}),
+        _feature("ETH-USDT", {"funding.mark_price": "20.5"}),
+        _feature("SOL-USDT", {"close": 3.0}, group="interval_1m"),
+    ]
+
+    assert utils.extract_price_map(features) == {
+        "BTC-USDT": 100.0,
+        "ETH-USDT": 20.5,
+    }
+
+
+@pytest.fixture
+def posted_batches(monkeypatch):
+    batches = []
+
+    async def fake_post(client, url, reports, timeout):
+        batches.append((url, [r["n"] for r in reports]))
+
+    monkeypatch.setattr(utils, "_post_report_batch", fake_post)
+    monkeypatch.setattr(utils, "_REPORT_BATCH_WINDOW_S", 0.05)
+    monkeypatch.setattr(utils, "_report_batchers", {})
+    return batches
+
+
+async def _wait_for_batches(batches, count):
+    for _ in range(100):
+        if len(batches) >= count:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"expected {count} batches, got {batches}")
+
+
+@pytest.mark.asyncio
+async def test_report_batches_flush_after_window(posted_batches):
+    for n in range(3):
+        utils._enqueue_trade_report("http://hook", {"n": n}, 1.0)
+
+    await _wait_for_batches(posted_batches, 1)
+
+    assert posted_batches == [("http://hook", [0, 1, 2])]
+
+
+@pytest.mark.asyncio
+async def test_report_batches_flush_at_max_size(posted_batches, monkeypatch):
+    monkeypatch.setattr(utils, "_REPORT_BATCH_MAX_SIZE", 2)
+    for n in range(3):
+        utils._enqueue_trade_report("http://hook", {"n": n}, 1.0)
+
+    await _wait_for_batches(posted_batches, 2)
+
+    assert posted_batches == [("http://hook", [0, 1]), ("http://hook", [2])]
+
+
+@pytest.mark.asyncio
+async def test_report_worker_restart_keeps_queued_reports(posted_batches):
+    utils._enqueue_trade_report("http://hook", {"n": 0}, 1.0)
+    batcher = utils._report_batchers[asyncio.get_running_loop()]
+    # Stop the worker before it consumes anything
+    batcher.worker.cancel()
+    await asyncio.sleep(0)
+    assert batcher.worker.done()
+
+    utils._enqueue_trade_report("http://hook", {"n": 1}, 1.0)
+    await _wait_for_batches(posted_batches, 1)
+
+    assert posted_batches == [("http://hook", [0, 1])]
+
+
+def test_report_batches_follow_the_running_loop(posted_batches):
+    async def report(n):
+        utils._enqueue_trade_report("http://hook", {"n": n}, 1.0)
+        await _wait_for_batches(posted_batches, n + 1)
+        worker = utils._report_batchers[asyncio.get_running_loop()].worker
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+
+    for n in range(2):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(report(n))
+        finally:
+            loop.close()
+
+    assert posted_batches == [("http://hook", [0]), ("http://hook", [1])]
+    assert len(utils._report_batchers) == 1
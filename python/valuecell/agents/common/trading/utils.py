@@ -1,4 +1,8 @@
+import asyncio
+import json
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import ccxt.pro as ccxtpro
@@ -6,6 +10,11 @@ import httpx
 from loguru import logger
 from valuecell.utils.ts import get_current_timestamp_ms
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from valuecell.agents.common.trading.models import TradeInstruction, TxResult
 
@@ -15,14 +24,74 @@ from valuecell.agents.common.trading.constants import (
 )
 from valuecell.agents.common.trading.models import FeatureVector
 
+# Webhook endpoints are read once at import; the environment is loaded by
+# `valuecell/__init__.py` before this module is imported.
+_TRADE_WEBHOOK_URL = os.getenv("TRADE_ORDER_REPORT_WEBHOOK_URL")
+_DISCORD_WEBHOOK_URL = os.getenv("STRATEGY_AGENT_DISCORD_WEBHOOK_URL")
+
+
+def _read_batch_flag() -> bool:
+    return os.getenv("TRADE_ORDER_REPORT_BATCH", "false").lower() in (
+        "true",
+        "yes",
+        "1",
+    )
+
+
+# Whether trade reports are coalesced into `{"reports": [...]}` batch posts.
+# Off by default since the receiving webhook must accept the batch shape.
+_TRADE_WEBHOOK_BATCH = _read_batch_flag()
+
+
+def refresh_webhook_urls() -> None:
+    """Re-read webhook settings from the environment after a runtime change."""
+    global _TRADE_WEBHOOK_URL, _DISCORD_WEBHOOK_URL, _TRADE_WEBHOOK_BATCH
+    _TRADE_WEBHOOK_URL = os.getenv("TRADE_ORDER_REPORT_WEBHOOK_URL")
+    _DISCORD_WEBHOOK_URL = os.getenv("STRATEGY_AGENT_DISCORD_WEBHOOK_URL")
+    _TRADE_WEBHOOK_BATCH = _read_batch_flag()
+
+
+@dataclass(frozen=True)
+class ParsedSymbols:
+    """Quote currencies derived once from a strategy's symbols.
+
+    `quotes` are deduplicated, upper-cased and keep the order in which they
+    first appear in the symbol list.
+    """
+
+    quotes: list[str]
+
+
+def parse_symbols(symbols: Optional[List[str]]) -> ParsedSymbols:
+    """Extract quote currencies from symbols like 'BTC/USDT' or 'BTC-USDT'.
+
+    Symbols that do not contain exactly one separator are ignored.
+    """
+    quotes: list[str] = []
+    for sym in symbols or []:
+        s = str(sym).upper()
+        for sep in ("/", "-"):
+            parts = s.split(sep)
+            if len(parts) == 2:
+                quotes.append(parts[1])
+                break
+
+    # Deduplicate preserving order
+    return ParsedSymbols(quotes=list(dict.fromkeys(quotes)))
+
 
 async def fetch_free_cash_from_gateway(
-    execution_gateway, symbols: list[str]
+    execution_gateway,
+    symbols: Optional[list[str]] = None,
+    parsed: Optional[ParsedSymbols] = None,
 ) -> Tuple[float, float]:
     """Fetch exchange balance via `execution_gateway.fetch_balance()` or
     `execution_gateway.fetch_assets()` (for Weex) and aggregate free cash
     for the given `symbols` (quote currencies).
 
+    Callers on a hot path should pass `parsed` (see `parse_symbols`) so
+    quote currencies are not re-derived from `symbols` on every call.
+
     For Weex exchange, prefer `fetch_assets()` which provides more accurate
     available balance from `/capi/v2/account/assets` endpoint.
 
@@ -30,6 +99,8 @@ async def fetch_free_cash_from_gateway(
     balance shape cannot be parsed.
     """
     logger.info("Fetching exchange balance for LIVE trading mode")
+    if parsed is None:
+        parsed = parse_symbols(symbols)
     
     # For Weex, prefer fetch_assets() which provides more accurate available balance
     if hasattr(execution_gateway, "exchange_id") and execution_gateway.exchange_id == "weex":
@@ -37,32 +108,27 @@ async def fetch_free_cash_from_gateway(
             try:
                 logger.info("Using fetch_assets() for Weex exchange to get accurate available balance")
                 assets = await execution_gateway.fetch_assets()
+                if not isinstance(assets, list):
+                    # Let the handler below fall back to fetch_balance()
+                    raise TypeError(
+                        f"unexpected assets response type: {type(assets).__name__}"
+                    )
+                if not assets:
+                    logger.debug("Empty Weex assets response, returning 0.0")
+                    return 0.0, 0.0
                 
-                # Extract available and equity from assets
-                free_map: dict[str, float] = {}
-                equity_map: dict[str, float] = {}
-                
-                for asset in assets:
-                    coin_name = str(asset.get("coinName", "")).upper()
-                    available = float(asset.get("available", 0.0) or 0.0)
-                    equity = float(asset.get("equity", 0.0) or 0.0)
-                    
-                    if coin_name:
-                        free_map[coin_name] = available
-                        equity_map[coin_name] = equity
+                # Extract available and equity from assets in one pass
+                rows = [
+                    (name, float(asset.get("available") or 0.0), float(asset.get("equity") or 0.0))
+                    for asset in assets
+                    if (name := str(asset.get("coinName", "")).upper())
+                ]
+                free_map: dict[str, float] = {name: avail for name, avail, _ in rows}
+                equity_map: dict[str, float] = {name: eq for name, _, eq in rows}
                 
                 logger.info(f"Parsed Weex assets - free_map: {free_map}, equity_map: {equity_map}")
                 
-                # Derive quote currencies from symbols
-                quotes: list[str] = []
-                for sym in symbols or []:
-                    s = str(sym).upper()
-                    if "/" in s and len(s.split("/")) == 2:
-                        quotes.append(s.split("/")[1])
-                    elif "-" in s and len(s.split("-")) == 2:
-                        quotes.append(s.split("-")[1])
-                
-                quotes = list(dict.fromkeys(quotes))
+                quotes = parsed.quotes
                 if not quotes:
                     quotes = ["USDT", "USD", "USDC"]
                 
@@ -102,20 +168,20 @@ async def fetch_free_cash_from_gateway(
         )
         return 0.0, 0.0
 
+    if not isinstance(balance, dict) or not balance:
+        logger.debug("Empty/invalid balance response, returning 0.0")
+        return 0.0, 0.0
+
     logger.info(f"Raw balance response: {balance}")
     free_map: dict[str, float] = {}
     # ccxt balance may be shaped as: {'free': {...}, 'used': {...}, 'total': {...}}
-    try:
-        free_section = balance.get("free") if isinstance(balance, dict) else None
-    except Exception:
-        free_section = None
+    free_section = balance.get("free")
 
     if isinstance(free_section, dict):
         free_map = {str(k).upper(): float(v or 0.0) for k, v in free_section.items()}
     else:
         # fallback: per-ccy dicts: balance['USDT'] = {'free': x, 'used': y, 'total': z}
-        iterable = balance.items() if isinstance(balance, dict) else []
-        for k, v in iterable:
+        for k, v in balance.items():
             if isinstance(v, dict) and "free" in v:
                 try:
                     free_map[str(k).upper()] = float(v.get("free") or 0.0)
@@ -123,17 +189,8 @@ async def fetch_free_cash_from_gateway(
                     continue
 
     logger.info(f"Parsed free balance map: {free_map}")
-    # Derive quote currencies from symbols, fallback to common USD-stable quotes
-    quotes: list[str] = []
-    for sym in symbols or []:
-        s = str(sym).upper()
-        if "/" in s and len(s.split("/")) == 2:
-            quotes.append(s.split("/")[1])
-        elif "-" in s and len(s.split("-")) == 2:
-            quotes.append(s.split("-")[1])
-
-    # Deduplicate preserving order
-    quotes = list(dict.fromkeys(quotes))
+    # Quote currencies from symbols, fallback to common USD-stable quotes
+    quotes = parsed.quotes
     logger.info(f"Quote currencies from symbols: {quotes}")
 
     free_cash = 0.0
@@ -180,15 +237,14 @@ def extract_market_snapshot_features(
     snapshot_features: List[FeatureVector] = []
 
     for item in features:
-        if not isinstance(item, FeatureVector):
-            continue
-
-        meta = item.meta or {}
-        group_key = meta.get(FEATURE_GROUP_BY_KEY)
-        if group_key != FEATURE_GROUP_BY_MARKET_SNAPSHOT:
+        # EAFP: callers pass FeatureVectors; anything without the expected
+        # attributes is skipped without a per-item isinstance check.
+        try:
+            meta = item.meta or {}
+        except AttributeError:
             continue
-
-        snapshot_features.append(item)
+        if meta.get(FEATURE_GROUP_BY_KEY) == FEATURE_GROUP_BY_MARKET_SNAPSHOT:
+            snapshot_features.append(item)
 
     return snapshot_features
 
@@ -199,12 +255,12 @@ def extract_price_map(features: List[FeatureVector]) -> Dict[str, float]:
     price_map: Dict[str, float] = {}
 
     for item in features:
-        if not isinstance(item, FeatureVector):
-            continue
-
-        meta = item.meta or {}
-        group_key = meta.get(FEATURE_GROUP_BY_KEY)
-        if group_key != FEATURE_GROUP_BY_MARKET_SNAPSHOT:
+        try:
+            meta = item.meta or {}
+            if meta.get(FEATURE_GROUP_BY_KEY) != FEATURE_GROUP_BY_MARKET_SNAPSHOT:
+                continue
+            values = item.values or {}
+        except AttributeError:
             continue
 
         instrument = getattr(item, "instrument", None)
@@ -212,7 +268,6 @@ def extract_price_map(features: List[FeatureVector]) -> Dict[str, float]:
         if not symbol:
             continue
 
-        values = item.values or {}
         price = (
             values.get("price.last")
             or values.get("price.close")
@@ -230,6 +285,7 @@ def extract_price_map(features: List[FeatureVector]) -> Dict[str, float]:
     return price_map
 
 
+@lru_cache(maxsize=1024)
 def normalize_symbol(symbol: str) -> str:
     """Normalize symbol format for CCXT.
 
@@ -255,6 +311,14 @@ def normalize_symbol(symbol: str) -> str:
     return base_symbol
 
 
+def _dumps_json(payload) -> bytes:
+    """Serialize a webhook payload to JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+@lru_cache(maxsize=32)
 def get_exchange_cls(exchange_id: str):
     """Get CCXT exchange class by exchange ID.
     
@@ -264,6 +328,92 @@ def get_exchange_cls(exchange_id: str):
     return exchange_cls
 
 
+_REPORT_HEADERS = {
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+}
+
+# Batched trade reports: collected for up to _REPORT_BATCH_WINDOW_S seconds
+# or _REPORT_BATCH_MAX_SIZE items, then posted per webhook URL.
+_REPORT_BATCH_WINDOW_S = 0.2
+_REPORT_BATCH_MAX_SIZE = 50
+
+
+class _ReportBatcher:
+    """Queue and background consumer for batched reports on one event loop."""
+
+    def __init__(self) -> None:
+        self.queue: "asyncio.Queue[Tuple[str, Dict, float]]" = asyncio.Queue()
+        self.worker: Optional["asyncio.Task"] = None
+
+    def put(self, item: Tuple[str, Dict, float]) -> None:
+        if self.worker is None or self.worker.done():
+            # Restart on the same queue so reports left behind are still sent
+            self.worker = asyncio.create_task(_report_worker(self.queue))
+        self.queue.put_nowait(item)
+
+
+# One batcher per running loop: queues and tasks cannot outlive their loop
+_report_batchers: Dict[asyncio.AbstractEventLoop, _ReportBatcher] = {}
+
+
+def _enqueue_trade_report(webhook_url: str, payload: Dict, timeout: float) -> None:
+    """Queue a report payload, starting the background consumer if needed."""
+    loop = asyncio.get_running_loop()
+    batcher = _report_batchers.get(loop)
+    if batcher is None:
+        for stale in [other for other in _report_batchers if other.is_closed()]:
+            del _report_batchers[stale]
+        batcher = _report_batchers[loop] = _ReportBatcher()
+    batcher.put((webhook_url, payload, timeout))
+
+
+async def _report_worker(queue: "asyncio.Queue[Tuple[str, Dict, float]]") -> None:
+    """Drain the report queue and post coalesced batches forever."""
+    loop = asyncio.get_running_loop()
+    async with httpx.AsyncClient() as client:
+        while True:
+            items = [await queue.get()]
+            deadline = loop.time() + _REPORT_BATCH_WINDOW_S
+            while len(items) < _REPORT_BATCH_MAX_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            by_url: Dict[str, List[Dict]] = {}
+            timeout = max(item[2] for item in items)
+            for url, payload, _ in items:
+                by_url.setdefault(url, []).append(payload)
+            for url, reports in by_url.items():
+                await _post_report_batch(client, url, reports, timeout)
+
+
+async def _post_report_batch(
+    client: httpx.AsyncClient, webhook_url: str, reports: List[Dict], timeout: float
+) -> None:
+    try:
+        resp = await client.post(
+            webhook_url,
+            headers=_REPORT_HEADERS,
+            content=_dumps_json({"reports": reports}),
+            timeout=timeout,
+        )
+        resp.raise_for_status()
+        logger.info("Successfully reported {} trade orders in batch", len(reports))
+    except httpx.HTTPStatusError as e:
+        logger.warning(
+            "Failed to report trade order batch (HTTP {}): {}",
+            e.response.status_code,
+            e.response.text,
+        )
+    except Exception as e:
+        logger.warning("Failed to report trade order batch: {}", e, exc_info=True)
+
+
 async def report_trade_order(
     strategy_id: str,
     model_provider: str,
@@ -274,12 +424,16 @@ async def report_trade_order(
     order_id: Optional[str] = None,
     webhook_url: Optional[str] = None,
     timeout: float = 10.0,
+    batch: Optional[bool] = None,
 ) -> bool:
     """Report trade order to external webhook API.
 
     This function sends trade order information including AI decision rationale
     and execution results to an external reporting endpoint.
 
+    In batch mode the payload is queued and posted together with other
+    reports made within a short window as `{"reports": [...]}`.
+
     Args:
         strategy_id: Strategy identifier
         model_provider: LLM model provider (e.g., 'openrouter', 'google')
@@ -290,12 +444,14 @@ async def report_trade_order(
         order_id: Exchange order ID (if available)
         webhook_url: Optional webhook URL to override environment variable
         timeout: Request timeout in seconds
+        batch: Queue the report for a batched post. Defaults to the
+            `TRADE_ORDER_REPORT_BATCH` environment variable.
 
     Returns:
-        True if report was sent successfully, False otherwise
+        True if report was sent (or queued) successfully, False otherwise
     """
     if webhook_url is None:
-        webhook_url = os.getenv("TRADE_ORDER_REPORT_WEBHOOK_URL")
+        webhook_url = _TRADE_WEBHOOK_URL
 
     if not webhook_url:
         logger.debug("TRADE_ORDER_REPORT_WEBHOOK_URL not set, skipping trade order report")
@@ -333,13 +489,16 @@ async def report_trade_order(
             },
         }
 
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
+        if batch is None:
+            batch = _TRADE_WEBHOOK_BATCH
+        if batch:
+            _enqueue_trade_report(webhook_url, payload, timeout)
+            return True
 
         async with httpx.AsyncClient(timeout=timeout) as client:
-            resp = await client.post(webhook_url, headers=headers, json=payload)
+            resp = await client.post(
+                webhook_url, headers=_REPORT_HEADERS, content=_dumps_json(payload)
+            )
             resp.raise_for_status()
             logger.info(
                 "Successfully reported trade order: strategy_id={}, symbol={}, order_id={}",
@@ -361,6 +520,59 @@ async def report_trade_order(
         return False
 
 
+# Strong references to in-flight fire-and-forget reports so they are not
+# garbage collected before completion.
+_background_tasks: "set[asyncio.Task]" = set()
+
+
+def _log_report_task_result(task: "asyncio.Task") -> None:
+    _background_tasks.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.warning("Background trade order report failed: {}", exc)
+
+
+def report_trade_order_nowait(
+    strategy_id: str,
+    model_provider: str,
+    model_id: str,
+    rationale: Optional[str],
+    instruction: "TradeInstruction",
+    tx_result: "TxResult",
+    order_id: Optional[str] = None,
+    webhook_url: Optional[str] = None,
+    timeout: float = 10.0,
+    batch: Optional[bool] = None,
+) -> "asyncio.Task":
+    """Schedule `report_trade_order` in the background and return immediately.
+
+    Must be called from within a running event loop. Errors are logged from
+    the task's done callback instead of propagating to the caller.
+
+    Returns:
+        The scheduled task, for callers that want to await it later.
+    """
+    task = asyncio.create_task(
+        report_trade_order(
+            strategy_id=strategy_id,
+            model_provider=model_provider,
+            model_id=model_id,
+            rationale=rationale,
+            instruction=instruction,
+            tx_result=tx_result,
+            order_id=order_id,
+            webhook_url=webhook_url,
+            timeout=timeout,
+            batch=batch,
+        )
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_log_report_task_result)
+    return task
+
+
 async def send_discord_message(
     content: str,
     webhook_url: Optional[str] = None,
@@ -388,7 +600,7 @@ async def send_discord_message(
         httpx.HTTPStatusError: If `raise_for_status` is True and the response is an HTTP error.
     """
     if webhook_url is None:
-        webhook_url = os.getenv("STRATEGY_AGENT_DISCORD_WEBHOOK_URL")
+        webhook_url = _DISCORD_WEBHOOK_URL
 
     if not webhook_url:
         raise ValueError(
@@ -402,7 +614,9 @@ async def send_discord_message(
     payload = {"content": content}
 
     async with httpx.AsyncClient(timeout=timeout) as client:
-        resp = await client.post(webhook_url, headers=headers, json=payload)
+        resp = await client.post(
+            webhook_url, headers=headers, content=_dumps_json(payload)
+        )
         if raise_for_status:
             resp.raise_for_status()
         return resp.text
@@ -419,6 +633,53 @@ def prune_none(obj):
     return obj
 
 
+# (feature key, compact alias) pairs copied into the market section.
+_PRICE_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("price.last", "last"),
+    ("price.close", "close"),
+    ("price.open", "open"),
+    ("price.high", "high"),
+    ("price.low", "low"),
+    ("price.bid", "bid"),
+    ("price.ask", "ask"),
+    ("price.change_pct", "change_pct"),
+    ("price.volume", "volume"),
+)
+
+# Derivatives-only metrics, absent for spot instruments.
+_DERIVATIVE_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("open_interest", "open_interest"),
+    ("funding.rate", "funding_rate"),
+    ("funding.mark_price", "mark_price"),
+)
+
+
+# Set once the empty-extraction diagnostics have been logged; cleared by the
+# next successful extraction or `reset_warnings()`.
+_empty_warning_emitted = False
+
+
+def reset_warnings() -> None:
+    """Re-enable one-shot diagnostics in `extract_market_section`."""
+    global _empty_warning_emitted
+    _empty_warning_emitted = False
+
+
+def _coerce_float(value) -> Optional[float]:
+    """Convert a feature value to float, returning None if it is missing or invalid."""
+    if value is None:
+        return None
+    # Fast path: providers usually emit numbers already
+    if isinstance(value, float):
+        return value
+    if isinstance(value, int):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def extract_market_section(market_data: List[Dict]) -> Dict:
     """Extract decision-critical metrics from market feature entries."""
     
@@ -426,6 +687,7 @@ def extract_market_section(market_data: List[Dict]) -> Dict:
         logger.warning("extract_market_section: market_data is empty")
         return {}
 
+    _float = float
     compact: Dict[str, Dict] = {}
     for item in market_data:
         if not isinstance(item, dict):
@@ -442,50 +704,28 @@ def extract_market_section(market_data: List[Dict]) -> Dict:
             logger.warning("extract_market_section: skipping item with empty values for {}", symbol)
             continue
             
-        entry: Dict[str, float] = {}
-
-        for feature_key, alias in (
-            ("price.last", "last"),
-            ("price.close", "close"),
-            ("price.open", "open"),
-            ("price.high", "high"),
-            ("price.low", "low"),
-            ("price.bid", "bid"),
-            ("price.ask", "ask"),
-            ("price.change_pct", "change_pct"),
-            ("price.volume", "volume"),
-        ):
-            if feature_key in values and values[feature_key] is not None:
-                try:
-                    val_float = float(values[feature_key])
+        entry: Dict[str, float]
+        values_get = values.get
+        try:
+            entry = {
+                alias: _float(v)
+                for feature_key, alias in _PRICE_FIELDS
+                if (v := values_get(feature_key)) is not None
+            }
+        except (TypeError, ValueError):
+            # Slow path: convert key by key so one bad value does not drop
+            # the whole entry.
+            entry = {}
+            for feature_key, alias in _PRICE_FIELDS:
+                v = _coerce_float(values_get(feature_key))
+                if v is not None:
                     # Include all values, even if 0 (0 is a valid price/volume)
-                    # Only skip if it's truly None or invalid
-                    entry[alias] = val_float
-                except (TypeError, ValueError) as e:
-                    logger.debug(
-                        "extract_market_section: failed to convert {} for {}: {} (error: {})",
-                        feature_key,
-                        symbol,
-                        values[feature_key],
-                        e,
-                    )
+                    entry[alias] = v
 
-        if values.get("open_interest") is not None:
-            try:
-                entry["open_interest"] = float(values["open_interest"])
-            except (TypeError, ValueError):
-                pass
-
-        if values.get("funding.rate") is not None:
-            try:
-                entry["funding_rate"] = float(values["funding.rate"])
-            except (TypeError, ValueError):
-                pass
-        if values.get("funding.mark_price") is not None:
-            try:
-                entry["mark_price"] = float(values["funding.mark_price"])
-            except (TypeError, ValueError):
-                pass
+        for feature_key, alias in _DERIVATIVE_FIELDS:
+            v = _coerce_float(values_get(feature_key))
+            if v is not None:
+                entry[alias] = v
 
         # Keep all values including 0 (0 is valid for prices/volumes)
         # Only filter out None values
@@ -506,7 +746,12 @@ def extract_market_section(market_data: List[Dict]) -> Dict:
                 list(values.keys()) if values else [],
             )
 
+    global _empty_warning_emitted
     if not compact:
+        # Diagnostics below are costly; emit them once per failure streak
+        if _empty_warning_emitted:
+            return compact
+        _empty_warning_emitted = True
         logger.warning(
             "extract_market_section: no market data extracted from {} items. "
             "This will cause 'No market features provided' error.",
@@ -527,6 +772,7 @@ def extract_market_section(market_data: List[Dict]) -> Dict:
             else:
                 logger.warning("  First item is not a dict: {}", type(first_item))
     else:
+        _empty_warning_emitted = False
         logger.info("extract_market_section: extracted market data for {} symbols: {}", len(compact), list(compact.keys()))
 
     return compact
@@ -543,13 +789,12 @@ def group_features(features: List[FeatureVector]) -> Dict:
     grouped: Dict[str, List] = {}
 
     for fv in features:
-        data = fv.model_dump(mode="json")
-        meta = data.get("meta") or {}
-        group_key = meta.get(FEATURE_GROUP_BY_KEY)
+        # Read the typed meta directly; only dump vectors we actually keep
+        group_key = (fv.meta or {}).get(FEATURE_GROUP_BY_KEY)
 
         if not group_key:
             continue
 
-        grouped.setdefault(group_key, []).append(data)
+        grouped.setdefault(group_key, []).append(fv.model_dump(mode="json"))
 
     return grouped
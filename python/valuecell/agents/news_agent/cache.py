@@ -0,0 +1,186 @@
+"""Response cache for News Agent web searches.
+
+Lookups first try an exact match on the normalized query, then fall back to
+a semantic match: the query is embedded and compared (cosine similarity)
+against the embeddings of previously cached queries in the same namespace.
+Embeddings are optional; when no embedder is available the cache silently
+degrades to exact matching only. Callers can also opt individual queries out
+of semantic matching, for queries that differ only in a ticker or a date.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import numpy as np
+from loguru import logger
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Backoff before retrying an embedder that failed, doubling up to the cap
+_EMBED_RETRY_INITIAL_S = 5.0
+_EMBED_RETRY_MAX_S = 300.0
+
+
+@dataclass
+class _CacheEntry:
+    namespace: str
+    response: str
+    created_at: float
+    embedding: Optional[np.ndarray] = None
+
+
+class SemanticCache:
+    """In-process LRU cache of search responses with semantic lookup."""
+
+    def __init__(
+        self,
+        embedder_factory: Optional[Callable[[], Any]] = None,
+        similarity_threshold: float = 0.95,
+        max_entries: int = 256,
+    ) -> None:
+        self._embedder_factory = embedder_factory
+        self._embedder: Any = None
+        self._embedder_retry_at = 0.0
+        self._embedder_backoff = _EMBED_RETRY_INITIAL_S
+        self._similarity_threshold = similarity_threshold
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        # Query embeddings computed on a miss, reused by the following `set`
+        self._pending_embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    @staticmethod
+    def make_key(namespace: str, query: str) -> str:
+        """Build the exact-match key for a query within a namespace."""
+        normalized = f"{namespace}|{query.strip().lower()}".encode("utf-8")
+        # Keys only live in process memory, so a fast non-cryptographic hash is enough
+        if xxhash is not None:
+            return xxhash.xxh3_64_hexdigest(normalized)
+        return hashlib.sha256(normalized).hexdigest()
+
+    async def get(
+        self, namespace: str, query: str, ttl: float, semantic: bool = True
+    ) -> Optional[str]:
+        """Return a cached response younger than `ttl` seconds, if any.
+
+        With `semantic=False` only an exact match is tried and the query is
+        never embedded.
+        """
+        now = time.time()
+        key = self.make_key(namespace, query)
+
+        entry = self._entries.get(key)
+        if entry is not None and now - entry.created_at < ttl:
+            self._entries.move_to_end(key)
+            return entry.response
+        if not semantic:
+            return None
+
+        embedding = await self._embed(query)
+        if embedding is None:
+            return None
+        self._remember_embedding(key, embedding)
+
+        candidates = [
+            (k, e)
+            for k, e in self._entries.items()
+            if e.namespace == namespace
+            and e.embedding is not None
+            and now - e.created_at < ttl
+        ]
+        if not candidates:
+            return None
+
+        matrix = np.stack([e.embedding for _, e in candidates])
+        scores = matrix @ embedding
+        best = int(np.argmax(scores))
+        if float(scores[best]) < self._similarity_threshold:
+            return None
+
+        best_key, best_entry = candidates[best]
+        self._entries.move_to_end(best_key)
+        logger.debug(
+            "Semantic cache hit for query '{}' (similarity={:.3f})",
+            query,
+            float(scores[best]),
+        )
+        return best_entry.response
+
+    async def set(
+        self, namespace: str, query: str, response: str, semantic: bool = True
+    ) -> None:
+        """Store a response for the query.
+
+        With `semantic=False` the entry is stored without an embedding and can
+        only be returned for an exact match.
+        """
+        key = self.make_key(namespace, query)
+        embedding = self._pending_embeddings.pop(key, None)
+        if not semantic:
+            embedding = None
+        elif embedding is None:
+            embedding = await self._embed(query)
+
+        self._entries[key] = _CacheEntry(
+            namespace=namespace,
+            response=response,
+            created_at=time.time(),
+            embedding=embedding,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._pending_embeddings.clear()
+
+    def _remember_embedding(self, key: str, embedding: np.ndarray) -> None:
+        self._pending_embeddings[key] = embedding
+        while len(self._pending_embeddings) > self._max_entries:
+            self._pending_embeddings.popitem(last=False)
+
+    async def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Return the L2-normalized float32 embedding of `text`, or None."""
+        if self._embedder_factory is None:
+            return None
+        now = time.time()
+        if now < self._embedder_retry_at:
+            return None
+
+        try:
+            if self._embedder is None:
+                self._embedder = self._embedder_factory()
+            async_embed = getattr(self._embedder, "async_get_embedding", None)
+            if async_embed is not None:
+                raw = await async_embed(text)
+            else:
+                raw = await asyncio.to_thread(self._embedder.get_embedding, text)
+        except Exception as e:
+            # Missing provider/API key or a transient outage: serve exact
+            # matches only until the backoff expires, then try again
+            logger.warning(
+                "Semantic cache embeddings unavailable for {:.0f}s: {}",
+                self._embedder_backoff,
+                e,
+            )
+            self._embedder = None
+            self._embedder_retry_at = now + self._embedder_backoff
+            self._embedder_backoff = min(self._embedder_backoff * 2, _EMBED_RETRY_MAX_S)
+            return None
+
+        self._embedder_backoff = _EMBED_RETRY_INITIAL_S
+
+        if not raw:
+            return None
+        vector = np.asarray(raw, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
@@ -6,6 +6,7 @@ from agno.agent import Agent
 from loguru import logger
 
 from valuecell.adapters.models import create_model_for_agent
+from valuecell.agents.utils.events import EVENT_HANDLERS
 from valuecell.config.manager import get_config_manager
 from valuecell.core.agent.responses import streaming
 from valuecell.core.types import BaseAgent, StreamResponse
@@ -58,22 +59,15 @@ class NewsAgent(BaseAgent):
                 session_id=conversation_id,
             )
             async for event in response_stream:
-                if event.event == "RunContent":
-                    yield streaming.message_chunk(event.content)
-                elif event.event == "ToolCallStarted":
-                    yield streaming.tool_call_started(
-                        event.tool.tool_call_id, event.tool.tool_name
-                    )
-                elif event.event == "ToolCallCompleted":
-                    yield streaming.tool_call_completed(
-                        event.tool.result, event.tool.tool_call_id, event.tool.tool_name
-                    )
+                handler = EVENT_HANDLERS.get(event.event)
+                if handler is not None:
+                    yield handler(event)
 
             yield streaming.done()
             logger.info("News query processed successfully")
 
         except Exception as e:
-            logger.error(f"Error processing news query: {str(e)}")
+            logger.error("Error processing news query: {}", e)
             logger.exception("Full error details:")
             yield {"type": "error", "content": f"Error processing news query: {str(e)}"}
 
@@ -90,12 +84,14 @@ class NewsAgent(BaseAgent):
             response = await self.knowledge_news_agent.arun(query)
 
             logger.info("News agent query completed successfully")
-            logger.debug(f"Response length: {len(str(response.content))} characters")
+            logger.opt(lazy=True).debug(
+                "Response length: {} characters", lambda: len(str(response.content))
+            )
 
             return response.content
 
         except Exception as e:
-            logger.error(f"Error in NewsAgent run: {e}")
+            logger.error("Error in NewsAgent run: {}", e)
             logger.exception("Full error details:")
             return f"Error processing news query: {str(e)}"
 
@@ -0,0 +1,122 @@
+import pytest
+
+import valuecell.agents.news_agent.cache as cache_mod
+from valuecell.agents.news_agent.cache import SemanticCache
+
+
+class _StubEmbedder:
+    """Embeds text onto fixed vectors so similarity is predictable."""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.calls = 0
+
+    def get_embedding(self, text):
+        self.calls += 1
+        return self.vectors[text]
+
+
+@pytest.mark.asyncio
+async def test_exact_match_ignores_case_and_whitespace():
+    cache = SemanticCache()
+    await cache.set("google|gemini", "AAPL news", "summary")
+
+    assert await cache.get("google|gemini", "  aapl NEWS ", ttl=60) == "summary"
+    assert await cache.get("openrouter|sonar", "AAPL news", ttl=60) is None
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_not_returned():
+    cache = SemanticCache()
+    await cache.set("ns", "query", "summary")
+
+    assert await cache.get("ns", "query", ttl=0) is None
+
+
+@pytest.mark.asyncio
+async def test_semantic_match_above_threshold():
+    embedder = _StubEmbedder(
+        {
+            "apple stock news": [1.0, 0.0],
+            "news on apple stock": [0.99, 0.05],
+            "bitcoin price": [0.0, 1.0],
+        }
+    )
+    cache = SemanticCache(embedder_factory=lambda: embedder)
+    await cache.set("ns", "apple stock news", "apple summary")
+
+    assert await cache.get("ns", "news on apple stock", ttl=60) == "apple summary"
+    assert await cache.get("ns", "bitcoin price", ttl=60) is None
+
+
+@pytest.mark.asyncio
+async def test_missing_embedder_falls_back_to_exact_match():
+    def _raise():
+        raise ValueError("No embedding provider configured")
+
+    cache = SemanticCache(embedder_factory=_raise)
+    await cache.set("ns", "query", "summary")
+
+    assert await cache.get("ns", "query", ttl=60) == "summary"
+    assert await cache.get("ns", "other query", ttl=60) is None
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_respects_max_entries():
+    cache = SemanticCache(max_entries=2)
+    await cache.set("ns", "a", "1")
+    await cache.set("ns", "b", "2")
+    await cache.get("ns", "a", ttl=60)
+    await cache.set("ns", "c", "3")
+
+    assert await cache.get("ns", "a", ttl=60) == "1"
+    assert await cache.get("ns", "b", ttl=60) is None
+
+
+def test_make_key_normalizes_query_and_separates_namespaces():
+    key = SemanticCache.make_key("google|gemini", "  AAPL News ")
+    assert key == SemanticCache.make_key("google|gemini", "aapl news")
+    assert key != SemanticCache.make_key("openrouter|sonar", "aapl news")
+
+
+@pytest.mark.asyncio
+async def test_non_semantic_entries_only_match_exactly():
+    embedder = _StubEmbedder({"AAPL news": [1.0, 0.0], "MSFT news": [1.0, 0.0]})
+    cache = SemanticCache(embedder_factory=lambda: embedder)
+    await cache.set("ns", "AAPL news", "apple summary", semantic=False)
+
+    assert await cache.get("ns", "MSFT news", ttl=60) is None
+    assert await cache.get("ns", "MSFT news", ttl=60, semantic=False) is None
+    assert await cache.get("ns", "aapl news", ttl=60, semantic=False) == (
+        "apple summary"
+    )
+    # Only the semantic lookup for MSFT embedded anything
+    assert embedder.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_embedder_failure_is_retried_after_backoff(monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(cache_mod.time, "time", lambda: now[0])
+
+    class _FlakyEmbedder:
+        calls = 0
+
+        def get_embedding(self, text):
+            self.calls += 1
+            if self.calls == 1:
+                raise RuntimeError("rate limited")
+            return [1.0, 0.0]
+
+    embedder = _FlakyEmbedder()
+    cache = SemanticCache(embedder_factory=lambda: embedder)
+
+    await cache.set("ns", "apple stock news", "apple summary")
+    assert embedder.calls == 1
+    # Still backing off: no embedding attempt
+    assert await cache.get("ns", "news on apple stock", ttl=60) is None
+    assert embedder.calls == 1
+
+    now[0] += cache_mod._EMBED_RETRY_INITIAL_S
+    await cache.set("ns", "apple stock news", "apple summary")
+    assert await cache.get("ns", "news on apple stock", ttl=60) == "apple summary"
@@ -0,0 +1,226 @@
+import asyncio
+
+import pytest
+
+import valuecell.agents.news_agent.tools as tools
+import valuecell.agents.utils.search as search_mod
+from valuecell.agents.news_agent.cache import SemanticCache
+
+
+@pytest.fixture
+def google_backend(monkeypatch):
+    calls = []
+
+    async def _fake_google(query):
+        calls.append(query)
+        await asyncio.sleep(0.01)
+        return f"results for {query}"
+
+    monkeypatch.setattr(tools, "_search_backend", lambda: ("google", "gemini"))
+    monkeypatch.setattr(tools, "_web_search_google", _fake_google)
+    monkeypatch.setattr(tools, "_search_cache", SemanticCache())
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_call(google_backend):
+    results = await asyncio.gather(*(tools.web_search("AAPL news") for _ in range(5)))
+
+    assert results == ["results for AAPL news"] * 5
+    assert google_backend == ["AAPL news"]
+    assert tools._inflight_searches == {}
+
+
+@pytest.mark.asyncio
+async def test_repeated_search_is_served_from_cache(google_backend):
+    await tools.web_search("AAPL news")
+    await tools.web_search("aapl news")
+
+    assert google_backend == ["AAPL news"]
+
+
+@pytest.mark.asyncio
+async def test_financial_news_batch_preserves_order_and_bounds_concurrency(
+    monkeypatch,
+):
+    active = 0
+    peak = 0
+
+    async def _fake_news(ticker=None, sector=None):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return f"news for {ticker}"
+
+    monkeypatch.setattr(tools, "get_financial_news", _fake_news)
+
+    results = await tools.get_financial_news_batch(
+        ["AAPL", "MSFT", "NVDA", "TSLA"], max_concurrency=2
+    )
+
+    assert results == [f"news for {t}" for t in ["AAPL", "MSFT", "NVDA", "TSLA"]]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_breaking_news_reuses_result_within_clock_bucket(
+    google_backend, monkeypatch
+):
+    now = [1_000_000.0]
+    monkeypatch.setattr(tools.time, "time", lambda: now[0])
+    monkeypatch.setattr(tools, "_breaking_news_cache", None)
+    cache_gets = []
+    original_get = tools._search_cache.get
+
+    async def _counting_get(*args, **kwargs):
+        cache_gets.append(args)
+        return await original_get(*args, **kwargs)
+
+    monkeypatch.setattr(tools._search_cache, "get", _counting_get)
+
+    first = await tools.get_breaking_news()
+    second = await tools.get_breaking_news()
+    assert first == second
+    assert len(google_backend) == 1
+    assert len(cache_gets) == 1
+
+    now[0] += tools._BREAKING_NEWS_BUCKET_S
+    await tools.get_breaking_news()
+    assert len(cache_gets) == 2
+
+
+def test_search_agent_is_built_once_per_backend(monkeypatch):
+    created = []
+
+    def _fake_create_model(**kwargs):
+        created.append(kwargs)
+        return object()
+
+    class _FakeAgent:
+        def __init__(self, model):
+            self.model = model
+
+    monkeypatch.setattr(search_mod, "create_model", _fake_create_model)
+    monkeypatch.setattr(search_mod, "Agent", _FakeAgent)
+    search_mod._build_search_agent.cache_clear()
+    try:
+        first = tools.get_search_agent(
+            "openrouter", "perplexity/sonar", max_tokens=None
+        )
+        second = tools.get_search_agent(
+            "openrouter", "perplexity/sonar", max_tokens=None
+        )
+        other = tools.get_search_agent("google", "gemini-2.5-flash", search=True)
+    finally:
+        search_mod._build_search_agent.cache_clear()
+
+    assert first is second
+    assert other is not first
+    assert len(created) == 2
+
+
+def test_search_agent_is_rebuilt_after_key_rotation(monkeypatch):
+    created = []
+
+    def _fake_create_model(**kwargs):
+        created.append(kwargs)
+        return object()
+
+    class _FakeAgent:
+        def __init__(self, model):
+            self.model = model
+
+    monkeypatch.setattr(search_mod, "create_model", _fake_create_model)
+    monkeypatch.setattr(search_mod, "Agent", _FakeAgent)
+    monkeypatch.setenv("OPENROUTER_API_KEY", "old-key")
+    search_mod._build_search_agent.cache_clear()
+    try:
+        first = tools.get_search_agent("openrouter", "perplexity/sonar")
+        assert tools.get_search_agent("openrouter", "perplexity/sonar") is first
+
+        monkeypatch.setenv("OPENROUTER_API_KEY", "new-key")
+        rotated = tools.get_search_agent("openrouter", "perplexity/sonar")
+    finally:
+        search_mod._build_search_agent.cache_clear()
+
+    assert rotated is not first
+    assert len(created) == 2
+
+
+@pytest.mark.asyncio
+async def test_web_search_stream_yields_tokens_then_serves_cache(monkeypatch):
+    from types import SimpleNamespace
+
+    runs = []
+
+    class _StreamingAgent:
+        async def _events(self, query):
+            for token in ["Markets ", "rallied"]:
+                yield SimpleNamespace(event="RunContent", content=token)
+            yield SimpleNamespace(event="RunCompleted", content=None)
+
+        def arun(self, query, stream=False):
+            runs.append(query)
+            return self._events(query)
+
+    monkeypatch.setattr(tools, "_search_backend", lambda: ("openrouter", "sonar"))
+    monkeypatch.setattr(tools, "get_search_agent", lambda *a, **kw: _StreamingAgent())
+    monkeypatch.setattr(tools, "_search_cache", SemanticCache())
+
+    chunks = [c async for c in tools.web_search_stream("market wrap")]
+    assert chunks == ["Markets ", "rallied"]
+
+    cached = [c async for c in tools.web_search_stream("market wrap")]
+    assert cached == ["Markets rallied"]
+    assert runs == ["market wrap"]
+    assert await tools.web_search("market wrap") == "Markets rallied"
+
+
+class _ConstantEmbedder:
+    """Embeds every text onto the same vector, so any two queries match."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_embedding(self, text):
+        self.calls += 1
+        return [1.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_different_tickers_never_share_a_cache_entry(google_backend, monkeypatch):
+    embedder = _ConstantEmbedder()
+    monkeypatch.setattr(
+        tools, "_search_cache", SemanticCache(embedder_factory=lambda: embedder)
+    )
+
+    aapl = await tools.get_financial_news(ticker="AAPL")
+    msft = await tools.get_financial_news(ticker="MSFT")
+    aapl_free = await tools.web_search("AAPL earnings outlook")
+    msft_free = await tools.web_search("MSFT earnings outlook")
+
+    assert "AAPL" in aapl and "MSFT" in msft
+    assert "AAPL" in aapl_free and "MSFT" in msft_free
+    assert len(google_backend) == 4
+    assert embedder.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_semantic_lookup_runs_once_per_coalesced_search(
+    google_backend, monkeypatch
+):
+    embedder = _ConstantEmbedder()
+    monkeypatch.setattr(
+        tools, "_search_cache", SemanticCache(embedder_factory=lambda: embedder)
+    )
+
+    await asyncio.gather(*(tools.web_search("apple stock news") for _ in range(3)))
+    assert google_backend == ["apple stock news"]
+    assert embedder.calls == 1
+
+    assert await tools.web_search("news on apple stock") == (
+        "results for apple stock news"
+    )
+    assert len(google_backend) == 1
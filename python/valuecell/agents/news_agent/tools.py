@@ -1,13 +1,72 @@
 """News-related tools for the News Agent."""
 
+import asyncio
 import os
-from datetime import datetime
-from typing import Optional
+import re
+import time
+from datetime import date
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
-from agno.agent import Agent
 from loguru import logger
 
-from valuecell.adapters.models import create_model
+from valuecell.agents.utils.search import get_search_agent
+from valuecell.utils.model import get_embedder_for_agent
+
+from .cache import SemanticCache
+
+# Cache freshness per kind of search, in seconds
+_WEB_SEARCH_TTL_S = 600
+_BREAKING_NEWS_TTL_S = 120
+_FINANCIAL_NEWS_TTL_S = 3600
+# Clock bucket for the breaking news fast path, polled by many widgets
+_BREAKING_NEWS_BUCKET_S = 60
+
+_BREAKING_NEWS_QUERY = "breaking news urgent updates today"
+
+# Upper-case words (tickers) and digits (dates, years, codes) pin a query to
+# one entity or day; see `_allows_semantic_match`
+_PINNED_TERM_RE = re.compile(r"\b[A-Z]{2,5}\b|\d")
+
+_search_cache = SemanticCache(
+    embedder_factory=lambda: get_embedder_for_agent("news_agent")
+)
+# In-flight searches keyed by exact cache key, shared by concurrent callers
+_inflight_searches: Dict[str, "asyncio.Task[str]"] = {}
+
+
+# (clock bucket, search namespace, content) of the latest breaking news
+_breaking_news_cache: Optional[Tuple[int, str, str]] = None
+
+# (date, formatted date) for the current day, reused across calls
+_today_cache: Tuple[Optional[date], str] = (None, "")
+
+
+def _today_str() -> str:
+    """Return today's date as YYYY-MM-DD, formatting it once per day."""
+    global _today_cache
+    today = date.today()
+    if _today_cache[0] != today:
+        _today_cache = (today, today.strftime("%Y-%m-%d"))
+    return _today_cache[1]
+
+
+def _allows_semantic_match(query: str) -> bool:
+    """Return whether a near-identical cached query may answer `query`.
+
+    Queries that name a ticker or carry a number or date embed almost exactly
+    like the same query for another ticker or day, so they only use exact
+    matches.
+    """
+    return _PINNED_TERM_RE.search(query) is None
+
+
+def _search_backend() -> Tuple[str, str]:
+    """Return the (provider, model_id) pair that will serve web searches."""
+    if os.getenv("WEB_SEARCH_PROVIDER", "google").lower() == "google" and os.getenv(
+        "GOOGLE_API_KEY"
+    ):
+        return "google", "gemini-2.5-flash"
+    return "openrouter", "perplexity/sonar"
 
 
 async def web_search(query: str) -> str:
@@ -18,27 +77,113 @@ async def web_search(query: str) -> str:
     - Google (Gemini with search enabled) - when WEB_SEARCH_PROVIDER=google and GOOGLE_API_KEY is set
     - Perplexity (via OpenRouter) - default fallback
 
+    Recent results for the same (or a semantically near-identical) query are
+    served from an in-process cache.
+
     Args:
         query: The search query string.
 
     Returns:
         A summary of the top search results.
     """
-    # Check which provider to use based on environment configuration
-    if os.getenv("WEB_SEARCH_PROVIDER", "google").lower() == "google" and os.getenv(
-        "GOOGLE_API_KEY"
-    ):
-        return await _web_search_google(query)
-
-    # Use Perplexity Sonar via OpenRouter for web search
-    # Perplexity models are optimized for web search and real-time information
-    model = create_model(
-        provider="openrouter",
-        model_id="perplexity/sonar",
-        max_tokens=None,
+    return await _cached_web_search(
+        query, ttl=_WEB_SEARCH_TTL_S, semantic=_allows_semantic_match(query)
     )
-    response = await Agent(model=model).arun(query)
-    return response.content
+
+
+async def _cached_web_search(query: str, ttl: float, semantic: bool) -> str:
+    provider, model_id = _search_backend()
+    namespace = f"{provider}|{model_id}"
+
+    cached = await _search_cache.get(namespace, query, ttl, semantic=False)
+    if cached is not None:
+        return cached
+
+    # Coalesce concurrent identical searches onto a single provider call
+    key = _search_cache.make_key(namespace, query)
+    task = _inflight_searches.get(key)
+    if task is None:
+        task = asyncio.create_task(
+            _search_and_cache(query, provider, model_id, namespace, ttl, semantic)
+        )
+        _inflight_searches[key] = task
+        task.add_done_callback(lambda _: _inflight_searches.pop(key, None))
+    # Shield so one cancelled caller does not cancel the shared search
+    return await asyncio.shield(task)
+
+
+async def _search_and_cache(
+    query: str,
+    provider: str,
+    model_id: str,
+    namespace: str,
+    ttl: float,
+    semantic: bool,
+) -> str:
+    if semantic:
+        # Embedding the query happens here, once per coalesced search
+        cached = await _search_cache.get(namespace, query, ttl)
+        if cached is not None:
+            return cached
+
+    if provider == "google":
+        content = await _web_search_google(query)
+    else:
+        # Use Perplexity Sonar via OpenRouter for web search
+        # Perplexity models are optimized for web search and real-time information
+        agent = get_search_agent(provider, model_id, max_tokens=None)
+        response = await agent.arun(query)
+        content = response.content
+
+    if content:
+        await _search_cache.set(namespace, query, content, semantic=semantic)
+    return content
+
+
+async def web_search_stream(query: str) -> AsyncIterator[str]:
+    """Streaming variant of `web_search` that yields content as it arrives.
+
+    A cached result is yielded as a single chunk; otherwise the provider's
+    tokens are forwarded as they stream in and the full result is cached
+    once complete.
+
+    Args:
+        query: The search query string.
+
+    Yields:
+        Chunks of the search summary.
+    """
+    async for chunk in _stream_cached_web_search(
+        query, ttl=_WEB_SEARCH_TTL_S, semantic=_allows_semantic_match(query)
+    ):
+        yield chunk
+
+
+async def _stream_cached_web_search(
+    query: str, ttl: float, semantic: bool
+) -> AsyncIterator[str]:
+    provider, model_id = _search_backend()
+    namespace = f"{provider}|{model_id}"
+
+    cached = await _search_cache.get(namespace, query, ttl, semantic=semantic)
+    if cached is not None:
+        yield cached
+        return
+
+    if provider == "google":
+        agent = get_search_agent(provider, model_id, search=True)
+    else:
+        agent = get_search_agent(provider, model_id, max_tokens=None)
+
+    parts = []
+    async for event in agent.arun(query, stream=True):
+        if event.event == "RunContent" and event.content:
+            parts.append(event.content)
+            yield event.content
+
+    content = "".join(parts)
+    if content:
+        await _search_cache.set(namespace, query, content, semantic=semantic)
 
 
 async def _web_search_google(query: str) -> str:
@@ -54,12 +199,12 @@ async def _web_search_google(query: str) -> str:
     """
     # Use Google Gemini with search enabled
     # The search=True parameter enables Google Search grounding for real-time information
-    model = create_model(
-        provider="google",
-        model_id="gemini-2.5-flash",
+    agent = get_search_agent(
+        "google",
+        "gemini-2.5-flash",
         search=True,  # Enable Google Search grounding
     )
-    response = await Agent(model=model).arun(query)
+    response = await agent.arun(query)
     return response.content
 
 
@@ -69,15 +214,26 @@ async def get_breaking_news() -> str:
     Returns:
         Formatted string containing breaking news
     """
+    global _breaking_news_cache
     try:
-        search_query = "breaking news urgent updates today"
+        bucket = int(time.time() // _BREAKING_NEWS_BUCKET_S)
+        provider, model_id = _search_backend()
+        namespace = f"{provider}|{model_id}"
+        cached = _breaking_news_cache
+        if cached is not None and cached[0] == bucket and cached[1] == namespace:
+            return cached[2]
+
         logger.info("Fetching breaking news")
 
-        news_content = await web_search(search_query)
+        news_content = await _cached_web_search(
+            _BREAKING_NEWS_QUERY, ttl=_BREAKING_NEWS_TTL_S, semantic=False
+        )
+        if news_content:
+            _breaking_news_cache = (bucket, namespace, news_content)
         return news_content
 
     except Exception as e:
-        logger.error(f"Error fetching breaking news: {e}")
+        logger.error("Error fetching breaking news: {}", e)
         return f"Error fetching breaking news: {str(e)}"
 
 
@@ -94,22 +250,89 @@ async def get_financial_news(
         Formatted string containing financial news
     """
     try:
-        search_query = "financial market news"
+        search_query = _financial_news_query(ticker, sector)
+        logger.info("Searching for financial news with query: {}", search_query)
+
+        # Templated queries differ only by ticker/sector and date: exact only
+        news_content = await _cached_web_search(
+            search_query, ttl=_FINANCIAL_NEWS_TTL_S, semantic=False
+        )
+        return news_content
 
-        if ticker:
-            search_query = f"{ticker} stock news financial market"
-        elif sector:
-            search_query = f"{sector} sector financial news market"
+    except Exception as e:
+        logger.error("Error fetching financial news: {}", e)
+        return f"Error fetching financial news: {str(e)}"
 
-        # Add time constraint for recent news
-        today = datetime.now().strftime("%Y-%m-%d")
-        search_query += f" {today}"
 
-        logger.info(f"Searching for financial news with query: {search_query}")
+def _financial_news_query(ticker: Optional[str], sector: Optional[str]) -> str:
+    search_query = "financial market news"
 
-        news_content = await web_search(search_query)
-        return news_content
+    if ticker:
+        search_query = f"{ticker} stock news financial market"
+    elif sector:
+        search_query = f"{sector} sector financial news market"
+
+    # Add time constraint for recent news
+    return f"{search_query} {_today_str()}"
 
+
+async def get_breaking_news_stream() -> AsyncIterator[str]:
+    """Streaming variant of `get_breaking_news`.
+
+    Yields:
+        Chunks of breaking news content
+    """
+    try:
+        logger.info("Streaming breaking news")
+        async for chunk in _stream_cached_web_search(
+            _BREAKING_NEWS_QUERY, ttl=_BREAKING_NEWS_TTL_S, semantic=False
+        ):
+            yield chunk
     except Exception as e:
-        logger.error(f"Error fetching financial news: {e}")
-        return f"Error fetching financial news: {str(e)}"
+        logger.error("Error streaming breaking news: {}", e)
+        yield f"Error fetching breaking news: {str(e)}"
+
+
+async def get_financial_news_stream(
+    ticker: Optional[str] = None, sector: Optional[str] = None
+) -> AsyncIterator[str]:
+    """Streaming variant of `get_financial_news`.
+
+    Args:
+        ticker: Stock ticker symbol for company-specific news
+        sector: Industry sector for sector-specific news
+
+    Yields:
+        Chunks of financial news content
+    """
+    try:
+        search_query = _financial_news_query(ticker, sector)
+        logger.info("Streaming financial news with query: {}", search_query)
+        async for chunk in _stream_cached_web_search(
+            search_query, ttl=_FINANCIAL_NEWS_TTL_S, semantic=False
+        ):
+            yield chunk
+    except Exception as e:
+        logger.error("Error streaming financial news: {}", e)
+        yield f"Error fetching financial news: {str(e)}"
+
+
+async def get_financial_news_batch(
+    tickers: List[str], max_concurrency: int = 8
+) -> List[str]:
+    """Get financial news for several tickers concurrently.
+
+    Args:
+        tickers: Stock ticker symbols
+        max_concurrency: Maximum number of searches in flight at once
+
+    Returns:
+        News content per ticker, in the same order as `tickers`
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _one(ticker: str) -> str:
+        async with semaphore:
+            return await get_financial_news(ticker=ticker)
+
+    return await asyncio.gather(*(_one(t) for t in tickers))
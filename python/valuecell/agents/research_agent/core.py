@@ -1,9 +1,8 @@
+import functools
 import os
 from typing import AsyncGenerator, Dict, Optional
 
 from agno.agent import Agent
-from agno.db.in_memory import InMemoryDb
-from edgar import set_identity
 from loguru import logger
 
 import valuecell.utils.model as model_utils_mod
@@ -19,31 +18,50 @@ from valuecell.agents.research_agent.sources import (  # search_crypto_people,;
     web_search,
 )
 from valuecell.agents.utils.context import build_ctx_from_dep
+from valuecell.agents.utils.events import EVENT_HANDLERS
 from valuecell.core.agent import streaming
 from valuecell.core.types import BaseAgent, StreamResponse
 from valuecell.utils.env import agent_debug_mode_enabled
 
+_TOOLS = (
+    fetch_periodic_sec_filings,
+    fetch_event_sec_filings,
+    fetch_ashare_filings,
+    web_search,
+    # TODO: The RootData tools will cost lots of time, so we disable them for now.
+    # search_crypto_projects,
+    # search_crypto_vcs,
+    # search_crypto_people,
+)
+
+
+@functools.cache
+def _configure_sec_identity() -> None:
+    """Configure EDGAR identity once per process, only when SEC_EMAIL is present."""
+    sec_email = os.getenv("SEC_EMAIL")
+    if sec_email:
+        # Deferred: edgar is heavy and only needed by the SEC filing tools
+        from edgar import set_identity
+
+        set_identity(sec_email)
+    else:
+        logger.warning(
+            "SEC_EMAIL not set; EDGAR identity is not configured for ResearchAgent."
+        )
+
 
 class ResearchAgent(BaseAgent):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        tools = [
-            fetch_periodic_sec_filings,
-            fetch_event_sec_filings,
-            fetch_ashare_filings,
-            web_search,
-            # TODO: The RootData tools will cost lots of time, so we disable them for now.
-            # search_crypto_projects,
-            # search_crypto_vcs,
-            # search_crypto_people,
-        ]
+        from agno.db.in_memory import InMemoryDb
+
         # Lazily obtain knowledge; disable search if unavailable
         knowledge = get_knowledge()
         self.knowledge_research_agent = Agent(
             model=model_utils_mod.get_model_for_agent("research_agent"),
             instructions=[KNOWLEDGE_AGENT_INSTRUCTION],
             expected_output=KNOWLEDGE_AGENT_EXPECTED_OUTPUT,
-            tools=tools,
+            tools=list(_TOOLS),
             knowledge=knowledge,
             db=InMemoryDb(),
             # context
@@ -56,14 +74,7 @@ class ResearchAgent(BaseAgent):
             # configuration
             debug_mode=agent_debug_mode_enabled(),
         )
-        # Configure EDGAR identity only when SEC_EMAIL is present
-        sec_email = os.getenv("SEC_EMAIL")
-        if sec_email:
-            set_identity(sec_email)
-        else:
-            logger.warning(
-                "SEC_EMAIL not set; EDGAR identity is not configured for ResearchAgent."
-            )
+        _configure_sec_identity()
 
     async def stream(
         self,
@@ -81,16 +92,9 @@ class ResearchAgent(BaseAgent):
             dependencies=build_ctx_from_dep(dependencies),
         )
         async for event in response_stream:
-            if event.event == "RunContent":
-                yield streaming.message_chunk(event.content)
-            elif event.event == "ToolCallStarted":
-                yield streaming.tool_call_started(
-                    event.tool.tool_call_id, event.tool.tool_name
-                )
-            elif event.event == "ToolCallCompleted":
-                yield streaming.tool_call_completed(
-                    event.tool.result, event.tool.tool_call_id, event.tool.tool_name
-                )
+            handler = EVENT_HANDLERS.get(event.event)
+            if handler is not None:
+                yield handler(event)
         logger.info("Financial data analysis completed")
 
         yield streaming.done()
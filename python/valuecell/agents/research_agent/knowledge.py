@@ -1,23 +1,48 @@
+import asyncio
+import dataclasses
+import hashlib
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
+import aiosqlite
+import httpx
 from agno.knowledge.chunking.markdown import MarkdownChunking
+from agno.knowledge.document.base import Document
 from agno.knowledge.knowledge import Knowledge
 from agno.knowledge.reader.markdown_reader import MarkdownReader
 from agno.knowledge.reader.pdf_reader import PDFReader
 from loguru import logger
 
-from .vdb import get_vector_db
+from valuecell.utils.path import get_knowledge_path
+
+from .vdb import get_vector_db, prewarm_indexes
+
+try:
+    import hishel
+except ImportError:
+    hishel = None
 
 _knowledge_cache: Optional[Knowledge] = None
+_knowledge_lock = threading.Lock()
 
 
 def get_knowledge() -> Optional[Knowledge]:
     """Lazily create and cache the Knowledge instance.
 
     Returns None when embeddings/vector DB are unavailable, enabling a
-    tools-only mode without knowledge search.
+    tools-only mode without knowledge search. The first call builds the
+    full-text index, so async callers should run it in a worker thread.
     """
+    if _knowledge_cache is not None:
+        return _knowledge_cache
+    with _knowledge_lock:
+        return _create_knowledge()
+
+
+def _create_knowledge() -> Optional[Knowledge]:
     global _knowledge_cache
     if _knowledge_cache is not None:
         return _knowledge_cache
@@ -34,7 +59,6 @@ def get_knowledge() -> Optional[Knowledge]:
             vector_db=vdb,
             max_results=10,
         )
-        return _knowledge_cache
     except Exception as e:
         logger.warning(
             "Failed to create Knowledge for ResearchAgent; disabling. Error: {}",
@@ -42,37 +66,355 @@ def get_knowledge() -> Optional[Knowledge]:
         )
         return None
 
+    prewarm_indexes(vdb)
+    return _knowledge_cache
+
+
+class _ChunkCacheMixin:
+    """Memoize `chunk_document` by document content.
+
+    Re-ingesting a document that was already chunked (retries, re-runs)
+    skips the chunking work. Callers get fresh Document copies since
+    ingestion mutates them.
+    """
+
+    _chunk_cache_max_entries = 32
+
+    def chunk_document(self, document: Document) -> List[Document]:
+        cache: "OrderedDict[str, List[Document]]" = self.__dict__.setdefault(
+            "_chunk_cache", OrderedDict()
+        )
+        raw_key = (
+            f"{document.id}|{document.name}|{document.meta_data}|{document.content}"
+        )
+        key = hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+        chunks = cache.get(key)
+        if chunks is None:
+            chunks = super().chunk_document(document)
+            cache[key] = chunks
+            while len(cache) > self._chunk_cache_max_entries:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return [
+            dataclasses.replace(chunk, meta_data=dict(chunk.meta_data))
+            for chunk in chunks
+        ]
+
+
+class CachingMarkdownReader(_ChunkCacheMixin, MarkdownReader):
+    pass
+
+
+class CachingPDFReader(_ChunkCacheMixin, PDFReader):
+    pass
+
+
+md_reader = CachingMarkdownReader(chunking_strategy=MarkdownChunking())
+pdf_reader = CachingPDFReader(chunking_strategy=MarkdownChunking())
+
+
+class IngestionLedger:
+    """SQLite record of content hashes already embedded into the vector DB.
+
+    Lives next to the LanceDB tables so it shares their lifetime. Lookups
+    and writes are best effort: a ledger failure never blocks ingestion.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._initialized = False
+        self._init_lock = None  # lazy to avoid loop-binding in __init__
+
+    async def _ensure_initialized(self) -> None:
+        if self._initialized:
+            return
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        async with self._init_lock:
+            if self._initialized:
+                return
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS ingested (
+                      content_sha256 TEXT PRIMARY KEY,
+                      name TEXT,
+                      ts TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    );
+                    """
+                )
+                await db.commit()
+            self._initialized = True
+
+    async def contains(self, content_sha256: str) -> bool:
+        try:
+            await self._ensure_initialized()
+            async with aiosqlite.connect(self.db_path) as db:
+                cur = await db.execute(
+                    "SELECT 1 FROM ingested WHERE content_sha256 = ?",
+                    (content_sha256,),
+                )
+                return await cur.fetchone() is not None
+        except Exception as e:
+            logger.warning("Ingestion ledger lookup failed: {}", e)
+            return False
+
+    async def record(self, content_sha256: str, name: Optional[str]) -> None:
+        try:
+            await self._ensure_initialized()
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.execute(
+                    "INSERT OR REPLACE INTO ingested (content_sha256, name) VALUES (?, ?)",
+                    (content_sha256, name),
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning("Failed to record ingested content: {}", e)
+
+
+_ledgers: Dict[str, IngestionLedger] = {}
+
+
+def _get_ledger(knowledge: Knowledge) -> Optional[IngestionLedger]:
+    """Return the ledger for the knowledge's local LanceDB directory, if any."""
+    uri = getattr(getattr(knowledge, "vector_db", None), "uri", None)
+    if not isinstance(uri, str) or "://" in uri:
+        return None
+    ledger = _ledgers.get(uri)
+    if ledger is None:
+        ledger = _ledgers[uri] = IngestionLedger(os.path.join(uri, "ingested.db"))
+    return ledger
+
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Shared client for remote documents, with an on-disk HTTP cache if available.
+
+    Created lazily to avoid binding to an event loop at import time.
+    """
+    global _http_client
+    if _http_client is None:
+        transport = None
+        if hishel is not None:
+            storage = hishel.AsyncFileStorage(
+                base_path=Path(get_knowledge_path()) / ".http_cache"
+            )
+            transport = hishel.AsyncCacheTransport(
+                transport=httpx.AsyncHTTPTransport(), storage=storage
+            )
+        _http_client = httpx.AsyncClient(
+            transport=transport, timeout=60.0, follow_redirects=True
+        )
+    return _http_client
+
+
+async def _download_pdf(url: str) -> Optional[Path]:
+    """Download a PDF to a stable local path derived from its URL.
+
+    The stable path keeps agno's path-based dedup equivalent to the previous
+    URL-based one. Returns None if the download fails.
+    """
+    try:
+        resp = await _get_http_client().get(url)
+        resp.raise_for_status()
+    except Exception as e:
+        logger.warning("Failed to download PDF {}: {}", url, e)
+        return None
+
+    pdf_dir = Path(get_knowledge_path()) / "pdf"
+    pdf_dir.mkdir(parents=True, exist_ok=True)
+    local_path = pdf_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.pdf"
+    await asyncio.to_thread(local_path.write_bytes, resp.content)
+    return local_path
 
-md_reader = MarkdownReader(chunking_strategy=MarkdownChunking())
-pdf_reader = PDFReader(chunking_strategy=MarkdownChunking())
+
+async def _remote_content_key(url: str) -> Optional[str]:
+    """Key a remote document by its URL and HTTP validators (ETag/Last-Modified).
+
+    Returns None when the server exposes neither validator, since the
+    document cannot then be recognized as unchanged.
+    """
+    try:
+        resp = await _get_http_client().head(url, timeout=10.0)
+        resp.raise_for_status()
+    except Exception as e:
+        logger.debug("HEAD request failed for {}: {}", url, e)
+        return None
+
+    etag = resp.headers.get("etag")
+    last_modified = resp.headers.get("last-modified")
+    if not etag and not last_modified:
+        return None
+    key = f"{url}|{etag or ''}|{last_modified or ''}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _file_sha256(path: Path) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _content_hash_stored(vector_db, content_hash: str) -> bool:
+    """Return whether any row of the vector DB carries `content_hash`.
+
+    agno serializes `content_hash` as the last key of each row's JSON
+    payload, so a filtered scan can stop at the first match instead of
+    loading and decoding every row.
+    """
+    table = getattr(vector_db, "table", None)
+    if table is None:
+        return False
+    # The hash is hex, so it needs no escaping inside the SQL literal
+    rows = (
+        table.search()
+        .where(f'payload LIKE \'%"content_hash": "{content_hash}"}}\'')
+        .select(["id"])
+        .limit(1)
+        .to_list()
+    )
+    return bool(rows)
+
+
+async def _content_stored(knowledge: Knowledge, source: str) -> bool:
+    """Return whether the vector DB holds the content added from `source`.
+
+    `add_content_async` logs read, embedding and insert failures, marks the
+    content FAILED and returns normally, so the ledger must confirm content
+    actually landed before recording it. agno hashes path and URL content
+    by the SHA-256 of that path or URL.
+    """
+    content_hash = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    try:
+        return await asyncio.to_thread(
+            _content_hash_stored, knowledge.vector_db, content_hash
+        )
+    except Exception as e:
+        logger.warning("Could not confirm ingestion of {}: {}", source, e)
+        return False
 
 
 async def insert_md_file_to_knowledge(
     name: str, path: Path, metadata: Optional[dict] = None
 ):
-    knowledge = get_knowledge()
+    # First use builds the search indexes; keep that off the event loop
+    knowledge = await asyncio.to_thread(get_knowledge)
     if knowledge is None:
         logger.warning(
             "Skipping markdown insertion: Knowledge disabled (no embeddings configured)."
         )
         return
+
+    ledger = _get_ledger(knowledge)
+    content_sha256 = None
+    if ledger is not None:
+        content_sha256 = await asyncio.to_thread(_file_sha256, path)
+    await _insert_md_file(knowledge, ledger, name, path, metadata, content_sha256)
+
+
+async def _insert_md_file(
+    knowledge: Knowledge,
+    ledger: Optional[IngestionLedger],
+    name: str,
+    path: Path,
+    metadata: Optional[dict],
+    content_sha256: Optional[str],
+) -> None:
+    if ledger is not None and await ledger.contains(content_sha256):
+        logger.info("Skipping markdown insertion for {}: already ingested", name)
+        return
+
     await knowledge.add_content_async(
         name=name,
         path=path,
         metadata=metadata,
         reader=md_reader,
     )
+    if ledger is not None and await _content_stored(knowledge, str(path)):
+        await ledger.record(content_sha256, name)
+
+
+async def insert_md_files_batch(
+    items: List[Tuple[str, Path, Optional[dict]]],
+    batch_size: int = 32,
+) -> None:
+    """Ingest several markdown files concurrently.
+
+    Each file is added through agno as its own content, keeping its content
+    record, id and hash, and a failing file does not affect the others.
+    Files with identical content are ingested once, and at most
+    `batch_size` files are read, embedded and written at a time.
+    """
+    # First use builds the search indexes; keep that off the event loop
+    knowledge = await asyncio.to_thread(get_knowledge)
+    if knowledge is None:
+        logger.warning(
+            "Skipping markdown insertion: Knowledge disabled (no embeddings configured)."
+        )
+        return
+
+    ledger = _get_ledger(knowledge)
+    hashes = await asyncio.gather(
+        *(asyncio.to_thread(_file_sha256, path) for _, path, _ in items)
+    )
+    unique: Dict[str, Tuple[str, Path, Optional[dict]]] = {}
+    for item, content_sha256 in zip(items, hashes):
+        unique.setdefault(content_sha256, item)
+
+    semaphore = asyncio.Semaphore(batch_size)
+
+    async def _insert_limited(content_sha256, name, path, metadata):
+        async with semaphore:
+            await _insert_md_file(
+                knowledge, ledger, name, path, metadata, content_sha256
+            )
+
+    results = await asyncio.gather(
+        *(
+            _insert_limited(content_sha256, name, path, metadata)
+            for content_sha256, (name, path, metadata) in unique.items()
+        ),
+        return_exceptions=True,
+    )
+    for (name, _, _), result in zip(unique.values(), results):
+        if isinstance(result, Exception):
+            logger.warning("Failed to ingest markdown {}: {}", name, result)
 
 
 async def insert_pdf_file_to_knowledge(url: str, metadata: Optional[dict] = None):
-    knowledge = get_knowledge()
+    # First use builds the search indexes; keep that off the event loop
+    knowledge = await asyncio.to_thread(get_knowledge)
     if knowledge is None:
         logger.warning(
             "Skipping PDF insertion: Knowledge disabled (no embeddings configured)."
         )
         return
-    await knowledge.add_content_async(
-        url=url,
-        metadata=metadata,
-        reader=pdf_reader,
-    )
+
+    ledger = _get_ledger(knowledge)
+    content_key = await _remote_content_key(url) if ledger is not None else None
+    if content_key is not None and await ledger.contains(content_key):
+        logger.info("Skipping PDF insertion for {}: already ingested", url)
+        return
+
+    local_path = await _download_pdf(url)
+    if local_path is not None:
+        await knowledge.add_content_async(
+            name=url.rsplit("/", 1)[-1] or url,
+            path=str(local_path),
+            metadata=metadata,
+            reader=pdf_reader,
+        )
+        source = str(local_path)
+    else:
+        # Let agno fetch the URL itself
+        await knowledge.add_content_async(
+            url=url,
+            metadata=metadata,
+            reader=pdf_reader,
+        )
+        source = url
+    if content_key is not None and await _content_stored(knowledge, source):
+        await ledger.record(content_key, url)
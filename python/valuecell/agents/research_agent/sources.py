@@ -6,9 +6,6 @@ from typing import Iterable, List, Optional, Sequence
 
 import aiofiles
 import aiohttp
-from agno.agent import Agent
-from edgar import Company
-from edgar.entity.filings import EntityFilings
 from loguru import logger
 
 from valuecell.agents.sources import (
@@ -19,9 +16,10 @@ from valuecell.agents.sources import (
     search_projects,
     search_vcs,
 )
+from valuecell.agents.utils.search import get_search_agent
 from valuecell.utils.path import get_knowledge_path
 
-from .knowledge import insert_md_file_to_knowledge, insert_pdf_file_to_knowledge
+from .knowledge import insert_md_files_batch, insert_pdf_file_to_knowledge
 from .schemas import (
     AShareFilingMetadata,
     AShareFilingResult,
@@ -118,10 +116,9 @@ async def _write_and_ingest(
         result = SECFilingResult(file_name, path, metadata)
         results.append(result)
 
-        await insert_md_file_to_knowledge(
-            name=file_name, path=path, metadata=metadata.__dict__
-        )
-
+    await insert_md_files_batch(
+        [(r.name, r.path, r.metadata.__dict__) for r in results]
+    )
     return results
 
 
@@ -153,6 +150,10 @@ async def fetch_periodic_sec_filings(
         List[SECFilingResult]
     """
     req_forms = set(_ensure_list(forms)) or {"10-Q"}
+    # Deferred: edgar is heavy and only needed when SEC filings are fetched
+    from edgar import Company
+    from edgar.entity.filings import EntityFilings
+
     company = Company(cik_or_ticker)
 
     # If year is omitted, use latest(limit). Quarter without year is not supported.
@@ -199,6 +200,9 @@ async def fetch_event_sec_filings(
         raise ValueError("start_date cannot be after end_date")
 
     req_forms = set(_ensure_list(forms)) or {"8-K"}
+    from edgar import Company
+    from edgar.entity.filings import EntityFilings
+
     company = Company(cik_or_ticker)
 
     # If no date range specified, leverage edgar's latest(count) for efficiency
@@ -248,8 +252,6 @@ async def web_search(query: str) -> str:
     Returns:
         A summary of the top search results.
     """
-    from valuecell.utils.model import create_model_with_provider
-
     # Check which provider to use based on environment configuration
     if os.getenv("WEB_SEARCH_PROVIDER", "google").lower() == "google" and os.getenv(
         "GOOGLE_API_KEY"
@@ -258,12 +260,10 @@ async def web_search(query: str) -> str:
 
     # Use Perplexity Sonar via OpenRouter for web search
     # Perplexity models are optimized for web search and real-time information
-    model = create_model_with_provider(
-        provider="openrouter",
-        model_id="perplexity/sonar",
-        max_tokens=None,
+    agent = get_search_agent(
+        "openrouter", "perplexity/sonar", use_fallback=False, max_tokens=None
     )
-    response = await Agent(model=model).arun(query)
+    response = await agent.arun(query)
     return response.content
 
 
@@ -278,16 +278,15 @@ async def _web_search_google(query: str) -> str:
     Returns:
         A summary of the top search results.
     """
-    from valuecell.utils.model import create_model_with_provider
-
     # Use Google Gemini with search enabled
     # The search=True parameter enables Google Search grounding for real-time information
-    model = create_model_with_provider(
-        provider="google",
-        model_id="gemini-2.5-flash",
+    agent = get_search_agent(
+        "google",
+        "gemini-2.5-flash",
+        use_fallback=False,  # Don't fall back when explicitly requesting a provider
         search=True,  # Enable Google Search grounding
     )
-    response = await Agent(model=model).arun(query)
+    response = await agent.arun(query)
     return response.content
 
 
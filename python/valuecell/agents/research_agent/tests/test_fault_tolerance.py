@@ -141,6 +141,12 @@ async def test_insert_functions_invoke_add_content_when_enabled(monkeypatch, tmp
     monkeypatch.setattr(knowledge_mod, "_knowledge_cache", None)
     monkeypatch.setattr(knowledge_mod, "get_knowledge", lambda: dummy)
 
+    # Simulate a failed download so the PDF falls back to URL ingestion
+    async def _no_download(url):
+        return None
+
+    monkeypatch.setattr(knowledge_mod, "_download_pdf", _no_download)
+
     from valuecell.agents.research_agent.knowledge import (
         insert_md_file_to_knowledge,
         insert_pdf_file_to_knowledge,
@@ -0,0 +1,323 @@
+import asyncio
+import hashlib
+import json
+import re
+import types
+
+import httpx
+import pytest
+
+
+class _FakeQuery:
+    def __init__(self, payloads):
+        self._payloads = payloads
+        self._suffix = None
+
+    def where(self, expr):
+        # Only the `payload LIKE '%<suffix>'` form used by knowledge.py
+        self._suffix = re.fullmatch(r"payload LIKE '%(.*)'", expr).group(1)
+        return self
+
+    def select(self, columns):
+        return self
+
+    def limit(self, n):
+        return self
+
+    def to_list(self):
+        return [{"id": p} for p in self._payloads if p.endswith(self._suffix)][:1]
+
+
+class _RecordingKnowledge:
+    def __init__(self, uri):
+        self.stored = set()
+        self.payloads = []
+        self.vector_db = types.SimpleNamespace(
+            uri=uri,
+            table=types.SimpleNamespace(search=lambda: _FakeQuery(self.payloads)),
+        )
+        self.calls = []
+        # Mimics agno, which logs failures and returns normally
+        self.fail = False
+
+    async def add_content_async(self, **kwargs):
+        self.calls.append(kwargs)
+        if not self.fail:
+            source = str(kwargs.get("path") or kwargs.get("url"))
+            self.stored.add(source)
+            # Row payload as agno's LanceDb writes it
+            content_hash = hashlib.sha256(source.encode()).hexdigest()
+            self.payloads.append(
+                json.dumps(
+                    {"content": f"body of {source}", "content_hash": content_hash}
+                )
+            )
+
+
+async def _no_download(url):
+    return None
+
+
+@pytest.mark.asyncio
+async def test_markdown_with_same_content_is_ingested_once(monkeypatch, tmp_path):
+    from valuecell.agents.research_agent import knowledge as knowledge_mod
+
+    dummy = _RecordingKnowledge(str(tmp_path / "lancedb"))
+    monkeypatch.setattr(knowledge_mod, "get_knowledge", lambda: dummy)
+
+    first = tmp_path / "a.md"
+    second = tmp_path / "b.md"
+    first.write_text("# Title\nBody")
+    second.write_text("# Title\nBody")
+
+    await knowledge_mod.insert_md_file_to_knowledge("a", first)
+    await knowledge_mod.insert_md_file_to_knowledge("b", second)
+    assert len(dummy.calls) == 1
+
+    second.write_text("# Title\nChanged body")
+    await knowledge_mod.insert_md_file_to_knowledge("b", second)
+    assert len(dummy.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_ingestion_is_not_recorded(monkeypatch, tmp_path):
+    from valuecell.agents.research_agent import knowledge as knowledge_mod
+
+    dummy = _RecordingKnowledge(str(tmp_path / "lancedb"))
+    dummy.fail = True
+    monkeypatch.setattr(knowledge_mod, "get_knowledge", lambda: dummy)
+
+    path = tmp_path / "a.md"
+    path.write_text("# Title\nBody")
+
+    await knowledge_mod.insert_md_file_to_knowledge("a", path)
+    dummy.fail = False
+    await knowledge_mod.insert_md_file_to_knowledge("a", path)
+    await knowledge_mod.insert_md_file_to_knowledge("a", path)
+
+    # The failed attempt is retried once, then the success is remembered
+    assert len(dummy.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_pdf_is_skipped_when_validators_unchanged(monkeypatch, tmp_path):
+    from valuecell.agents.research_agent import knowledge as knowledge_mod
+
+    dummy = _RecordingKnowledge(str(tmp_path / "lancedb"))
+    monkeypatch.setattr(knowledge_mod, "get_knowledge", lambda: dummy)
+
+    async def _fixed_key(url):
+        return f"key-for-{url}"
+
+    monkeypatch.setattr(knowledge_mod, "_remote_content_key", _fixed_key)
+    monkeypatch.setattr(knowledge_mod, "_download_pdf", _no_download)
+
+    url = "https://example.com/10k.pdf"
+    await knowledge_mod.insert_pdf_file_to_knowledge(url)
+    await knowledge_mod.insert_pdf_file_to_knowledge(url)
+    assert len(dummy.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_pdf_without_validators_is_always_ingested(monkeypatch, tmp_path):
+    from valuecell.agents.research_agent import knowledge as knowledge_mod
+
+    dummy = _RecordingKnowledge(str(tmp_path / "lancedb"))
+    monkeypatch.setattr(knowledge_mod, "get_knowledge", lambda: dummy)
+
+    async def _no_key(url):
+        return None
+
+    monkeypatch.setattr(knowledge_mod, "_remote_content_key", _no_key)
+    monkeypatch.setattr(knowledge_mod, "_download_pdf", _no_download)
+
+    url = "https://example.com/10k.pdf"
+    await knowledge_mod.insert_pdf_file_to_knowledge(url)
+    await knowledge_mod.insert_pdf_file_to_knowledge(url)
+    assert len(dummy.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_pdf_is_downloaded_once_and_ingested_from_disk(monkeypatch, tmp_path):
+    from valuecell.agents.research_agent import knowledge as knowledge_mod
+
+    requests = []
+
+    def _handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=b"%PDF-1.4 body")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    monkeypatch.setattr(knowledge_mod, "_http_client", client)
+    monkeypatch.setattr(knowledge_mod, "get_knowledge_path", lambda: str(tmp_path))
+
+    dummy = _RecordingKnowledge("s3://bucket/lancedb")
+    monkeypatch.setattr(knowledge_mod, "get_knowledge", lambda: dummy)
+
+    url = "https://example.com/filings/10k.pdf"
+    await knowledge_mod.insert_pdf_file_to_knowledge(url, metadata={"k": "v"})
+
+    assert len(requests) == 1
+    assert len(dummy.calls) == 1
+    call = dummy.calls[0]
+    assert "url" not in call
+    assert call["name"] == "10k.pdf"
+    assert call["metadata"] == {"k": "v"}
+    with open(call["path"], "rb") as f:
+        assert f.read() == b"%PDF-1.4 body"
+
+
+@pytest.mark.asyncio
+async def test_md_files_batch_adds_each_file_as_its_own_content(monkeypatch, tmp_path):
+    from valuecell.agents.research_agent import knowledge as knowledge_mod
+
+    dummy = _RecordingKnowledge(str(tmp_path / "lancedb"))
+    monkeypatch.setattr(knowledge_mod, "get_knowledge", lambda: dummy)
+
+    paths = []
+    for i, body in enumerate(["alpha", "beta", "alpha"]):
+        path = tmp_path / f"f{i}.md"
+        path.write_text(body)
+        paths.append(path)
+
+    items = [(p.stem, p, {"idx": i}) for i, p in enumerate(paths)]
+    await knowledge_mod.insert_md_files_batch(items)
+
+    # Duplicate content within the batch is added once
+    assert sorted((c["name"], c["metadata"]["idx"]) for c in dummy.calls) == [
+        ("f0", 0),
+        ("f1", 1),
+    ]
+
+    await knowledge_mod.insert_md_files_batch(items)
+    assert len(dummy.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_md_files_batch_isolates_failing_files(monkeypatch, tmp_path):
+    from valuecell.agents.research_agent import knowledge as knowledge_mod
+
+    class _FlakyKnowledge(_RecordingKnowledge):
+        async def add_content_async(self, **kwargs):
+            if kwargs["name"] == "bad":
+                raise RuntimeError("reader exploded")
+            await super().add_content_async(**kwargs)
+
+    dummy = _FlakyKnowledge(str(tmp_path / "lancedb"))
+    monkeypatch.setattr(knowledge_mod, "get_knowledge", lambda: dummy)
+
+    good = tmp_path / "good.md"
+    bad = tmp_path / "bad.md"
+    good.write_text("good body")
+    bad.write_text("bad body")
+
+    await knowledge_mod.insert_md_files_batch(
+        [("bad", bad, None), ("good", good, None)]
+    )
+
+    assert [c["name"] for c in dummy.calls] == ["good"]
+    assert str(good) in dummy.stored
+
+
+@pytest.mark.asyncio
+async def test_md_files_batch_limits_concurrent_insertions(monkeypatch, tmp_path):
+    from valuecell.agents.research_agent import knowledge as knowledge_mod
+
+    class _SlowKnowledge(_RecordingKnowledge):
+        running = 0
+        peak = 0
+
+        async def add_content_async(self, **kwargs):
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            await asyncio.sleep(0.01)
+            self.running -= 1
+            await super().add_content_async(**kwargs)
+
+    dummy = _SlowKnowledge(str(tmp_path / "lancedb"))
+    monkeypatch.setattr(knowledge_mod, "get_knowledge", lambda: dummy)
+
+    items = []
+    for i in range(10):
+        path = tmp_path / f"f{i}.md"
+        path.write_text(f"body {i}")
+        items.append((path.stem, path, None))
+
+    await knowledge_mod.insert_md_files_batch(items, batch_size=3)
+
+    assert len(dummy.calls) == 10
+    assert dummy.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_knowledge_is_created_off_the_event_loop(monkeypatch, tmp_path):
+    import threading
+
+    from valuecell.agents.research_agent import knowledge as knowledge_mod
+
+    dummy = _RecordingKnowledge(str(tmp_path / "lancedb"))
+    threads = []
+
+    def _get_knowledge():
+        threads.append(threading.current_thread())
+        return dummy
+
+    monkeypatch.setattr(knowledge_mod, "get_knowledge", _get_knowledge)
+    path = tmp_path / "a.md"
+    path.write_text("# Title\nBody")
+
+    await knowledge_mod.insert_md_file_to_knowledge("a", path)
+    await knowledge_mod.insert_md_files_batch([("a", path, None)])
+
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+
+def test_chunking_is_memoized_by_document_content():
+    from agno.knowledge.document.base import Document
+
+    from valuecell.agents.research_agent import knowledge as knowledge_mod
+
+    calls = []
+
+    class _CountingChunking:
+        def chunk(self, document):
+            calls.append(document.content)
+            return [Document(content=document.content, name=document.name)]
+
+    reader = knowledge_mod.CachingMarkdownReader(chunking_strategy=_CountingChunking())
+
+    first = reader.chunk_document(Document(content="body", name="a"))
+    first[0].meta_data["mutated"] = True
+    second = reader.chunk_document(Document(content="body", name="a"))
+    reader.chunk_document(Document(content="other", name="a"))
+
+    assert calls == ["body", "other"]
+    assert second[0].content == "body"
+    assert "mutated" not in second[0].meta_data
+
+
+def test_content_hash_lookup_matches_only_the_payload_field(tmp_path):
+    lancedb = pytest.importorskip("lancedb")
+
+    from valuecell.agents.research_agent import knowledge as knowledge_mod
+
+    stored_hash = hashlib.sha256(b"/docs/a.md").hexdigest()
+    other_hash = "0" * 64
+    # The other hash only appears inside the (JSON-escaped) document text
+    payload = json.dumps(
+        {
+            "content": f'quoted "content_hash": "{other_hash}"}}',
+            "content_hash": stored_hash,
+        }
+    )
+    table = lancedb.connect(str(tmp_path)).create_table(
+        "docs", [{"id": "1", "vector": [0.1, 0.2], "payload": payload}]
+    )
+    vector_db = types.SimpleNamespace(table=table)
+
+    assert knowledge_mod._content_hash_stored(vector_db, stored_hash)
+    assert not knowledge_mod._content_hash_stored(vector_db, other_hash)
+    assert not knowledge_mod._content_hash_stored(
+        types.SimpleNamespace(table=None), stored_hash
+    )
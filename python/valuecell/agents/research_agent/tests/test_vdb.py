@@ -0,0 +1,148 @@
+import dataclasses
+import threading
+import types
+
+from agno.vectordb.distance import Distance
+
+
+class _FakeTable:
+    def __init__(self, num_rows, indices=()):
+        self.num_rows = num_rows
+        self.indices = list(indices)
+        self.create_calls = []
+
+    def list_indices(self):
+        return self.indices
+
+    def count_rows(self):
+        return self.num_rows
+
+    def create_index(self, **kwargs):
+        self.create_calls.append(kwargs)
+
+
+def _fake_db(table):
+    return types.SimpleNamespace(
+        table=table,
+        _vector_col="vector",
+        distance=Distance.cosine,
+        dimensions=1536,
+    )
+
+
+def test_vector_index_skipped_for_small_tables():
+    from valuecell.agents.research_agent import vdb
+
+    table = _FakeTable(num_rows=vdb._MIN_ROWS_FOR_VECTOR_INDEX - 1)
+    vdb._ensure_vector_index(_fake_db(table))
+    assert table.create_calls == []
+
+
+def test_vector_index_created_once_when_missing():
+    from valuecell.agents.research_agent import vdb
+
+    table = _FakeTable(num_rows=vdb._MIN_ROWS_FOR_VECTOR_INDEX)
+    vdb._ensure_vector_index(_fake_db(table))
+    assert len(table.create_calls) == 1
+    call = table.create_calls[0]
+    assert call["index_type"] == "IVF_PQ"
+    assert call["vector_column_name"] == "vector"
+    assert call["metric"] == "cosine"
+    assert call["num_sub_vectors"] == 16
+    assert call["num_bits"] == 8
+
+    table.indices.append(types.SimpleNamespace(columns=["vector"]))
+    vdb._ensure_vector_index(_fake_db(table))
+    assert len(table.create_calls) == 1
+
+
+def test_vector_index_failure_is_swallowed():
+    from valuecell.agents.research_agent import vdb
+
+    class _BrokenTable(_FakeTable):
+        def create_index(self, **kwargs):
+            raise RuntimeError("not enough rows to train PQ")
+
+    table = _BrokenTable(num_rows=vdb._MIN_ROWS_FOR_VECTOR_INDEX)
+    vdb._ensure_vector_index(_fake_db(table))
+
+
+def test_pq_sub_vectors_divide_dimension():
+    from valuecell.agents.research_agent import vdb
+
+    assert vdb._pq_num_sub_vectors(1536) == 16
+    assert vdb._pq_num_sub_vectors(3072) == 16
+    assert vdb._pq_num_sub_vectors(1000) == 10
+    assert vdb._pq_num_sub_vectors(None) == 16
+
+
+def test_fts_index_prewarmed_once():
+    from valuecell.agents.research_agent import vdb
+
+    class _FtsTable(_FakeTable):
+        def __init__(self, num_rows):
+            super().__init__(num_rows)
+            self.fts_calls = []
+
+        def create_fts_index(self, column, **kwargs):
+            self.fts_calls.append(column)
+
+    db = _fake_db(_FtsTable(num_rows=3))
+    db.fts_index_exists = False
+    db.use_tantivy = False
+
+    vdb._ensure_fts_index(db)
+    vdb._ensure_fts_index(db)
+    assert db.table.fts_calls == ["payload"]
+    assert db.fts_index_exists is True
+
+    empty = _fake_db(_FtsTable(num_rows=0))
+    empty.fts_index_exists = False
+    empty.use_tantivy = False
+    vdb._ensure_fts_index(empty)
+    assert empty.table.fts_calls == []
+    assert empty.fts_index_exists is False
+
+
+def test_prewarm_builds_indexes_once_per_process(monkeypatch):
+    from valuecell.agents.research_agent import vdb
+
+    fts_calls = []
+    vector_calls = []
+    monkeypatch.setattr(vdb, "_prewarmed", False)
+    monkeypatch.setattr(vdb, "_ensure_fts_index", fts_calls.append)
+    monkeypatch.setattr(vdb, "_ensure_vector_index", vector_calls.append)
+
+    db = object()
+    vdb.prewarm_indexes(db)
+    vdb.prewarm_indexes(db)
+
+    # The full-text index is ready by the time prewarm returns
+    assert fts_calls == [db]
+    for thread in threading.enumerate():
+        if thread.name == "research-knowledge-prewarm":
+            thread.join(timeout=1)
+    assert vector_calls == [db]
+
+
+def test_get_vector_db_enables_batching_on_a_copy(monkeypatch):
+    from valuecell.agents.research_agent import vdb
+
+    @dataclasses.dataclass
+    class _Embedder:
+        enable_batch: bool = False
+
+    embedder = _Embedder()
+    monkeypatch.setattr(
+        vdb.model_utils_mod, "get_embedder_for_agent", lambda name: embedder
+    )
+
+    class DummyLanceDb:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    monkeypatch.setattr(vdb, "LanceDb", DummyLanceDb)
+
+    db = vdb.get_vector_db()
+    assert db.kwargs["embedder"].enable_batch is True
+    assert embedder.enable_batch is False
@@ -8,8 +8,15 @@ Fault-tolerant, lazy initialization:
 
 This prevents import-time failures and allows the ResearchAgent to run in a
 "tools-only" mode without knowledge search when embeddings are not configured.
+
+Once the table is large enough, an IVF_PQ ANN index is built on the vector
+column so searches no longer brute-force scan every embedding. Index builds
+happen once per process via `prewarm_indexes`, so they never land on the
+first query.
 """
 
+import dataclasses
+import threading
 from typing import Optional
 
 from agno.vectordb.lancedb import LanceDb
@@ -19,6 +26,116 @@ from loguru import logger
 import valuecell.utils.model as model_utils_mod
 from valuecell.utils.db import resolve_lancedb_uri
 
+# IVF_PQ training needs enough rows per partition; below this a flat scan is cheap
+_MIN_ROWS_FOR_VECTOR_INDEX = 10_000
+_INDEX_NUM_PARTITIONS = 256
+# 16 sub-vectors with 8-bit codes: 16 bytes per vector instead of 4 * dim
+_INDEX_NUM_SUB_VECTORS = 16
+_INDEX_NUM_BITS = 8
+# Partitions probed per query; trades a little latency for recall
+_INDEX_NPROBES = 20
+
+
+def _pq_num_sub_vectors(dimensions: Optional[int]) -> int:
+    """Largest sub-vector count up to the target that evenly divides the dimension."""
+    if not dimensions:
+        return _INDEX_NUM_SUB_VECTORS
+    for n in range(min(_INDEX_NUM_SUB_VECTORS, dimensions), 0, -1):
+        if dimensions % n == 0:
+            return n
+    return 1
+
+
+def _ensure_vector_index(db: LanceDb) -> None:
+    """Build the ANN index on the vector column if it is missing.
+
+    Best effort: skipped for small or missing tables and never raises.
+    """
+    table = getattr(db, "table", None)
+    if table is None:
+        return
+
+    try:
+        vector_col = getattr(db, "_vector_col", "vector")
+        for index in table.list_indices():
+            if vector_col in index.columns:
+                return
+
+        num_rows = table.count_rows()
+        if num_rows < _MIN_ROWS_FOR_VECTOR_INDEX:
+            return
+
+        logger.info(
+            "Building IVF_PQ index for research knowledge base ({} rows)", num_rows
+        )
+        table.create_index(
+            metric=db.distance.value,
+            vector_column_name=vector_col,
+            index_type="IVF_PQ",
+            num_partitions=_INDEX_NUM_PARTITIONS,
+            num_sub_vectors=_pq_num_sub_vectors(getattr(db, "dimensions", None)),
+            num_bits=_INDEX_NUM_BITS,
+            replace=False,
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to build vector index for research knowledge base: {}", e
+        )
+
+
+def _ensure_fts_index(db: LanceDb) -> None:
+    """Build the full-text index hybrid search needs before the first query.
+
+    agno otherwise (re)builds it lazily inside the first search call.
+    """
+    table = getattr(db, "table", None)
+    if table is None or getattr(db, "fts_index_exists", True):
+        return
+
+    try:
+        if table.count_rows() == 0:
+            return
+        table.create_fts_index("payload", use_tantivy=db.use_tantivy, replace=True)
+        db.fts_index_exists = True
+    except Exception as e:
+        logger.warning(
+            "Failed to build full-text index for research knowledge base: {}", e
+        )
+
+
+_prewarm_lock = threading.Lock()
+_prewarmed = False
+
+
+def prewarm_indexes(db: LanceDb) -> None:
+    """Build the search indexes for the knowledge base once per process.
+
+    The full-text index is built synchronously: agno's hybrid search builds it
+    lazily too, so it must exist before the first search rather than race a
+    second builder. Only this module builds the vector index, so that runs in
+    a background thread.
+    """
+    global _prewarmed
+    with _prewarm_lock:
+        if _prewarmed:
+            return
+        _prewarmed = True
+
+    _ensure_fts_index(db)
+    threading.Thread(
+        target=_ensure_vector_index,
+        args=(db,),
+        name="research-knowledge-prewarm",
+        daemon=True,
+    ).start()
+
+
+def _with_batch_embedding(embedder):
+    """Return a copy of `embedder` that embeds chunks in batched requests."""
+    if not dataclasses.is_dataclass(embedder) or not hasattr(embedder, "enable_batch"):
+        return embedder
+    return dataclasses.replace(embedder, enable_batch=True)
+
 
 def get_vector_db() -> Optional[LanceDb]:
     """Create and return the LanceDb instance, or None if embeddings are unavailable.
@@ -37,12 +154,14 @@ def get_vector_db() -> Optional[LanceDb]:
         return None
 
     try:
-        return LanceDb(
+        db = LanceDb(
             table_name="research_agent_knowledge_base",
             uri=resolve_lancedb_uri(),
-            embedder=embedder,
+            # Let LanceDb embed all chunks of an insert in batched requests
+            embedder=_with_batch_embedding(embedder),
             # reranker=reranker,  # Optional: can be configured later
             search_type=SearchType.hybrid,
+            nprobes=_INDEX_NPROBES,
             use_tantivy=False,
         )
     except Exception as e:
@@ -51,3 +170,5 @@ def get_vector_db() -> Optional[LanceDb]:
             e,
         )
         return None
+
+    return db
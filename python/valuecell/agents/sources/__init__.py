@@ -9,12 +9,17 @@ from valuecell.agents.sources.rootdata import (
     RootDataPerson,
     RootDataProject,
     RootDataVC,
+    clear_caches,
     get_person_detail,
+    get_person_details,
     get_project_detail,
+    get_project_details,
     get_vc_detail,
+    get_vc_details,
     search_people,
     search_projects,
     search_vcs,
+    search_vcs_and_people,
 )
 
 __all__ = [
@@ -22,9 +27,14 @@ __all__ = [
     "RootDataVC",
     "RootDataPerson",
     "get_project_detail",
+    "get_project_details",
     "get_vc_detail",
+    "get_vc_details",
     "get_person_detail",
+    "get_person_details",
     "search_projects",
     "search_vcs",
     "search_people",
+    "search_vcs_and_people",
+    "clear_caches",
 ]
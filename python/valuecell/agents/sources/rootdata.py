@@ -47,13 +47,84 @@ Requirements:
 - beautifulsoup4: `pip install beautifulsoup4`
 """
 
+import asyncio
+import base64
+import functools
+import importlib.util
+import json
+import os
 import re
-from typing import Any, Dict, List, Optional
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 import httpx
 from bs4 import BeautifulSoup
 from loguru import logger
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from valuecell.utils.env import get_system_cache_dir
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+
+    # libxml2-backed tree builder, several times faster than html.parser
+    _HTML_PARSER = "lxml"
+except ImportError:
+    etree = None
+    lxml_html = None
+    _HTML_PARSER = "html.parser"
+
+# Checked once without importing it; the driver is only loaded on first launch
+_HAS_PLAYWRIGHT = importlib.util.find_spec("playwright") is not None
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Class attribute of tag/label elements in the HTML fallback parsers
+_TAG_CLASS_SELECTOR = '[class*="tag" i], [class*="label" i]'
+_MAX_PAGE_TAGS = 10
+_MAX_DESCRIPTION_CANDIDATES = 5
+_LONG_DESCRIPTION_LEN = 400
+_TWITTER_URL_PREFIXES = tuple(
+    f"{scheme}://{host}/"
+    for scheme in ("https", "http")
+    for host in ("twitter.com", "x.com", "www.twitter.com", "www.x.com")
+)
+# Social profile hosts linked from VC and person pages
+_SOCIAL_HOST_RE = re.compile(r"(twitter\.com|x\.com|linkedin\.com)")
+# Base64-encoded id in RootData detail URLs (?k=...)
+_K_PARAM_RE = re.compile(r"[?&]k=([^&]+)")
+
+if etree is not None:
+    # Compiled once; evaluated in C over the libxml2 tree
+    _LOWER_CLASS = (
+        "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    )
+    # Text of the first h1/h2/h3 on the page
+    _HEADING_TEXT_XPATHS = {
+        tag: etree.XPath(f"string((//{tag})[1])") for tag in ("h1", "h2", "h3")
+    }
+    _TAG_ELEMENTS_XPATH = etree.XPath(
+        f"//*[contains({_LOWER_CLASS}, 'tag') or contains({_LOWER_CLASS}, 'label')]"
+    )
+    _LINK_HREFS_XPATH = etree.XPath("//a/@href")
 
 # ============================================================================
 # Data Models
@@ -199,24 +270,109 @@ class RootDataPerson(BaseModel):
 # ============================================================================
 
 
+_DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Shared client so page fetches reuse pooled keep-alive connections.
+
+    Created lazily to avoid binding to an event loop at import time.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        try:
+            import h2  # noqa: F401
+
+            http2 = True
+        except ImportError:
+            http2 = False
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            headers=_DEFAULT_HEADERS,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=http2,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared page-fetch client, e.g. on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 async def fetch_page_html(url: str) -> str:
     """Fetch HTML content from a URL"""
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    }
+    try:
+        response = await _get_http_client().get(url)
+        if response.status_code == 200:
+            return response.text
+        else:
+            logger.warning(f"Failed to fetch {url}: status {response.status_code}")
+            return ""
+    except Exception as e:
+        logger.warning(f"Error fetching {url}: {e}")
+        return ""
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(url, headers=headers)
-            if response.status_code == 200:
-                return response.text
-            else:
+
+async def fetch_page_bytes(url: str) -> bytes:
+    """Fetch the raw, undecoded body of a URL, or b"" on failure."""
+    try:
+        response = await _get_http_client().get(url)
+        if response.status_code == 200:
+            return response.content
+        else:
+            logger.warning(f"Failed to fetch {url}: status {response.status_code}")
+            return b""
+    except Exception as e:
+        logger.warning(f"Error fetching {url}: {e}")
+        return b""
+
+
+async def fetch_page_document(url: str):
+    """Fetch a URL and parse it with lxml while the body streams in.
+
+    Chunks are fed to an incremental parser as they arrive, so neither the
+    full body nor its decoded text is buffered. Requires lxml.
+
+    Returns:
+        The lxml.html document root, or None if the fetch or parse failed
+    """
+    try:
+        async with _get_http_client().stream("GET", url) as response:
+            if response.status_code != 200:
                 logger.warning(f"Failed to fetch {url}: status {response.status_code}")
-                return ""
-        except Exception as e:
-            logger.warning(f"Error fetching {url}: {e}")
-            return ""
+                return None
+            parser = lxml_html.HTMLParser(encoding=response.charset_encoding)
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+        return parser.close()
+    except Exception as e:
+        logger.warning(f"Error fetching {url}: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _encode_id(entity_id: int) -> str:
+    """Encode an id as the base64 'k' parameter of RootData detail URLs."""
+    return base64.b64encode(str(entity_id).encode()).decode()
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_k(k: str) -> Optional[int]:
+    """Decode a (possibly URL-encoded) 'k' parameter back to its id."""
+    try:
+        return int(base64.b64decode(k.replace("%3D", "=")).decode("utf-8"))
+    except Exception as e:
+        logger.warning(f"Failed to decode project ID: {e}")
+        return None
 
 
 def extract_project_id_from_url(url: str) -> Optional[int]:
@@ -225,19 +381,134 @@ def extract_project_id_from_url(url: str) -> Optional[int]:
     Example: https://www.rootdata.com/Projects/detail/Ethereum?k=MTI%3D
     The 'k' parameter is base64-encoded ID
     """
-    import base64
-
-    match = re.search(r"[?&]k=([^&]+)", url)
+    match = _K_PARAM_RE.search(url)
     if match:
-        try:
-            encoded_id = match.group(1).replace("%3D", "=")
-            decoded = base64.b64decode(encoded_id).decode("utf-8")
-            return int(decoded)
-        except Exception as e:
-            logger.warning(f"Failed to decode project ID: {e}")
+        return _decode_k(match.group(1))
     return None
 
 
+class _PageParts(NamedTuple):
+    """Raw pieces of a RootData detail page read by the HTML parsers.
+
+    The iterables are lazy where the backend allows it, so parsers that stop
+    early never extract the text of the remaining elements.
+    """
+
+    # Text of the first h1/h2/h3, "" when absent
+    headings: Dict[str, str]
+    paragraphs: Iterable[str]
+    tag_texts: Iterable[str]
+    hrefs: Iterable[str]
+
+
+def _page_parts_lxml(doc) -> _PageParts:
+    return _PageParts(
+        headings={tag: xpath(doc) for tag, xpath in _HEADING_TEXT_XPATHS.items()},
+        paragraphs=(p.text_content() for p in doc.iter("p")),
+        tag_texts=(el.text_content() for el in _TAG_ELEMENTS_XPATH(doc)),
+        hrefs=_LINK_HREFS_XPATH(doc),
+    )
+
+
+def _page_parts_bs4(html: str) -> _PageParts:
+    soup = BeautifulSoup(html, _HTML_PARSER)
+    headings = {}
+    for tag in ("h1", "h2", "h3"):
+        heading = soup.find(tag)
+        headings[tag] = heading.text if heading else ""
+    return _PageParts(
+        headings=headings,
+        paragraphs=(p.text for p in soup.find_all("p")),
+        tag_texts=(el.text for el in soup.select(_TAG_CLASS_SELECTOR)),
+        hrefs=(link["href"] for link in soup.find_all("a", href=True)),
+    )
+
+
+async def _fetch_page_parts(url: str) -> Optional[_PageParts]:
+    """Fetch and parse a detail page, with lxml when available."""
+    if lxml_html is not None:
+        doc = await fetch_page_document(url)
+        return _page_parts_lxml(doc) if doc is not None else None
+    html = await fetch_page_html(url)
+    return _page_parts_bs4(html) if html else None
+
+
+def _intro_and_description(paragraphs: Iterable[str]) -> Tuple[str, str]:
+    """Return the first content paragraph and the longest one after it.
+
+    Stops at the first description long enough to be the page's main text.
+    """
+    brief_intro = ""
+    description = ""
+    description_len = 0
+    for p in paragraphs:
+        text = p.strip()
+        n = len(text)
+        if n <= 20:
+            continue
+        if not brief_intro:
+            brief_intro = text
+        elif n > description_len:
+            description = text
+            description_len = n
+            if description_len > _LONG_DESCRIPTION_LEN:
+                break
+    return brief_intro, description
+
+
+def _page_tags(tag_texts: Iterable[str]) -> List[str]:
+    """Return up to ``_MAX_PAGE_TAGS`` unique tags in page order."""
+    tags: Dict[str, None] = {}
+    for tag_text in tag_texts:
+        tag_text = tag_text.strip()
+        if tag_text and len(tag_text) < 30:  # Reasonable tag length
+            tags[tag_text] = None
+            if len(tags) == _MAX_PAGE_TAGS:
+                break
+    return list(tags)
+
+
+def _project_page_fields(parts: _PageParts) -> Dict[str, Any]:
+    """Pick RootDataProject fields from the raw pieces of a project page."""
+    # The intro and description sit among the first content paragraphs, so
+    # stop reading the page once enough candidates are found
+    candidates: List[str] = []
+    for p in parts.paragraphs:
+        text = p.strip()
+        if len(text) > 20:  # Likely description text
+            candidates.append(text)
+            if len(candidates) == _MAX_DESCRIPTION_CANDIDATES:
+                break
+    brief_intro = candidates[0] if candidates else ""
+    description = max(candidates[1:], key=len, default="")
+
+    # Extract tags (deduplicated in page order)
+    tags = _page_tags(parts.tag_texts)
+
+    # Extract links
+    website = None
+    twitter = None
+    for href in parts.hrefs:
+        if href.startswith(_TWITTER_URL_PREFIXES):
+            if not twitter:
+                twitter = href.rstrip("/").split("/")[-1]
+        elif href.startswith("http") and "rootdata.com" not in href:
+            if not website:
+                website = href
+        if twitter and website:
+            break
+
+    return {
+        "name": parts.headings["h1"].strip(),
+        "brief_intro": brief_intro,
+        "description": description,
+        "tags": tags,
+        "token_symbol": parts.headings["h3"].strip(),
+        "twitter": twitter,
+        "website": website,
+    }
+
+
 async def get_project_from_page(
     project_id_or_url: str | int,
 ) -> Optional[RootDataProject]:
@@ -259,9 +530,7 @@ async def get_project_from_page(
     """
     # Construct URL
     if isinstance(project_id_or_url, int):
-        import base64
-
-        encoded_id = base64.b64encode(str(project_id_or_url).encode()).decode()
+        encoded_id = _encode_id(project_id_or_url)
         url = f"https://www.rootdata.com/Projects/detail/Project?k={encoded_id}"
     else:
         url = project_id_or_url
@@ -269,70 +538,17 @@ async def get_project_from_page(
 
     logger.info(f"Fetching project page: {url}")
 
-    html = await fetch_page_html(url)
-    if not html:
+    parts = await _fetch_page_parts(url)
+    if parts is None:
         return None
 
-    soup = BeautifulSoup(html, "html.parser")
-
     try:
         # Extract project data from page
         # Note: This is a basic implementation. Actual selectors may need adjustment
         # based on RootData's HTML structure
+        project = RootDataProject(id=project_id_or_url, **_project_page_fields(parts))
 
-        name = ""
-        h1 = soup.find("h1")
-        if h1:
-            name = h1.text.strip()
-
-        token_symbol = ""
-        h3 = soup.find("h3")
-        if h3:
-            token_symbol = h3.text.strip()
-
-        brief_intro = ""
-        description = ""
-        paras = soup.find_all("p")
-        for p in paras:
-            text = p.text.strip()
-            if len(text) > 20:  # Likely description text
-                if not brief_intro:
-                    brief_intro = text
-                elif len(text) > len(description):
-                    description = text
-
-        # Extract tags
-        tags = []
-        tag_elements = soup.find_all(class_=re.compile(r"tag|label", re.I))
-        for tag_el in tag_elements:
-            tag_text = tag_el.text.strip()
-            if tag_text and len(tag_text) < 30:  # Reasonable tag length
-                tags.append(tag_text)
-
-        # Extract links
-        website = None
-        twitter = None
-        links = soup.find_all("a", href=True)
-        for link in links:
-            href = link["href"]
-            if "twitter.com" in href or "x.com" in href:
-                twitter = href.split("/")[-1]
-            elif href.startswith("http") and "rootdata.com" not in href:
-                if not website:
-                    website = href
-
-        project = RootDataProject(
-            id=project_id_or_url,
-            name=name,
-            brief_intro=brief_intro,
-            description=description,
-            tags=list(set(tags))[:10],  # Deduplicate and limit
-            token_symbol=token_symbol,
-            twitter=twitter,
-            website=website,
-        )
-
-        logger.info(f"Successfully extracted project: {name}")
+        logger.info(f"Successfully extracted project: {project.name}")
         return project
 
     except Exception as e:
@@ -345,6 +561,223 @@ async def get_project_from_page(
 # ============================================================================
 
 
+# ============================================================================
+# Playwright Browser Pool
+# ============================================================================
+
+
+# Profile directory of the pooled Chromium under the user cache directory; its
+# disk HTTP cache lets later searches reuse rootdata.com's JS bundles instead
+# of downloading them again
+_CHROMIUM_PROFILE_DIRNAME = "rootdata_pw"
+# /dev/shm is often tiny in containers; let Chromium use /tmp
+_CHROMIUM_ARGS = ["--disable-dev-shm-usage"]
+
+
+def _prepare_user_data_dir(user_data_dir: Optional[str]) -> str:
+    """Create the Chromium profile directory, readable by this user only.
+
+    Defaults to a directory under the user cache dir. A profile owned by
+    another user is refused, since it could be read or poisoned.
+    """
+    path = (
+        Path(user_data_dir)
+        if user_data_dir
+        else get_system_cache_dir() / _CHROMIUM_PROFILE_DIRNAME
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.mkdir(mode=0o700, exist_ok=True)
+    if os.name == "posix":
+        st = path.stat()
+        if st.st_uid != os.getuid():
+            raise PermissionError(f"Chromium profile {path} is owned by another user")
+        if st.st_mode & 0o077:
+            path.chmod(0o700)
+    return str(path)
+
+
+class _PlaywrightPool:
+    """Long-lived headless Chromium shared by the Playwright scrapers.
+
+    Launching Chromium costs up to a few seconds, so a single persistent
+    BrowserContext is started once and scrapes borrow pooled pages from it;
+    at most `max_pages` pages are borrowed at a time. The context keeps its
+    profile, and so its HTTP cache, on disk.
+    """
+
+    def __init__(
+        self,
+        max_pages: int = 4,
+        user_data_dir: Optional[str] = None,
+    ):
+        self._max_pages = max_pages
+        self._user_data_dir = user_data_dir
+        self._playwright = None
+        # Only set when the persistent profile could not be used
+        self._browser = None
+        self._context = None
+        # Idle pooled pages, keyed by the resource types their route blocks
+        self._idle_pages: Dict[frozenset, List[Any]] = {}
+        self._loop = None
+        # Lazy to avoid binding to an event loop in __init__
+        self._lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _bind_to_running_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        # Playwright objects are tied to the loop that created them and can
+        # only be shut down from it
+        if self._playwright is not None:
+            if not self._loop.is_closed():
+                raise RuntimeError(
+                    "Playwright pool is open on another event loop; await "
+                    "close_playwright_pool() on that loop before using it here"
+                )
+            logger.error(
+                "Event loop of the Playwright pool closed without "
+                "close_playwright_pool(); its browser process may be left running"
+            )
+        self._loop = loop
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._idle_pages = {}
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(self._max_pages)
+
+    async def _launch_context(self):
+        chromium = self._playwright.chromium
+        try:
+            user_data_dir = _prepare_user_data_dir(self._user_data_dir)
+            return await chromium.launch_persistent_context(
+                user_data_dir, headless=True, args=_CHROMIUM_ARGS
+            )
+        except Exception as e:
+            # Another process may hold the profile lock, or the profile
+            # directory is not safe to use; run without disk cache
+            logger.warning(
+                "Persistent Chromium profile unavailable ({}), using a fresh one",
+                e,
+            )
+            self._browser = await chromium.launch(headless=True, args=_CHROMIUM_ARGS)
+            return await self._browser.new_context()
+
+    def _forget_context(self, context) -> None:
+        # Pages of a closed or crashed context died with it
+        if self._context is context:
+            self._context = None
+            self._idle_pages = {}
+
+    async def _get_shared_context(self):
+        async with self._lock:
+            if self._context is None:
+                from playwright.async_api import async_playwright
+
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                if self._browser is not None:
+                    await self._browser.close()
+                    self._browser = None
+                self._context = await self._launch_context()
+                self._context.on("close", self._forget_context)
+            return self._context
+
+    @asynccontextmanager
+    async def page(self, blocked_resource_types: frozenset = frozenset()):
+        """Yield a pooled page from the shared BrowserContext.
+
+        Requests of `blocked_resource_types` are aborted; the route is set up
+        once when the page is created. On a clean exit the page is reset to
+        about:blank and kept for the next caller, otherwise it is closed.
+        """
+        self._bind_to_running_loop()
+        async with self._semaphore:
+            context = await self._get_shared_context()
+            idle = self._idle_pages.setdefault(blocked_resource_types, [])
+            page = None
+            while idle and page is None:
+                candidate = idle.pop()
+                if not candidate.is_closed():
+                    page = candidate
+            if page is None:
+                page = await context.new_page()
+                if blocked_resource_types:
+                    await _block_resources(page, blocked_resource_types)
+
+            try:
+                yield page
+            except BaseException:
+                await page.close()
+                raise
+
+            try:
+                await page.goto("about:blank")
+            except Exception:
+                await page.close()
+            else:
+                # Skip if the context was relaunched while the page was out
+                if self._idle_pages.get(blocked_resource_types) is idle:
+                    idle.append(page)
+
+    async def close(self) -> None:
+        """Shut down the shared browser and Playwright driver."""
+        context, browser, playwright = self._context, self._browser, self._playwright
+        self._context = None
+        self._browser = None
+        self._playwright = None
+        self._idle_pages = {}
+        if context is not None:
+            await context.close()
+        if browser is not None:
+            await browser.close()
+        if playwright is not None:
+            await playwright.stop()
+
+
+_playwright_pool = _PlaywrightPool()
+
+# Resource types that carry no data for the scrapers. Stylesheets are only
+# dropped when nothing on the page is clicked, since layout drives visibility.
+_MEDIA_RESOURCE_TYPES = frozenset({"image", "imageset", "media", "font"})
+_STATIC_RESOURCE_TYPES = _MEDIA_RESOURCE_TYPES | {"stylesheet"}
+# Third-party analytics, ads and error reporting, dropped with any of the above
+_TRACKER_URL_RE = re.compile(
+    r"google-analytics\.com|googletagmanager\.com|doubleclick\.net"
+    r"|hotjar\.com|segment\.(?:io|com)|sentry\.io"
+)
+
+
+async def _block_resources(page, resource_types: frozenset) -> None:
+    """Abort requests for the given resource types and trackers on a page."""
+
+    async def _route(route):
+        request = route.request
+        if request.resource_type in resource_types or _TRACKER_URL_RE.search(
+            request.url
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await page.route("**/*", _route)
+
+
+# True once the server-rendered window.__NUXT__ payload is available
+_NUXT_DATA_READY_JS = (
+    "() => !!(window.__NUXT__ && window.__NUXT__.data"
+    " && window.__NUXT__.data.length > 0)"
+)
+# True once the Nuxt app has mounted, i.e. page widgets respond to clicks
+_NUXT_APP_MOUNTED_JS = "() => !!window.$nuxt"
+
+
+async def close_playwright_pool() -> None:
+    """Close the shared Playwright browser, e.g. on application shutdown."""
+    await _playwright_pool.close()
+
+
 async def get_project_with_playwright(project_id: int) -> Optional[RootDataProject]:
     """
     Get detailed project information using Playwright to access server-side rendered data
@@ -361,26 +794,20 @@ async def get_project_with_playwright(project_id: int) -> Optional[RootDataProje
     Example:
         project = await get_project_with_playwright(1179)  # Ripae project
     """
-    try:
-        from playwright.async_api import async_playwright
-    except ImportError:
+    if not _HAS_PLAYWRIGHT:
         logger.warning("Playwright not installed. Install with: pip install playwright")
         return None
 
-    import base64
-
-    encoded_id = base64.b64encode(str(project_id).encode()).decode()
+    encoded_id = _encode_id(project_id)
     url = f"https://www.rootdata.com/Projects/detail/Project?k={encoded_id}"
 
     logger.info(f"Fetching project {project_id} with Playwright: {url}")
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-
+    async with _playwright_pool.page(_STATIC_RESOURCE_TYPES) as page:
         try:
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-            await page.wait_for_timeout(1000)
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            # Wait for the SSR payload itself rather than for network idle
+            await page.wait_for_function(_NUXT_DATA_READY_JS, timeout=10000)
 
             # Extract data from window.__NUXT__
             project_data = await page.evaluate("""() => {
@@ -401,8 +828,6 @@ async def get_project_with_playwright(project_id: int) -> Optional[RootDataProje
                 return null;
             }""")
 
-            await browser.close()
-
             if not project_data:
                 logger.warning(f"No project data found for ID: {project_id}")
                 return None
@@ -414,10 +839,65 @@ async def get_project_with_playwright(project_id: int) -> Optional[RootDataProje
 
         except Exception as e:
             logger.warning(f"Playwright scraping failed: {e}")
-            await browser.close()
             return None
 
 
+def _get_text(field) -> str:
+    """Extract multilingual text, preferring English."""
+    if isinstance(field, dict):
+        return field.get("en_value") or field.get("cn_value") or ""
+    return str(field) if field else ""
+
+
+def _parse_float(value) -> Optional[float]:
+    """Parse a float, returning None for empty or invalid values."""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# (RootDataProject attribute, NUXT key) pairs parsed as floats
+_NUXT_FLOAT_FIELDS = (
+    # Token info
+    ("token_price", "price"),
+    ("market_cap", "marketCap"),
+    ("fdv", "fullyDilutedMarketCap"),
+    ("volume_24h", "volume24"),
+    ("volume_change_24h", "volumeChange24"),
+    # Supply
+    ("circulating_supply", "circulatingSupply"),
+    ("total_supply", "totalSupply"),
+    ("max_supply", "maxSupply"),
+    # Price changes
+    ("price_change_1h", "percentChange1h"),
+    ("price_change_24h", "percentChange24"),
+    ("price_change_7d", "percentChange7d"),
+    ("price_change_30d", "percentChange30d"),
+    ("price_change_60d", "percentChange60d"),
+    # Historical prices
+    ("ath", "ath"),
+    ("atl", "atl"),
+)
+# (RootDataProject attribute, NUXT key) pairs copied as-is
+_NUXT_PASSTHROUGH_FIELDS = (
+    ("ath_date", "athDate"),
+    ("atl_date", "atlDate"),
+    # Social links
+    ("website", "website"),
+    ("twitter", "twitterUrl"),
+    ("discord", "discordUrl"),
+    ("telegram", "telegramUrl"),
+    ("github", "githubUrl"),
+    # External links
+    ("coingecko_url", "coingeckoUrl"),
+    ("coinmarketcap_url", "coinmarketcapUrl"),
+    ("defillama_url", "defillamaUrl"),
+)
+
+
 def _parse_project_from_nuxt_data(data: Dict[str, Any]) -> RootDataProject:
     """
     Parse project data from window.__NUXT__ format to RootDataProject
@@ -429,23 +909,8 @@ def _parse_project_from_nuxt_data(data: Dict[str, Any]) -> RootDataProject:
         RootDataProject instance
     """
 
-    # Helper to extract multilingual text
-    def get_text(field):
-        if isinstance(field, dict):
-            return field.get("en_value") or field.get("cn_value") or ""
-        return str(field) if field else ""
-
-    # Helper to parse float safely
-    def parse_float(value):
-        if value is None or value == "":
-            return None
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
-
     # Extract name
-    name = get_text(data.get("name", ""))
+    name = _get_text(data.get("name", ""))
 
     # Extract tags
     tags = []
@@ -453,7 +918,7 @@ def _parse_project_from_nuxt_data(data: Dict[str, Any]) -> RootDataProject:
     if isinstance(tag_list, list):
         for tag in tag_list:
             if isinstance(tag, dict) and "name" in tag:
-                tag_name = get_text(tag["name"])
+                tag_name = _get_text(tag["name"])
                 if tag_name:
                     tags.append(tag_name)
 
@@ -488,8 +953,8 @@ def _parse_project_from_nuxt_data(data: Dict[str, Any]) -> RootDataProject:
         status = "Inactive"
 
     # Calculate sentiment percentages
-    hold_num = parse_float(data.get("holdNum"))
-    fud_num = parse_float(data.get("fudNum"))
+    hold_num = _parse_float(data.get("holdNum"))
+    fud_num = _parse_float(data.get("fudNum"))
     hold_percentage = None
     fud_percentage = None
     if hold_num is not None and fud_num is not None:
@@ -498,11 +963,17 @@ def _parse_project_from_nuxt_data(data: Dict[str, Any]) -> RootDataProject:
             hold_percentage = (hold_num / total) * 100
             fud_percentage = (fud_num / total) * 100
 
+    fields: Dict[str, Any] = {
+        attr: _parse_float(data.get(key)) for attr, key in _NUXT_FLOAT_FIELDS
+    }
+    for attr, key in _NUXT_PASSTHROUGH_FIELDS:
+        fields[attr] = data.get(key)
+
     return RootDataProject(
         id=data.get("id", 0),
         name=name,
-        brief_intro=get_text(data.get("briefIntd", "")),
-        description=get_text(data.get("intd", "")),
+        brief_intro=_get_text(data.get("briefIntd", "")),
+        description=_get_text(data.get("intd", "")),
         image_url=data.get("logoImg"),
         founded_year=int(data.get("establishDate"))
         if data.get("establishDate")
@@ -516,44 +987,16 @@ def _parse_project_from_nuxt_data(data: Dict[str, Any]) -> RootDataProject:
         ecosystems=ecosystems,
         # Token info
         token_symbol=data.get("lssuingCode") or data.get("symbol"),
-        token_price=parse_float(data.get("price")),
-        market_cap=parse_float(data.get("marketCap")),
-        fdv=parse_float(data.get("fullyDilutedMarketCap")),
-        volume_24h=parse_float(data.get("volume24")),
-        volume_change_24h=parse_float(data.get("volumeChange24")),
-        # Supply
-        circulating_supply=parse_float(data.get("circulatingSupply")),
-        total_supply=parse_float(data.get("totalSupply")),
-        max_supply=parse_float(data.get("maxSupply")),
-        # Price changes
-        price_change_1h=parse_float(data.get("percentChange1h")),
-        price_change_24h=parse_float(data.get("percentChange24")),
-        price_change_7d=parse_float(data.get("percentChange7d")),
-        price_change_30d=parse_float(data.get("percentChange30d")),
-        price_change_60d=parse_float(data.get("percentChange60d")),
-        # Historical prices
-        ath=parse_float(data.get("ath")),
-        ath_date=data.get("athDate"),
-        atl=parse_float(data.get("atl")),
-        atl_date=data.get("atlDate"),
         # Contracts
         contracts=contracts,
-        # Social links
-        website=data.get("website"),
-        twitter=data.get("twitterUrl"),
-        discord=data.get("discordUrl"),
-        telegram=data.get("telegramUrl"),
-        github=data.get("githubUrl"),
-        # External links
-        coingecko_url=data.get("coingeckoUrl"),
-        coinmarketcap_url=data.get("coinmarketcapUrl"),
-        defillama_url=data.get("defillamaUrl"),
         # Community sentiment
         hold_percentage=hold_percentage,
         fud_percentage=fud_percentage,
         # Special flags
         is_rootdata_list=bool(data.get("isRootdataList")),
         is_rootdata_list_2025=bool(data.get("isRootdataList2025")),
+        # Token, supply, price and link fields
+        **fields,
     )
 
 
@@ -562,6 +1005,127 @@ def _parse_project_from_nuxt_data(data: Dict[str, Any]) -> RootDataProject:
 # ============================================================================
 
 
+class _AsyncTTLCache:
+    """In-process TTL cache whose concurrent misses for a key share one fetch.
+
+    Empty results (None, []) are not cached, so failed scrapes are retried.
+    Cached values are shared between callers; copy before handing them out.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        # key -> (monotonic fetch time, value), oldest first
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+        # In-flight fetches keyed like the entries, shared by concurrent callers
+        self._inflight: Dict[Any, asyncio.Task] = {}
+
+    async def get_or_fetch(self, key: Any, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        cached = self._entries.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._ttl:
+            return cached[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the shared fetch
+        value = await asyncio.shield(task)
+        if value:
+            # Re-insert so a refreshed key moves to the newest end
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic(), value)
+            while len(self._entries) > self._max_entries:
+                self._entries.pop(next(iter(self._entries)))
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Searches: (normalized query, limit[, use_playwright]) -> results
+_project_search_cache = _AsyncTTLCache(ttl=300, max_entries=256)
+_vc_search_cache = _AsyncTTLCache(ttl=600, max_entries=256)
+_people_search_cache = _AsyncTTLCache(ttl=600, max_entries=256)
+# Details: (project_id, use_playwright) or entity id -> model
+_project_detail_cache = _AsyncTTLCache(ttl=300, max_entries=512)
+_vc_detail_cache = _AsyncTTLCache(ttl=3600, max_entries=512)
+_person_detail_cache = _AsyncTTLCache(ttl=3600, max_entries=512)
+
+
+def clear_caches() -> None:
+    """Drop all cached RootData search results and details."""
+    for cache in (
+        _project_search_cache,
+        _vc_search_cache,
+        _people_search_cache,
+        _project_detail_cache,
+        _vc_detail_cache,
+        _person_detail_cache,
+    ):
+        cache.clear()
+    _pages_without_static_nuxt.clear()
+
+
+# Reads each project link in the search dialog once; parsing happens in Python
+_SEARCH_RESULTS_JS = """() => Array.from(
+    document.querySelectorAll(
+        'dialog a[href*="/Projects/detail/"], [role="dialog"] a[href*="/Projects/detail/"]'
+    ),
+    (link) => ({
+        href: link.getAttribute('href') || '',
+        name: link.querySelector('h4')?.textContent?.trim() || '',
+        description: link.querySelector('p')?.textContent?.trim() || '',
+        text: link.textContent || '',
+    })
+)"""
+_SEARCH_SLUG_RE = re.compile(r"Projects/detail/([^?]+)")
+# Token symbol, usually right after the project name
+_SEARCH_SYMBOL_RE = re.compile(r"([A-Z]{2,10})(?=\s+\$|\s+[A-Z#])")
+_SEARCH_PRICE_RE = re.compile(r"\$([0-9.]+)")
+_SEARCH_TAG_RE = re.compile(r"([A-Z][a-zA-Z]+)(?=\s|$)")
+_MAX_SEARCH_TAGS = 5
+
+
+def _parse_search_result(result: Dict[str, str]) -> RootDataProject:
+    """Build a RootDataProject from one search dialog link."""
+    href = result["href"]
+    text = result["text"].strip()
+
+    name = result["name"]
+    if not name:
+        slug_match = _SEARCH_SLUG_RE.search(href)
+        name = slug_match.group(1).replace("%20", " ") if slug_match else ""
+
+    symbol_match = _SEARCH_SYMBOL_RE.search(text)
+    symbol = symbol_match.group(1) if symbol_match else None
+
+    price = None
+    price_match = _SEARCH_PRICE_RE.search(text)
+    if price_match:
+        price = _parse_float(price_match.group(1))
+
+    tags = []
+    for tag_match in _SEARCH_TAG_RE.finditer(text):
+        tag = tag_match.group(1)
+        if tag != symbol:
+            tags.append(tag)
+            if len(tags) == _MAX_SEARCH_TAGS:
+                break
+
+    description = result["description"]
+    return RootDataProject(
+        id=extract_project_id_from_url(href) or 0,
+        name=name,
+        brief_intro=description,
+        description=description,
+        tags=tags,
+        token_symbol=symbol,
+        token_price=price,
+    )
+
+
 async def search_projects_with_browser_interaction(
     query: str, limit: int = 10
 ) -> List[RootDataProject]:
@@ -578,9 +1142,7 @@ async def search_projects_with_browser_interaction(
     Returns:
         List of projects
     """
-    try:
-        from playwright.async_api import async_playwright
-    except ImportError:
+    if not _HAS_PLAYWRIGHT:
         logger.error(
             "Playwright not installed. Install with: "
             "pip install playwright && playwright install chromium"
@@ -589,27 +1151,25 @@ async def search_projects_with_browser_interaction(
 
     logger.info(f"Searching projects via browser interaction for: {query}")
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-
+    async with _playwright_pool.page(_MEDIA_RESOURCE_TYPES) as page:
         try:
-            # Navigate to homepage
+            # Navigate to homepage; only the app needs to be interactive, not
+            # every analytics and market data request settled
             await page.goto(
-                "https://www.rootdata.com", wait_until="networkidle", timeout=30000
+                "https://www.rootdata.com", wait_until="domcontentloaded", timeout=30000
             )
-
-            # Wait for page to load
-            await page.wait_for_timeout(500)
+            try:
+                await page.wait_for_function(_NUXT_APP_MOUNTED_JS, timeout=15000)
+            except Exception as e:
+                logger.debug(f"Nuxt app mount not detected, continuing: {e}")
 
             # Click on the search area to reveal the search input
             try:
-                # Try to click the search trigger element
+                # Try to click the search trigger element (waits for it to render)
                 await page.click(
                     'text="Search project, VC, person, X account, token, archive."',
-                    timeout=1000,
+                    timeout=5000,
                 )
-                await page.wait_for_timeout(500)
             except Exception as e:
                 logger.warning(
                     f"Could not click search trigger: {e}, trying alternative method"
@@ -617,15 +1177,18 @@ async def search_projects_with_browser_interaction(
                 # Try alternative selector
                 try:
                     await page.click('[class*="search"]', timeout=1000)
-                    await page.wait_for_timeout(500)
                 except Exception:
                     pass
 
             # Now find and use the search input that appeared
-            search_input = await page.query_selector('input[placeholder*="Search"]')
+            try:
+                search_input = await page.wait_for_selector(
+                    'input[placeholder*="Search"]', state="visible", timeout=3000
+                )
+            except Exception:
+                search_input = None
             if not search_input:
                 logger.error("Could not find search input after clicking search area")
-                await browser.close()
                 return []
 
             # Type the query
@@ -639,143 +1202,29 @@ async def search_projects_with_browser_interaction(
                     'dialog a[href*="/Projects/detail/"], [role="dialog"] a[href*="/Projects/detail/"]',
                     timeout=5000,
                 )
-                # Extra wait to ensure all results are rendered
-                await page.wait_for_timeout(500)
             except Exception as e:
                 logger.warning(f"Timeout waiting for search results: {e}")
                 await page.wait_for_timeout(500)  # Give it more time anyway
 
             # Extract search results from the search dropdown
-            projects_data = await page.evaluate("""() => {
-                // Find the search results dialog
-                const dialog = document.querySelector('dialog, [role="dialog"]');
-                if (!dialog) {
-                    return [];
-                }
-                
-                // Find the Projects section that contains project links
-                // The search results are organized by category (All, Projects, VC, People, etc.)
-                let projectsContainer = null;
-                
-                // Look for a div/section that contains both "Projects" text and project links
-                const allDivs = dialog.querySelectorAll('div, section');
-                for (const div of allDivs) {
-                    const text = div.textContent;
-                    if (text.includes('Projects') && div.querySelector('a[href*="/Projects/detail/"]')) {
-                        projectsContainer = div;
-                        break;
-                    }
-                }
-                
-                // If we couldn't find a specific projects container, use the whole dialog
-                if (!projectsContainer) {
-                    projectsContainer = dialog;
-                }
-                
-                // Find all project links in the Projects section
-                const projectLinks = projectsContainer.querySelectorAll('a[href*="/Projects/detail/"]');
-                const projects = [];
-                
-                for (const link of projectLinks) {
-                    // Extract project data from link
-                    const href = link.getAttribute('href');
-                    const idMatch = href.match(/Projects\\/detail\\/([^?]+)\\?k=([^&]+)/);
-                    const nameSlug = idMatch ? idMatch[1] : '';
-                    const idBase64 = idMatch ? idMatch[2] : '';
-                    
-                    // Try to extract ID from base64 (URL-encoded)
-                    let id = 0;
-                    try {
-                        // Decode URL encoding first, then base64
-                        const decodedBase64 = decodeURIComponent(idBase64);
-                        id = parseInt(atob(decodedBase64));
-                    } catch (e) {
-                        // If decode fails, continue without ID
-                    }
-                    
-                    // The link itself contains all the text, parse it
-                    const linkText = link.textContent.trim();
-                    
-                    // Extract name from h4 heading within the link
-                    const nameEl = link.querySelector('h4');
-                    const name = nameEl ? nameEl.textContent.trim() : nameSlug.replace(/%20/g, ' ');
-                    
-                    // Extract token symbol (usually right after the name)
-                    const symbolMatch = linkText.match(/([A-Z]{2,10})(?=\\s+\\$|\\s+[A-Z#])/);
-                    const symbol = symbolMatch ? symbolMatch[1] : null;
-                    
-                    // Extract price
-                    const priceMatch = linkText.match(/\\$([0-9.]+)/);
-                    const price = priceMatch ? parseFloat(priceMatch[1]) : null;
-                    
-                    // Extract tags (look for words after price)
-                    const tags = [];
-                    const tagMatches = linkText.matchAll(/([A-Z][a-zA-Z]+)(?=\\s|$)/g);
-                    for (const match of tagMatches) {
-                        const tag = match[1];
-                        if (tag !== symbol && tags.length < 5) {
-                            tags.push(tag);
-                        }
-                    }
-                    
-                    // Extract description (paragraph within the link)
-                    const descEl = link.querySelector('p');
-                    const description = descEl ? descEl.textContent.trim() : '';
-                    
-                    projects.push({
-                        id: id,
-                        name: name,
-                        nameSlug: nameSlug,
-                        token_symbol: symbol,
-                        price: price,
-                        tags: tags,
-                        description: description,
-                        href: href
-                    });
-                }
-                
-                return projects;
-            }""")
-
-            await browser.close()
-
-            if not projects_data:
+            results = await page.evaluate(_SEARCH_RESULTS_JS)
+            if not results:
                 logger.warning(f"No projects found for query: {query}")
                 return []
 
-            # Parse projects
+            # Parse projects (the dialog may list a project in several sections)
             projects = []
-            for proj_data in projects_data[:limit]:
+            seen_hrefs = set()
+            for result in results:
+                if len(projects) >= limit:
+                    break
+                href = result.get("href") or ""
+                if href in seen_hrefs:
+                    continue
+                seen_hrefs.add(href)
                 try:
-                    # Extract ID from href if not found
-                    proj_id = proj_data.get("id", 0)
-                    if proj_id == 0 and proj_data.get("href"):
-                        # Try to extract from URL
-                        import base64
-
-                        href = proj_data["href"]
-                        k_match = re.search(r"\\?k=([^&]+)", href)
-                        if k_match:
-                            try:
-                                proj_id = int(
-                                    base64.b64decode(k_match.group(1)).decode()
-                                )
-                            except Exception as e:
-                                logger.warning(f"Failed to decode project ID: {e}")
-
                     # Note: Search results have limited data, full details require get_project_detail()
-                    project = RootDataProject(
-                        id=proj_id,
-                        name=proj_data.get("name", ""),
-                        brief_intro=proj_data.get("description", ""),
-                        description=proj_data.get("description", ""),
-                        tags=proj_data.get("tags", []),
-                        token_symbol=proj_data.get("token_symbol"),
-                        token_price=proj_data.get("price"),
-                    )
-
-                    projects.append(project)
-
+                    projects.append(_parse_search_result(result))
                 except Exception as e:
                     logger.warning(f"Failed to parse project: {e}")
                     continue
@@ -785,7 +1234,6 @@ async def search_projects_with_browser_interaction(
 
         except Exception as e:
             logger.error(f"Browser interaction error: {e}")
-            await browser.close()
             return []
 
 
@@ -798,6 +1246,9 @@ async def search_projects(
     This method simulates a user searching on the RootData website, ensuring
     we get the same results that a real user would see.
 
+    Non-empty results are cached for a few minutes, and concurrent requests
+    for the same query share one browser search.
+
     Args:
         query: Search keyword
         limit: Maximum number of results
@@ -814,6 +1265,14 @@ async def search_projects(
         projects = await search_projects("DeFi", limit=5)
     """
 
+    projects = await _project_search_cache.get_or_fetch(
+        (query.strip().lower(), limit),
+        lambda: _search_projects_uncached(query, limit),
+    )
+    return [project.model_copy(deep=True) for project in projects]
+
+
+async def _search_projects_uncached(query: str, limit: int) -> List[RootDataProject]:
     # Use browser interaction search (only reliable method)
     try:
         projects = await search_projects_with_browser_interaction(query, limit)
@@ -836,6 +1295,9 @@ async def get_project_detail(
     window.__NUXT__. If that fails or Playwright is not available, it falls back
     to HTML parsing (with less detailed information).
 
+    Successful results are cached for a few minutes, and concurrent requests
+    for the same project share one scrape.
+
     Args:
         project_id: Project ID (e.g., 12 for Ethereum, 1179 for Ripae)
         use_playwright: If True, use Playwright for detailed data extraction
@@ -850,6 +1312,18 @@ async def get_project_detail(
         # Fallback to HTML parsing only
         project = await get_project_detail(1179, use_playwright=False)
     """
+    project = await _project_detail_cache.get_or_fetch(
+        (project_id, use_playwright),
+        lambda: _fetch_project_detail(project_id, use_playwright),
+    )
+    if project is None:
+        return None
+    return project.model_copy(deep=True)
+
+
+async def _fetch_project_detail(
+    project_id: int, use_playwright: bool
+) -> Optional[RootDataProject]:
     if use_playwright:
         try:
             project = await get_project_with_playwright(project_id)
@@ -869,6 +1343,36 @@ async def get_project_detail(
     return await get_project_from_page(project_id)
 
 
+async def get_project_details(
+    project_ids: List[int], concurrency: int = 10, use_playwright: bool = False
+) -> List[Optional[RootDataProject]]:
+    """
+    Get details for several projects concurrently
+
+    Args:
+        project_ids: Project IDs to fetch
+        concurrency: Maximum number of fetches in flight at once
+        use_playwright: Passed to get_project_detail. Defaults to False, since
+            the HTML path shares one pooled HTTP client and is far cheaper per page
+
+    Returns:
+        Project details in the same order as `project_ids` (None for failures)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(project_id: int) -> Optional[RootDataProject]:
+        async with semaphore:
+            try:
+                return await get_project_detail(
+                    project_id, use_playwright=use_playwright
+                )
+            except Exception as e:
+                logger.warning(f"Failed to fetch project {project_id}: {e}")
+                return None
+
+    return await asyncio.gather(*(_one(i) for i in project_ids))
+
+
 # Backward compatibility aliases
 get_project_detail_simple = get_project_detail
 search_projects_simple = search_projects
@@ -879,6 +1383,160 @@ search_projects_simple = search_projects
 # ============================================================================
 
 
+# Validate a whole page of search records in one call
+_VC_LIST_ADAPTER = TypeAdapter(List[RootDataVC])
+_PERSON_LIST_ADAPTER = TypeAdapter(List[RootDataPerson])
+
+
+def _validate_records(
+    records: List[Dict[str, Any]],
+    adapter: TypeAdapter,
+    model: type[BaseModel],
+    kind: str,
+) -> List[Any]:
+    """Validate search records as one list, skipping invalid ones on failure."""
+    try:
+        return adapter.validate_python(records)
+    except ValidationError:
+        pass
+
+    # Slow path: find and drop the invalid records
+    models = []
+    for fields in records:
+        try:
+            models.append(model.model_validate(fields))
+        except ValidationError as e:
+            logger.warning(f"Failed to parse {kind}: {e}")
+    return models
+
+
+# Keys under which search pages keep their result list in __NUXT__.data
+_VC_LIST_KEYS = ("list", "investors", "items", "data", "records")
+_PEOPLE_LIST_KEYS = ("list", "people", "persons", "items", "data", "records")
+# Plain JSON assignment of the SSR payload, when the page inlines it as such.
+# Matched against the raw body so the page is never decoded as a whole.
+_NUXT_JSON_RE = re.compile(
+    rb"window\.__NUXT__\s*=\s*(\{.*?\})\s*;?\s*</script>", re.DOTALL
+)
+# Search page paths seen without a JSON payload -> monotonic time of the miss.
+# They go straight to Playwright until the entry expires, so a page that
+# starts inlining JSON again is picked up without a restart.
+_pages_without_static_nuxt: Dict[str, float] = {}
+_STATIC_NUXT_MISS_TTL = 3600
+
+
+# Returns the first `limit` items of the first list under one of `keys` in
+# __NUXT__.data as a JSON string, decoded once in Python rather than value by
+# value by the Playwright bridge
+_NUXT_LIST_JSON_JS = """([keys, limit]) => {
+    const dataArray = (window.__NUXT__ && window.__NUXT__.data) || [];
+    for (const item of dataArray) {
+        if (item && typeof item === 'object') {
+            for (const key of keys) {
+                if (Array.isArray(item[key])) {
+                    return JSON.stringify(item[key].slice(0, limit));
+                }
+            }
+        }
+    }
+    return '[]';
+}"""
+
+
+async def _evaluate_nuxt_list(
+    page, keys: Tuple[str, ...], limit: int
+) -> List[Dict[str, Any]]:
+    """Read up to `limit` search results from __NUXT__ on a loaded page."""
+    raw = await page.evaluate(_NUXT_LIST_JSON_JS, [list(keys), limit])
+    return _json_loads(raw) if raw else []
+
+
+def _find_nuxt_list(nuxt: Any, keys: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """Return the first list under `keys` in __NUXT__.data, as the page JS does."""
+    data = nuxt.get("data") if isinstance(nuxt, dict) else None
+    if not isinstance(data, list):
+        return []
+    for item in data:
+        if isinstance(item, dict):
+            for key in keys:
+                if isinstance(item.get(key), list):
+                    return item[key]
+    return []
+
+
+async def _try_static_nuxt_search(
+    url: str, keys: Tuple[str, ...]
+) -> List[Dict[str, Any]]:
+    """Read search results from the server-rendered HTML, without a browser.
+
+    Only works when the page inlines __NUXT__ as plain JSON; returns [] when
+    it does not (e.g. Nuxt's minified function form), so callers fall back
+    to Playwright. Pages found without a JSON payload are not fetched again
+    for ``_STATIC_NUXT_MISS_TTL`` seconds.
+    """
+    page_path = url.split("?", 1)[0]
+    missed_at = _pages_without_static_nuxt.get(page_path)
+    if missed_at is not None:
+        if time.monotonic() - missed_at < _STATIC_NUXT_MISS_TTL:
+            return []
+        del _pages_without_static_nuxt[page_path]
+
+    body = await fetch_page_bytes(url)
+    if not body:
+        return []
+    match = _NUXT_JSON_RE.search(body)
+    try:
+        nuxt = _json_loads(match.group(1)) if match else None
+    except ValueError:
+        nuxt = None
+    if nuxt is None:
+        _pages_without_static_nuxt[page_path] = time.monotonic()
+        return []
+    return _find_nuxt_list(nuxt, keys)
+
+
+def _vc_fields_from_nuxt(vc_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an investor record of a search page to RootDataVC fields."""
+    tags = []
+    tags_str = vc_data.get("enTagNames")
+    if tags_str:
+        tags = [t.strip() for t in str(tags_str).split(",")]
+
+    return {
+        "id": vc_data.get("id", 0),
+        "name": _get_text(vc_data.get("name")),
+        "brief_intro": vc_data.get("enBriefIntd") or "",
+        "description": vc_data.get("enIntd") or "",
+        "tags": tags,
+        "twitter": vc_data.get("twitter"),
+        "website": vc_data.get("website"),
+        "image_url": vc_data.get("imgUrl"),
+        "portfolio_count": vc_data.get("portfolioCount"),
+        "total_investments": vc_data.get("totalInvestments"),
+    }
+
+
+def _parse_vc_search_results(
+    vcs_data: List[Dict[str, Any]], query: str, limit: int
+) -> List[RootDataVC]:
+    """Build RootDataVC results from the investor records of a search page."""
+    if not vcs_data:
+        logger.warning(f"No VCs found for query: {query}")
+        return []
+
+    # Parse VCs
+    records = []
+    for vc_data in vcs_data[:limit]:
+        try:
+            records.append(_vc_fields_from_nuxt(vc_data))
+        except Exception as e:
+            logger.warning(f"Failed to parse VC: {e}")
+    vcs = _validate_records(records, _VC_LIST_ADAPTER, RootDataVC, "VC")
+
+    logger.info(f"Found {len(vcs)} VCs for query: {query}")
+    return vcs
+
+
 async def search_vcs_with_playwright(query: str, limit: int = 10) -> List[RootDataVC]:
     """
     Search VCs using Playwright (browser automation)
@@ -890,9 +1548,7 @@ async def search_vcs_with_playwright(query: str, limit: int = 10) -> List[RootDa
     Returns:
         List of VCs
     """
-    try:
-        from playwright.async_api import async_playwright
-    except ImportError:
+    if not _HAS_PLAYWRIGHT:
         logger.error(
             "Playwright not installed. Install with: "
             "pip install playwright && playwright install chromium"
@@ -902,80 +1558,23 @@ async def search_vcs_with_playwright(query: str, limit: int = 10) -> List[RootDa
     url = f"https://www.rootdata.com/Investors?k={query}"
     logger.info(f"Searching VCs with Playwright: {url}")
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-
+    # Nothing is clicked, so stylesheets can be dropped along with media
+    async with _playwright_pool.page(_STATIC_RESOURCE_TYPES) as page:
         try:
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-            await page.wait_for_timeout(500)
+            await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+            # Wait for the SSR payload itself rather than for network idle
+            try:
+                await page.wait_for_function(_NUXT_DATA_READY_JS, timeout=5000)
+            except Exception as e:
+                logger.debug(f"NUXT data not found on {url}: {e}")
 
             # Extract data from __NUXT__
-            vcs_data = await page.evaluate("""() => {
-                if (!window.__NUXT__ || !window.__NUXT__.data) {
-                    return [];
-                }
-                
-                const dataArray = window.__NUXT__.data;
-                for (let i = 0; i < dataArray.length; i++) {
-                    const item = dataArray[i];
-                    if (item && typeof item === 'object') {
-                        const keys = ['list', 'investors', 'items', 'data', 'records'];
-                        for (const key of keys) {
-                            if (item[key] && Array.isArray(item[key])) {
-                                return item[key];
-                            }
-                        }
-                    }
-                }
-                return [];
-            }""")
+            vcs_data = await _evaluate_nuxt_list(page, _VC_LIST_KEYS, limit)
 
-            await browser.close()
-
-            if not vcs_data:
-                logger.warning(f"No VCs found for query: {query}")
-                return []
-
-            # Parse VCs
-            vcs = []
-            for vc_data in vcs_data[:limit]:
-                try:
-                    name = vc_data.get("name", {})
-                    if isinstance(name, dict):
-                        name = name.get("en_value") or name.get("cn_value") or ""
-
-                    tags = []
-                    if "enTagNames" in vc_data:
-                        tags_str = vc_data["enTagNames"]
-                        if tags_str:
-                            tags = [t.strip() for t in str(tags_str).split(",")]
-
-                    vc = RootDataVC(
-                        id=vc_data.get("id", 0),
-                        name=str(name),
-                        brief_intro=vc_data.get("enBriefIntd") or "",
-                        description=vc_data.get("enIntd") or "",
-                        tags=tags,
-                        twitter=vc_data.get("twitter"),
-                        website=vc_data.get("website"),
-                        image_url=vc_data.get("imgUrl"),
-                        portfolio_count=vc_data.get("portfolioCount"),
-                        total_investments=vc_data.get("totalInvestments"),
-                    )
-
-                    vcs.append(vc)
-
-                except Exception as e:
-                    logger.warning(f"Failed to parse VC: {e}")
-                    continue
-
-            logger.info(f"Found {len(vcs)} VCs for query: {query}")
-            return vcs
+            return _parse_vc_search_results(vcs_data, query, limit)
 
         except Exception as e:
             logger.error(f"Playwright error: {e}")
-            await browser.close()
             return []
 
 
@@ -985,6 +1584,9 @@ async def search_vcs(
     """
     Search venture capital firms and investors
 
+    Non-empty results are cached for ten minutes, and concurrent requests
+    for the same query share one search.
+
     Args:
         query: Search keyword
         limit: Maximum number of results
@@ -1000,6 +1602,22 @@ async def search_vcs(
         # Search for VCs focused on DeFi
         vcs = await search_vcs("DeFi", limit=10)
     """
+    vcs = await _vc_search_cache.get_or_fetch(
+        (query.strip().lower(), limit, use_playwright),
+        lambda: _search_vcs_uncached(query, limit, use_playwright),
+    )
+    return [vc.model_copy(deep=True) for vc in vcs]
+
+
+async def _search_vcs_uncached(
+    query: str, limit: int, use_playwright: bool
+) -> List[RootDataVC]:
+    # Plain HTTP first; the browser is only needed for client-rendered pages
+    vcs_data = await _try_static_nuxt_search(
+        f"https://www.rootdata.com/Investors?k={query}", _VC_LIST_KEYS
+    )
+    if vcs_data:
+        return _parse_vc_search_results(vcs_data, query, limit)
 
     if use_playwright:
         try:
@@ -1018,55 +1636,70 @@ async def get_vc_detail(vc_id: int) -> Optional[RootDataVC]:
     """
     Get VC details by ID
 
+    Successful results are cached for an hour, and concurrent requests for
+    the same VC share one fetch.
+
     Args:
         vc_id: VC ID
 
     Returns:
         RootDataVC or None
     """
-    import base64
+    vc = await _vc_detail_cache.get_or_fetch(vc_id, lambda: _fetch_vc_detail(vc_id))
+    if vc is None:
+        return None
+    return vc.model_copy(deep=True)
+
+
+async def get_vc_details(
+    vc_ids: List[int], concurrency: int = 8
+) -> List[Optional[RootDataVC]]:
+    """
+    Get details for several VCs concurrently
+
+    Args:
+        vc_ids: VC IDs to fetch
+        concurrency: Maximum number of fetches in flight at once; keeps the
+            request rate against rootdata.com polite
 
-    encoded_id = base64.b64encode(str(vc_id).encode()).decode()
+    Returns:
+        VC details in the same order as `vc_ids` (None for failures)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(vc_id: int) -> Optional[RootDataVC]:
+        async with semaphore:
+            try:
+                return await get_vc_detail(vc_id)
+            except Exception as e:
+                logger.warning(f"Failed to fetch VC {vc_id}: {e}")
+                return None
+
+    return await asyncio.gather(*(_one(i) for i in vc_ids))
+
+
+async def _fetch_vc_detail(vc_id: int) -> Optional[RootDataVC]:
+    encoded_id = _encode_id(vc_id)
     url = f"https://www.rootdata.com/Investors/detail/Investor?k={encoded_id}"
 
     logger.info(f"Fetching VC page: {url}")
 
-    html = await fetch_page_html(url)
-    if not html:
+    parts = await _fetch_page_parts(url)
+    if parts is None:
         return None
 
-    soup = BeautifulSoup(html, "html.parser")
-
     try:
-        name = ""
-        h1 = soup.find("h1")
-        if h1:
-            name = h1.text.strip()
-
-        brief_intro = ""
-        description = ""
-        paras = soup.find_all("p")
-        for p in paras:
-            text = p.text.strip()
-            if len(text) > 20:
-                if not brief_intro:
-                    brief_intro = text
-                elif len(text) > len(description):
-                    description = text
-
-        tags = []
-        tag_elements = soup.find_all(class_=re.compile(r"tag|label", re.I))
-        for tag_el in tag_elements:
-            tag_text = tag_el.text.strip()
-            if tag_text and len(tag_text) < 30:
-                tags.append(tag_text)
+        name = parts.headings["h1"].strip()
+
+        brief_intro, description = _intro_and_description(parts.paragraphs)
+
+        tags = _page_tags(parts.tag_texts)
 
         website = None
         twitter = None
-        links = soup.find_all("a", href=True)
-        for link in links:
-            href = link["href"]
-            if "twitter.com" in href or "x.com" in href:
+        for href in parts.hrefs:
+            social = _SOCIAL_HOST_RE.search(href)
+            if social and social.group(1) != "linkedin.com":
                 twitter = href.split("/")[-1]
             elif href.startswith("http") and "rootdata.com" not in href:
                 if not website:
@@ -1077,7 +1710,7 @@ async def get_vc_detail(vc_id: int) -> Optional[RootDataVC]:
             name=name,
             brief_intro=brief_intro,
             description=description,
-            tags=list(set(tags))[:10],
+            tags=tags,
             twitter=twitter,
             website=website,
         )
@@ -1095,6 +1728,55 @@ async def get_vc_detail(vc_id: int) -> Optional[RootDataVC]:
 # ============================================================================
 
 
+def _person_fields_from_nuxt(person_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a people record of a search page to RootDataPerson fields."""
+    tags = []
+    tags_str = person_data.get("enTagNames")
+    if tags_str:
+        tags = [t.strip() for t in str(tags_str).split(",")]
+
+    projects = []
+    if isinstance(person_data.get("projects"), list):
+        projects = [
+            p.get("name", "") for p in person_data["projects"] if isinstance(p, dict)
+        ]
+
+    return {
+        "id": person_data.get("id", 0),
+        "name": _get_text(person_data.get("name")),
+        "title": person_data.get("title"),
+        "brief_intro": person_data.get("enBriefIntd") or "",
+        "description": person_data.get("enIntd") or "",
+        "tags": tags,
+        "twitter": person_data.get("twitter"),
+        "linkedin": person_data.get("linkedin"),
+        "image_url": person_data.get("imgUrl"),
+        "projects": projects,
+        "current_organization": person_data.get("organization"),
+    }
+
+
+def _parse_people_search_results(
+    people_data: List[Dict[str, Any]], query: str, limit: int
+) -> List[RootDataPerson]:
+    """Build RootDataPerson results from the people records of a search page."""
+    if not people_data:
+        logger.warning(f"No people found for query: {query}")
+        return []
+
+    # Parse people
+    records = []
+    for person_data in people_data[:limit]:
+        try:
+            records.append(_person_fields_from_nuxt(person_data))
+        except Exception as e:
+            logger.warning(f"Failed to parse person: {e}")
+    people = _validate_records(records, _PERSON_LIST_ADAPTER, RootDataPerson, "person")
+
+    logger.info(f"Found {len(people)} people for query: {query}")
+    return people
+
+
 async def search_people_with_playwright(
     query: str, limit: int = 10
 ) -> List[RootDataPerson]:
@@ -1108,9 +1790,7 @@ async def search_people_with_playwright(
     Returns:
         List of people
     """
-    try:
-        from playwright.async_api import async_playwright
-    except ImportError:
+    if not _HAS_PLAYWRIGHT:
         logger.error(
             "Playwright not installed. Install with: "
             "pip install playwright && playwright install chromium"
@@ -1120,91 +1800,23 @@ async def search_people_with_playwright(
     url = f"https://www.rootdata.com/People?k={query}"
     logger.info(f"Searching people with Playwright: {url}")
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-
+    # Nothing is clicked, so stylesheets can be dropped along with media
+    async with _playwright_pool.page(_STATIC_RESOURCE_TYPES) as page:
         try:
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-            await page.wait_for_timeout(500)
+            await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+            # Wait for the SSR payload itself rather than for network idle
+            try:
+                await page.wait_for_function(_NUXT_DATA_READY_JS, timeout=5000)
+            except Exception as e:
+                logger.debug(f"NUXT data not found on {url}: {e}")
 
             # Extract data from __NUXT__
-            people_data = await page.evaluate("""() => {
-                if (!window.__NUXT__ || !window.__NUXT__.data) {
-                    return [];
-                }
-                
-                const dataArray = window.__NUXT__.data;
-                for (let i = 0; i < dataArray.length; i++) {
-                    const item = dataArray[i];
-                    if (item && typeof item === 'object') {
-                        const keys = ['list', 'people', 'persons', 'items', 'data', 'records'];
-                        for (const key of keys) {
-                            if (item[key] && Array.isArray(item[key])) {
-                                return item[key];
-                            }
-                        }
-                    }
-                }
-                return [];
-            }""")
+            people_data = await _evaluate_nuxt_list(page, _PEOPLE_LIST_KEYS, limit)
 
-            await browser.close()
-
-            if not people_data:
-                logger.warning(f"No people found for query: {query}")
-                return []
-
-            # Parse people
-            people = []
-            for person_data in people_data[:limit]:
-                try:
-                    name = person_data.get("name", {})
-                    if isinstance(name, dict):
-                        name = name.get("en_value") or name.get("cn_value") or ""
-
-                    tags = []
-                    if "enTagNames" in person_data:
-                        tags_str = person_data["enTagNames"]
-                        if tags_str:
-                            tags = [t.strip() for t in str(tags_str).split(",")]
-
-                    projects = []
-                    if "projects" in person_data and isinstance(
-                        person_data["projects"], list
-                    ):
-                        projects = [
-                            p.get("name", "")
-                            for p in person_data["projects"]
-                            if isinstance(p, dict)
-                        ]
-
-                    person = RootDataPerson(
-                        id=person_data.get("id", 0),
-                        name=str(name),
-                        title=person_data.get("title"),
-                        brief_intro=person_data.get("enBriefIntd") or "",
-                        description=person_data.get("enIntd") or "",
-                        tags=tags,
-                        twitter=person_data.get("twitter"),
-                        linkedin=person_data.get("linkedin"),
-                        image_url=person_data.get("imgUrl"),
-                        projects=projects,
-                        current_organization=person_data.get("organization"),
-                    )
-
-                    people.append(person)
-
-                except Exception as e:
-                    logger.warning(f"Failed to parse person: {e}")
-                    continue
-
-            logger.info(f"Found {len(people)} people for query: {query}")
-            return people
+            return _parse_people_search_results(people_data, query, limit)
 
         except Exception as e:
             logger.error(f"Playwright error: {e}")
-            await browser.close()
             return []
 
 
@@ -1214,6 +1826,9 @@ async def search_people(
     """
     Search people (founders, executives, investors)
 
+    Non-empty results are cached for ten minutes, and concurrent requests
+    for the same query share one search.
+
     Args:
         query: Search keyword (person name or role)
         limit: Maximum number of results
@@ -1229,6 +1844,22 @@ async def search_people(
         # Search for founders
         people = await search_people("founder", limit=10)
     """
+    people = await _people_search_cache.get_or_fetch(
+        (query.strip().lower(), limit, use_playwright),
+        lambda: _search_people_uncached(query, limit, use_playwright),
+    )
+    return [person.model_copy(deep=True) for person in people]
+
+
+async def _search_people_uncached(
+    query: str, limit: int, use_playwright: bool
+) -> List[RootDataPerson]:
+    # Plain HTTP first; the browser is only needed for client-rendered pages
+    people_data = await _try_static_nuxt_search(
+        f"https://www.rootdata.com/People?k={query}", _PEOPLE_LIST_KEYS
+    )
+    if people_data:
+        return _parse_people_search_results(people_data, query, limit)
 
     if use_playwright:
         try:
@@ -1246,63 +1877,78 @@ async def get_person_detail(person_id: int) -> Optional[RootDataPerson]:
     """
     Get person details by ID
 
+    Successful results are cached for an hour, and concurrent requests for
+    the same person share one fetch.
+
     Args:
         person_id: Person ID
 
     Returns:
         RootDataPerson or None
     """
-    import base64
+    person = await _person_detail_cache.get_or_fetch(
+        person_id, lambda: _fetch_person_detail(person_id)
+    )
+    if person is None:
+        return None
+    return person.model_copy(deep=True)
+
+
+async def get_person_details(
+    person_ids: List[int], concurrency: int = 8
+) -> List[Optional[RootDataPerson]]:
+    """
+    Get details for several people concurrently
+
+    Args:
+        person_ids: Person IDs to fetch
+        concurrency: Maximum number of fetches in flight at once; keeps the
+            request rate against rootdata.com polite
 
-    encoded_id = base64.b64encode(str(person_id).encode()).decode()
+    Returns:
+        Person details in the same order as `person_ids` (None for failures)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(person_id: int) -> Optional[RootDataPerson]:
+        async with semaphore:
+            try:
+                return await get_person_detail(person_id)
+            except Exception as e:
+                logger.warning(f"Failed to fetch person {person_id}: {e}")
+                return None
+
+    return await asyncio.gather(*(_one(i) for i in person_ids))
+
+
+async def _fetch_person_detail(person_id: int) -> Optional[RootDataPerson]:
+    encoded_id = _encode_id(person_id)
     url = f"https://www.rootdata.com/People/detail/Person?k={encoded_id}"
 
     logger.info(f"Fetching person page: {url}")
 
-    html = await fetch_page_html(url)
-    if not html:
+    parts = await _fetch_page_parts(url)
+    if parts is None:
         return None
 
-    soup = BeautifulSoup(html, "html.parser")
-
     try:
-        name = ""
-        h1 = soup.find("h1")
-        if h1:
-            name = h1.text.strip()
-
-        title = ""
-        h2 = soup.find("h2")
-        if h2:
-            title = h2.text.strip()
-
-        brief_intro = ""
-        description = ""
-        paras = soup.find_all("p")
-        for p in paras:
-            text = p.text.strip()
-            if len(text) > 20:
-                if not brief_intro:
-                    brief_intro = text
-                elif len(text) > len(description):
-                    description = text
-
-        tags = []
-        tag_elements = soup.find_all(class_=re.compile(r"tag|label", re.I))
-        for tag_el in tag_elements:
-            tag_text = tag_el.text.strip()
-            if tag_text and len(tag_text) < 30:
-                tags.append(tag_text)
+        name = parts.headings["h1"].strip()
+        title = parts.headings["h2"].strip()
+
+        brief_intro, description = _intro_and_description(parts.paragraphs)
+
+        tags = _page_tags(parts.tag_texts)
 
         twitter = None
         linkedin = None
-        links = soup.find_all("a", href=True)
-        for link in links:
-            href = link["href"]
-            if "twitter.com" in href or "x.com" in href:
-                twitter = href.split("/")[-1]
-            elif "linkedin.com" in href:
+        for href in parts.hrefs:
+            social = _SOCIAL_HOST_RE.search(href)
+            if social is None:
+                continue
+            if social.group(1) == "linkedin.com":
                 linkedin = href
+            else:
+                twitter = href.split("/")[-1]
 
         person = RootDataPerson(
             id=person_id,
@@ -1310,7 +1956,7 @@ async def get_person_detail(person_id: int) -> Optional[RootDataPerson]:
             title=title,
             brief_intro=brief_intro,
             description=description,
-            tags=list(set(tags))[:10],
+            tags=tags,
             twitter=twitter,
             linkedin=linkedin,
         )
@@ -1321,3 +1967,43 @@ async def get_person_detail(person_id: int) -> Optional[RootDataPerson]:
     except Exception as e:
         logger.warning(f"Failed to parse person page: {e}")
         return None
+
+
+# ============================================================================
+# Combined Search
+# ============================================================================
+
+
+async def search_vcs_and_people(
+    queries: List[str], limit: int = 10, concurrency: int = 4
+) -> Dict[str, Tuple[List[RootDataVC], List[RootDataPerson]]]:
+    """
+    Search VCs and people for several queries concurrently
+
+    Both searches for a query run at the same time, and up to `concurrency`
+    queries are in flight at once; their browser pages come from the shared
+    Playwright pool.
+
+    Args:
+        queries: Search keywords (duplicates are searched once)
+        limit: Maximum number of results per search
+        concurrency: Maximum number of queries in flight at once
+
+    Returns:
+        Mapping of each query to its (VCs, people) results
+
+    Example:
+        results = await search_vcs_and_people(["a16z", "Paradigm"])
+        vcs, people = results["a16z"]
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(query: str) -> Tuple[List[RootDataVC], List[RootDataPerson]]:
+        async with semaphore:
+            return await asyncio.gather(
+                search_vcs(query, limit), search_people(query, limit)
+            )
+
+    unique_queries = list(dict.fromkeys(queries))
+    results = await asyncio.gather(*(_one(q) for q in unique_queries))
+    return {query: tuple(result) for query, result in zip(unique_queries, results)}
@@ -0,0 +1,589 @@
+import asyncio
+import os
+
+import pytest
+
+from valuecell.agents.sources import rootdata
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(rootdata.time, "monotonic", clock)
+    return clock
+
+
+def _counting_fetch(value):
+    calls = []
+
+    async def fetch():
+        calls.append(value)
+        return value
+
+    return fetch, calls
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_hits_until_ttl_expires(clock):
+    cache = rootdata._AsyncTTLCache(ttl=10, max_entries=8)
+    fetch, calls = _counting_fetch(["result"])
+
+    assert await cache.get_or_fetch("k", fetch) == ["result"]
+    clock.now += 9
+    assert await cache.get_or_fetch("k", fetch) == ["result"]
+    assert len(calls) == 1
+
+    clock.now += 1
+    assert await cache.get_or_fetch("k", fetch) == ["result"]
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_oldest_entry_past_max_entries(clock):
+    cache = rootdata._AsyncTTLCache(ttl=10, max_entries=2)
+    fetch, calls = _counting_fetch("value")
+
+    await cache.get_or_fetch("a", fetch)
+    await cache.get_or_fetch("b", fetch)
+    await cache.get_or_fetch("c", fetch)
+    assert list(cache._entries) == ["b", "c"]
+
+    await cache.get_or_fetch("a", fetch)
+    assert len(calls) == 4
+    assert list(cache._entries) == ["c", "a"]
+
+
+@pytest.mark.asyncio
+async def test_cache_refetched_key_becomes_newest(clock):
+    cache = rootdata._AsyncTTLCache(ttl=10, max_entries=2)
+    fetch, _ = _counting_fetch("value")
+
+    await cache.get_or_fetch("a", fetch)
+    await cache.get_or_fetch("b", fetch)
+    # "a" expires and is fetched again, so "b" is now the oldest entry
+    clock.now += 10
+    await cache.get_or_fetch("a", fetch)
+    await cache.get_or_fetch("c", fetch)
+
+    assert list(cache._entries) == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_cache_coalesces_concurrent_fetches():
+    cache = rootdata._AsyncTTLCache(ttl=10, max_entries=8)
+    release = asyncio.Event()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await release.wait()
+        return {"id": 1}
+
+    waiters = [asyncio.create_task(cache.get_or_fetch("k", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert calls == [1]
+    assert results == [{"id": 1}] * 3
+    assert cache._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_fetch():
+    cache = rootdata._AsyncTTLCache(ttl=10, max_entries=8)
+    release = asyncio.Event()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await release.wait()
+        return "value"
+
+    cancelled = asyncio.create_task(cache.get_or_fetch("k", fetch))
+    survivor = asyncio.create_task(cache.get_or_fetch("k", fetch))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    release.set()
+    assert await survivor == "value"
+    assert calls == [1]
+    assert await cache.get_or_fetch("k", fetch) == "value"
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("empty", [None, [], ""])
+async def test_cache_does_not_store_empty_results(empty):
+    cache = rootdata._AsyncTTLCache(ttl=10, max_entries=8)
+    fetch, calls = _counting_fetch(empty)
+
+    assert await cache.get_or_fetch("k", fetch) == empty
+    assert await cache.get_or_fetch("k", fetch) == empty
+    assert len(calls) == 2
+    assert cache._entries == {}
+
+
+@pytest.mark.asyncio
+async def test_clear_caches_drops_every_cache():
+    caches = (
+        rootdata._project_search_cache,
+        rootdata._vc_search_cache,
+        rootdata._people_search_cache,
+        rootdata._project_detail_cache,
+        rootdata._vc_detail_cache,
+        rootdata._person_detail_cache,
+    )
+    fetch, calls = _counting_fetch("value")
+    try:
+        for cache in caches:
+            await cache.get_or_fetch("test-key", fetch)
+        rootdata.clear_caches()
+
+        assert all("test-key" not in cache._entries for cache in caches)
+        await caches[0].get_or_fetch("test-key", fetch)
+        assert len(calls) == len(caches) + 1
+    finally:
+        rootdata.clear_caches()
+
+
+_PROJECT_PAGE_HTML = """<!DOCTYPE html>
+<html><head><title>Example - RootData</title></head>
+<body>
+  <a href="https://www.rootdata.com/Projects">Projects</a>
+  <h1>
+    Example Protocol
+  </h1>
+  <h2>Overview</h2>
+  <h3> EXP </h3>
+  <p>Short blurb</p>
+  <p>  Example Protocol is a decentralized exchange for perpetuals.  </p>
+  <p>It runs an on-chain order book with <b>sub-second</b> settlement and
+     supports cross-margin accounts across several chains.</p>
+  <p>Example Protocol was founded in 2021 and is backed by several funds.</p>
+  <div class="Tag-item">DeFi</div>
+  <span class="project-label"> Perpetuals </span>
+  <div class="tag">DeFi</div>
+  <div class="tag">This tag text is far too long to be a real tag</div>
+  <div class="TAG">  </div>
+  <a href="https://x.com/exampleprotocol/">X</a>
+  <a href="https://twitter.com/someone_else">Twitter</a>
+  <a href="https://example.org">Website</a>
+  <a href="https://docs.example.org">Docs</a>
+</body></html>
+"""
+
+
+@pytest.mark.skipif(rootdata.lxml_html is None, reason="lxml not installed")
+@pytest.mark.parametrize("bs4_parser", ["lxml", "html.parser"])
+def test_project_page_fields_match_between_lxml_and_bs4(monkeypatch, bs4_parser):
+    # html.parser is what the bs4 path uses when lxml is not installed
+    monkeypatch.setattr(rootdata, "_HTML_PARSER", bs4_parser)
+    lxml_fields = rootdata._project_page_fields(
+        rootdata._page_parts_lxml(rootdata.lxml_html.fromstring(_PROJECT_PAGE_HTML))
+    )
+    bs4_fields = rootdata._project_page_fields(
+        rootdata._page_parts_bs4(_PROJECT_PAGE_HTML)
+    )
+
+    assert lxml_fields == bs4_fields
+    assert lxml_fields == {
+        "name": "Example Protocol",
+        "brief_intro": ("Example Protocol is a decentralized exchange for perpetuals."),
+        "description": (
+            "It runs an on-chain order book with sub-second settlement and\n"
+            "     supports cross-margin accounts across several chains."
+        ),
+        "tags": ["DeFi", "Perpetuals"],
+        "token_symbol": "EXP",
+        "twitter": "exampleprotocol",
+        "website": "https://example.org",
+    }
+
+
+_JSON_NUXT_PAGE = (
+    b"<html><body><div id='__nuxt'></div><script>"
+    b'window.__NUXT__ = {"layout":"default","data":[{"seo":{}},'
+    b'{"investors":[{"id":1,"name":"Alpha"},{"id":2,"name":"Beta"}]}]};'
+    b"</script></body></html>"
+)
+_FUNCTION_NUXT_PAGE = (
+    b"<html><body><script>"
+    b"window.__NUXT__=(function(a,b){return {data:[{list:[{id:a}]}]}}(1,2));"
+    b"</script></body></html>"
+)
+_INVALID_JSON_NUXT_PAGE = (
+    b"<html><body><script>window.__NUXT__ = {data: [1, 2]};</script></body></html>"
+)
+
+
+def test_nuxt_json_re_matches_plain_json_payload():
+    match = rootdata._NUXT_JSON_RE.search(_JSON_NUXT_PAGE)
+
+    assert match is not None
+    assert rootdata._json_loads(match.group(1))["layout"] == "default"
+
+
+def test_nuxt_json_re_rejects_function_payload():
+    assert rootdata._NUXT_JSON_RE.search(_FUNCTION_NUXT_PAGE) is None
+
+
+@pytest.fixture
+def static_pages(monkeypatch, clock):
+    """Serve canned bodies to _try_static_nuxt_search and record fetched URLs."""
+    pages = {"bodies": {}, "fetched": []}
+
+    async def fake_fetch_page_bytes(url):
+        pages["fetched"].append(url)
+        return pages["bodies"].get(url.split("?", 1)[0], b"")
+
+    monkeypatch.setattr(rootdata, "fetch_page_bytes", fake_fetch_page_bytes)
+    monkeypatch.setattr(rootdata, "_pages_without_static_nuxt", {})
+    return pages
+
+
+@pytest.mark.asyncio
+async def test_static_nuxt_search_reads_list_from_json_payload(static_pages):
+    static_pages["bodies"]["https://www.rootdata.com/Investors"] = _JSON_NUXT_PAGE
+
+    results = await rootdata._try_static_nuxt_search(
+        "https://www.rootdata.com/Investors?k=alpha", rootdata._VC_LIST_KEYS
+    )
+
+    assert results == [{"id": 1, "name": "Alpha"}, {"id": 2, "name": "Beta"}]
+    assert rootdata._pages_without_static_nuxt == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("body", [_FUNCTION_NUXT_PAGE, _INVALID_JSON_NUXT_PAGE])
+async def test_static_nuxt_miss_is_remembered_until_ttl_expires(
+    static_pages, clock, body
+):
+    static_pages["bodies"]["https://www.rootdata.com/People"] = body
+    keys = rootdata._PEOPLE_LIST_KEYS
+
+    assert (
+        await rootdata._try_static_nuxt_search(
+            "https://www.rootdata.com/People?k=a", keys
+        )
+        == []
+    )
+    assert (
+        await rootdata._try_static_nuxt_search(
+            "https://www.rootdata.com/People?k=b", keys
+        )
+        == []
+    )
+    assert static_pages["fetched"] == ["https://www.rootdata.com/People?k=a"]
+
+    # Once the miss expires the page is tried again and can recover
+    clock.now += rootdata._STATIC_NUXT_MISS_TTL
+    static_pages["bodies"]["https://www.rootdata.com/People"] = (
+        b'<script>window.__NUXT__={"data":[{"people":[{"id":7}]}]}</script>'
+    )
+    assert await rootdata._try_static_nuxt_search(
+        "https://www.rootdata.com/People?k=c", keys
+    ) == [{"id": 7}]
+    assert len(static_pages["fetched"]) == 2
+    assert rootdata._pages_without_static_nuxt == {}
+
+
+@pytest.mark.asyncio
+async def test_static_nuxt_fetch_failure_is_not_remembered(static_pages):
+    url = "https://www.rootdata.com/Investors?k=alpha"
+
+    assert await rootdata._try_static_nuxt_search(url, rootdata._VC_LIST_KEYS) == []
+    assert await rootdata._try_static_nuxt_search(url, rootdata._VC_LIST_KEYS) == []
+    assert static_pages["fetched"] == [url, url]
+    assert rootdata._pages_without_static_nuxt == {}
+
+
+class _FakePage:
+    def __init__(self):
+        self.closed = False
+        self.fail_goto = False
+        self.visited = []
+        self.routes = []
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+    async def goto(self, url):
+        if self.fail_goto:
+            raise RuntimeError("navigation failed")
+        self.visited.append(url)
+
+    async def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+
+class _FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+        self._close_handlers = []
+
+    async def new_page(self):
+        page = _FakePage()
+        self.pages.append(page)
+        return page
+
+    def on(self, event, handler):
+        assert event == "close"
+        self._close_handlers.append(handler)
+
+    async def close(self):
+        self.closed = True
+        for handler in self._close_handlers:
+            handler(self)
+
+
+class _FakeBrowser:
+    def __init__(self, contexts):
+        self.contexts = contexts
+        self.closed = False
+
+    async def new_context(self):
+        context = _FakeContext()
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakePlaywright:
+    # Set to make the persistent profile unavailable, as when it is locked
+    persistent_error = None
+
+    def __init__(self):
+        self.contexts = []
+        self.profiles = []
+        self.browsers = []
+        self.stopped = False
+        self.chromium = self
+
+    async def launch_persistent_context(self, user_data_dir, **kwargs):
+        if self.persistent_error is not None:
+            raise self.persistent_error
+        self.profiles.append(user_data_dir)
+        context = _FakeContext()
+        self.contexts.append(context)
+        return context
+
+    async def launch(self, **kwargs):
+        browser = _FakeBrowser(self.contexts)
+        self.browsers.append(browser)
+        return browser
+
+    async def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(rootdata, "get_system_cache_dir", lambda: cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch, cache_dir):
+    """Patch async_playwright() and record every driver it starts."""
+    async_api = pytest.importorskip("playwright.async_api")
+    started = []
+
+    class _Starter:
+        async def start(self):
+            playwright = _FakePlaywright()
+            started.append(playwright)
+            return playwright
+
+    monkeypatch.setattr(async_api, "async_playwright", _Starter)
+    return started
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_pages_per_blocked_resource_set(fake_playwright):
+    pool = rootdata._PlaywrightPool()
+
+    async with pool.page() as first:
+        pass
+    async with pool.page() as second:
+        pass
+    async with pool.page(rootdata._MEDIA_RESOURCE_TYPES) as blocking:
+        pass
+
+    assert second is first
+    assert first.visited == ["about:blank", "about:blank"]
+    assert first.routes == []
+    assert blocking is not first
+    assert blocking.routes == ["**/*"]
+    assert len(fake_playwright) == 1
+    assert len(fake_playwright[0].contexts) == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_lends_at_most_max_pages(fake_playwright):
+    pool = rootdata._PlaywrightPool(max_pages=2)
+    running = 0
+    peak = 0
+
+    async def scrape():
+        nonlocal running, peak
+        async with pool.page():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(scrape() for _ in range(5)))
+
+    assert peak == 2
+    assert len(fake_playwright[0].contexts[0].pages) == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_evicts_closed_pages(fake_playwright):
+    pool = rootdata._PlaywrightPool()
+
+    async with pool.page() as first:
+        pass
+    first.closed = True
+    async with pool.page() as second:
+        pass
+
+    assert second is not first
+    assert fake_playwright[0].contexts[0].pages == [first, second]
+
+
+@pytest.mark.asyncio
+async def test_pool_closes_page_on_error(fake_playwright):
+    pool = rootdata._PlaywrightPool()
+
+    with pytest.raises(ValueError):
+        async with pool.page() as failed:
+            raise ValueError("scrape failed")
+    async with pool.page() as broken:
+        broken.fail_goto = True
+    async with pool.page() as fresh:
+        pass
+
+    assert failed.closed
+    assert broken.closed
+    assert fresh is not failed and fresh is not broken
+
+
+@pytest.mark.asyncio
+async def test_pool_close_shuts_down_context_and_driver(fake_playwright):
+    pool = rootdata._PlaywrightPool()
+
+    async with pool.page():
+        pass
+    await pool.close()
+
+    assert fake_playwright[0].contexts[0].closed
+    assert fake_playwright[0].stopped
+    async with pool.page():
+        pass
+    assert len(fake_playwright) == 2
+
+
+def _use_pool(pool):
+    async def use():
+        async with pool.page() as page:
+            return page
+
+    return use()
+
+
+def test_pool_refuses_loop_switch_while_open(fake_playwright):
+    pool = rootdata._PlaywrightPool()
+    first_loop = asyncio.new_event_loop()
+    second_loop = asyncio.new_event_loop()
+    try:
+        first_loop.run_until_complete(_use_pool(pool))
+        with pytest.raises(RuntimeError, match="another event loop"):
+            second_loop.run_until_complete(_use_pool(pool))
+        assert not fake_playwright[0].stopped
+
+        first_loop.run_until_complete(pool.close())
+        second_loop.run_until_complete(_use_pool(pool))
+    finally:
+        first_loop.close()
+        second_loop.close()
+
+    assert fake_playwright[0].stopped
+    assert len(fake_playwright) == 2
+
+
+def test_pool_starts_fresh_after_owning_loop_closed(fake_playwright):
+    pool = rootdata._PlaywrightPool()
+    first_loop = asyncio.new_event_loop()
+    first_loop.run_until_complete(_use_pool(pool))
+    first_loop.close()
+
+    second_loop = asyncio.new_event_loop()
+    try:
+        page = second_loop.run_until_complete(_use_pool(pool))
+    finally:
+        second_loop.close()
+
+    assert len(fake_playwright) == 2
+    assert page in fake_playwright[1].contexts[0].pages
+
+
+@pytest.mark.asyncio
+async def test_pool_profile_is_private_under_user_cache_dir(fake_playwright, cache_dir):
+    profile = cache_dir / rootdata._CHROMIUM_PROFILE_DIRNAME
+    profile.mkdir(parents=True, mode=0o755)
+    profile.chmod(0o755)
+    pool = rootdata._PlaywrightPool()
+
+    async with pool.page():
+        pass
+
+    assert fake_playwright[0].profiles == [str(profile)]
+    if os.name == "posix":
+        assert profile.stat().st_mode & 0o777 == 0o700
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX ownership check")
+def test_profile_owned_by_another_user_is_refused(monkeypatch, tmp_path):
+    other_uid = os.getuid() + 1
+    monkeypatch.setattr(rootdata.os, "getuid", lambda: other_uid)
+
+    with pytest.raises(PermissionError):
+        rootdata._prepare_user_data_dir(str(tmp_path / "profile"))
+
+
+@pytest.mark.asyncio
+async def test_pool_falls_back_to_fresh_browser_when_profile_locked(
+    fake_playwright, monkeypatch
+):
+    monkeypatch.setattr(
+        _FakePlaywright, "persistent_error", RuntimeError("ProcessSingleton")
+    )
+    pool = rootdata._PlaywrightPool()
+
+    async with pool.page() as page:
+        pass
+    await pool.close()
+
+    playwright = fake_playwright[0]
+    assert playwright.profiles == []
+    assert page in playwright.contexts[0].pages
+    assert playwright.browsers[0].closed
@@ -0,0 +1,26 @@
+from typing import Any, Callable, Dict
+
+from valuecell.core.agent.responses import streaming
+from valuecell.core.types import StreamResponse
+
+
+def _handle_run_content(event) -> StreamResponse:
+    return streaming.message_chunk(event.content)
+
+
+def _handle_tool_call_started(event) -> StreamResponse:
+    return streaming.tool_call_started(event.tool.tool_call_id, event.tool.tool_name)
+
+
+def _handle_tool_call_completed(event) -> StreamResponse:
+    return streaming.tool_call_completed(
+        event.tool.result, event.tool.tool_call_id, event.tool.tool_name
+    )
+
+
+# Maps agno run event names to the stream response they produce
+EVENT_HANDLERS: Dict[str, Callable[[Any], StreamResponse]] = {
+    "RunContent": _handle_run_content,
+    "ToolCallStarted": _handle_tool_call_started,
+    "ToolCallCompleted": _handle_tool_call_completed,
+}
@@ -0,0 +1,40 @@
+import functools
+from typing import Any, Optional, Tuple
+
+from agno.agent import Agent
+
+from valuecell.adapters.models import create_model
+from valuecell.config.manager import get_config_manager
+
+
+def _provider_credentials(provider: str) -> Optional[Tuple[Optional[str], ...]]:
+    """Return the API key and endpoint the provider resolves to right now.
+
+    Both are read from the environment on every call, so they change when
+    keys are rotated at runtime (e.g. through the models API).
+    """
+    config = get_config_manager().get_provider_config(provider)
+    if config is None:
+        return None
+    return config.api_key, config.base_url
+
+
+@functools.lru_cache(maxsize=32)
+def _build_search_agent(
+    provider: str, model_id: str, credentials: Any, **model_kwargs
+) -> Agent:
+    return Agent(
+        model=create_model(provider=provider, model_id=model_id, **model_kwargs)
+    )
+
+
+def get_search_agent(provider: str, model_id: str, **model_kwargs) -> Agent:
+    """Return the shared search Agent for a (provider, model_id) pair.
+
+    Reusing the Agent keeps its model client, and so its connection pool,
+    alive across searches. Agents are also keyed by the provider's current
+    credentials, so a rotated key gets a new Agent instead of the stale one.
+    """
+    return _build_search_agent(
+        provider, model_id, _provider_credentials(provider), **model_kwargs
+    )
@@ -8,6 +8,11 @@ from valuecell.utils import get_agent_card_path
 
 FIELDS_UNDEFINED_IN_AGENT_CARD_MODEL = {"enabled", "metadata", "display_name"}
 
+# Capabilities assumed for cards that do not declare any, dumped once
+_DEFAULT_CAPABILITIES = AgentCapabilities(
+    streaming=True, push_notifications=False
+).model_dump()
+
 
 def parse_local_agent_card_dict(agent_card_dict: dict) -> Optional[AgentCard]:
     """Parse a dictionary into an AgentCard, filling in missing required fields.
@@ -22,8 +27,7 @@ def parse_local_agent_card_dict(agent_card_dict: dict) -> Optional[AgentCard]:
         return None
     # Defined by us, remove fields that are not part of AgentCard
     for field in FIELDS_UNDEFINED_IN_AGENT_CARD_MODEL:
-        if field in agent_card_dict:
-            del agent_card_dict[field]
+        agent_card_dict.pop(field, None)
 
     # Requested fields as per AgentCard model
     if "description" not in agent_card_dict:
@@ -31,9 +35,7 @@ def parse_local_agent_card_dict(agent_card_dict: dict) -> Optional[AgentCard]:
             f"No description available for {agent_card_dict.get('name', 'unknown')} agent."
         )
     if "capabilities" not in agent_card_dict:
-        agent_card_dict["capabilities"] = AgentCapabilities(
-            streaming=True, push_notifications=False
-        ).model_dump()
+        agent_card_dict["capabilities"] = dict(_DEFAULT_CAPABILITIES)
     if "default_input_modes" not in agent_card_dict:
         agent_card_dict["default_input_modes"] = []
     if "default_output_modes" not in agent_card_dict:
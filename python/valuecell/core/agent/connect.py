@@ -1,24 +1,56 @@
 import asyncio
+import functools
+import hashlib
+import importlib.metadata
 import json
-from dataclasses import dataclass
+import os
+import pickle
+import random
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from importlib import import_module
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
+import aiofiles
 from a2a.types import AgentCard
 from loguru import logger
 
+from valuecell.core.agent import card as card_module
 from valuecell.core.agent.card import parse_local_agent_card_dict
 from valuecell.core.agent.client import AgentClient
 from valuecell.core.agent.decorator import create_wrapped_agent
 from valuecell.core.agent.listener import NotificationListener
 from valuecell.core.types import BaseAgent, NotificationCallbackType
 from valuecell.utils import get_next_available_port
+from valuecell.utils.env import get_system_cache_dir
 
-AGENT_METADATA_CLASS_KEY = "local_agent_class"
-
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+AGENT_METADATA_CLASS_KEY = "local_agent_class"
+# Upper bound on waiting for a notification listener to bind its port
+LISTENER_READY_TIMEOUT_S = 5.0
+# Upper bound on waiting for an in-process agent server to bind its port
+AGENT_STARTUP_TIMEOUT_S = 5.0
+# How long client initialization waits for a local agent's started event
+CLIENT_READY_WAIT_S = 2.0
+
+# orjson decodes UTF-8 bytes natively; its JSONDecodeError subclasses json's
+_loads_card = orjson.loads if orjson is not None else json.loads
+
+# Parsed cards are cached in the user cache directory, one file per card
+# directory, keyed by file stat so an unchanged directory is not re-parsed on
+# restart. The whole cache is also keyed by the card parser fingerprint; bump
+# the version whenever the cached AgentContext kwargs change shape.
+AGENT_CARD_CACHE_DIRNAME = "agent_cards"
+_AGENT_CARD_CACHE_VERSION = 2
+_CardCacheKey = Tuple[str, int, int]
+
+
+@dataclass(slots=True)
 class AgentContext:
     """Unified context for remote agents.
 
@@ -49,6 +81,13 @@ class AgentContext:
     agent_instance: Optional[BaseAgent] = None
     agent_instance_class: Optional[Type[BaseAgent]] = None
     agent_task: Optional[asyncio.Task] = None
+    # Metadata flags, read once at creation since planners check them often
+    planner_passthrough: bool = field(default=False, init=False)
+    hidden: bool = field(default=False, init=False)
+
+    def __post_init__(self) -> None:
+        self.planner_passthrough = bool(self._get_metadata_flag("planner_passthrough"))
+        self.hidden = bool(self._get_metadata_flag("hidden"))
 
     def _get_metadata_flag(self, key: str) -> Optional[bool]:
         """Retrieve a boolean-like flag from stored metadata or card."""
@@ -57,26 +96,28 @@ class AgentContext:
 
         return None
 
-    @property
-    def planner_passthrough(self) -> bool:
-        flag = self._get_metadata_flag("planner_passthrough")
-        return bool(flag) if flag is not None else False
 
-    @property
-    def hidden(self) -> bool:
-        flag = self._get_metadata_flag("hidden")
-        return bool(flag) if flag is not None else False
+_LOCAL_AGENT_CLASS_CACHE: Dict[str, Type[Any]] = {}
+# Class resolutions running on the import pool, keyed by spec
+_PENDING_CLASS_RESOLUTIONS: Dict[str, "Future[Optional[Type[Any]]]"] = {}
+
 
+@functools.cache
+def _import_executor() -> ThreadPoolExecutor:
+    """Return the small persistent pool that resolves agent class imports.
 
-_LOCAL_AGENT_CLASS_CACHE: Dict[str, Type[Any]] = {}
+    Imports serialize on the interpreter's import lock anyway, so a couple of
+    long-lived workers avoid growing the default executor on bursty starts.
+    """
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="agent-import")
 
 
 def _resolve_local_agent_class(spec: str) -> Optional[Type[Any]]:
     """Resolve a `module:Class` spec to a Python class.
 
     This function is synchronous and performs a normal import. Callers that
-    need to avoid blocking the event loop should invoke this via
-    `asyncio.to_thread(_resolve_local_agent_class, spec)`.
+    need to avoid blocking the event loop should invoke this in a worker
+    thread, as `_build_local_agent` does via `_import_executor()`.
 
     Results are cached in `_LOCAL_AGENT_CLASS_CACHE` to avoid repeated
     imports/attribute lookups.
@@ -101,14 +142,42 @@ def _resolve_local_agent_class(spec: str) -> Optional[Type[Any]]:
     return agent_cls
 
 
+def _submit_class_resolution(spec: str) -> "Future[Optional[Type[Any]]]":
+    """Resolve `spec` on the import pool, joining a resolution in progress."""
+    future = _PENDING_CLASS_RESOLUTIONS.get(spec)
+    if future is None:
+        future = _import_executor().submit(_resolve_local_agent_class, spec)
+        _PENDING_CLASS_RESOLUTIONS[spec] = future
+
+        def _forget(done: Future) -> None:
+            if _PENDING_CLASS_RESOLUTIONS.get(spec) is done:
+                del _PENDING_CLASS_RESOLUTIONS[spec]
+
+        future.add_done_callback(_forget)
+    return future
+
+
+def _warm_local_agent_classes(contexts: Iterable[AgentContext]) -> None:
+    """Start importing the agent classes of freshly loaded contexts.
+
+    Runs on the import pool so loading cards never blocks the event loop;
+    by the time an agent is first started its class is usually resolved.
+    """
+    for ctx in contexts:
+        spec = ctx.agent_class_spec
+        if spec and spec not in _LOCAL_AGENT_CLASS_CACHE:
+            _submit_class_resolution(spec)
+
+
 async def _build_local_agent(ctx: AgentContext):
     """Asynchronously produce a wrapped local agent instance for the
     given `AgentContext`.
 
     Behavior:
     - If `agent_instance_class` is already present, use it.
-    - Otherwise, if `agent_class_spec` is provided, resolve it off the
-      event loop (`asyncio.to_thread`) so imports don't block the loop.
+    - Otherwise, if `agent_class_spec` is provided, use the class warmed up
+      when the cards were loaded, or resolve it off the event loop (in
+      `_import_executor()`) so imports don't block the loop.
     - If resolution fails, log a warning and return `None` (caller will
       treat missing factory as "no local agent available").
     - The actual wrapping call (`create_wrapped_agent`) is performed on
@@ -118,10 +187,12 @@ async def _build_local_agent(ctx: AgentContext):
 
     agent_cls = ctx.agent_instance_class
     if agent_cls is None and ctx.agent_class_spec:
-        # Resolve the import in a worker thread to avoid blocking the loop.
-        agent_cls = await asyncio.to_thread(
-            _resolve_local_agent_class, ctx.agent_class_spec
-        )
+        agent_cls = _LOCAL_AGENT_CLASS_CACHE.get(ctx.agent_class_spec)
+        if agent_cls is None:
+            # Resolve the import in a worker thread to avoid blocking the loop.
+            agent_cls = await asyncio.wrap_future(
+                _submit_class_resolution(ctx.agent_class_spec)
+            )
         ctx.agent_instance_class = agent_cls
         if agent_cls is None:
             logger.warning(
@@ -141,6 +212,139 @@ async def _build_local_agent(ctx: AgentContext):
     return create_wrapped_agent(agent_cls)
 
 
+def _card_context_kwargs(raw_card: bytes) -> Optional[Dict[str, Any]]:
+    """Parse an agent card file's contents into AgentContext keyword arguments.
+
+    Returns None for cards that should not be registered (no name, disabled,
+    or not parseable into an AgentCard). Decode errors propagate.
+    """
+    agent_card_dict = _loads_card(raw_card)
+    agent_name = agent_card_dict.get("name")
+    if not agent_name:
+        return None
+    if not agent_card_dict.get("enabled", True):
+        return None
+    raw_metadata = agent_card_dict.get("metadata")
+    metadata: Dict[str, Any] = (
+        dict(raw_metadata) if isinstance(raw_metadata, dict) else {}
+    )
+    class_spec = metadata.get(AGENT_METADATA_CLASS_KEY)
+    if not isinstance(class_spec, str):
+        class_spec = None
+    local_agent_card = parse_local_agent_card_dict(agent_card_dict)
+    if not local_agent_card:
+        return None
+    return {
+        "name": agent_name,
+        "url": local_agent_card.url,
+        "local_agent_card": local_agent_card,
+        "metadata": metadata or None,
+        "agent_class_spec": class_spec,
+    }
+
+
+def _scan_card_files(card_dir: Path) -> List[Tuple[str, _CardCacheKey]]:
+    """Return (path, cache key) for every JSON card file in a directory.
+
+    `os.scandir` entries carry the file type from the directory listing, so
+    no Path objects are built and only the cache key needs a stat call.
+    """
+    card_files = []
+    with os.scandir(card_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except FileNotFoundError:
+                # Removed while the directory was being scanned
+                continue
+            card_files.append(
+                (entry.path, (entry.name, stat.st_mtime_ns, stat.st_size))
+            )
+    return card_files
+
+
+@functools.cache
+def _card_parser_fingerprint() -> str:
+    """Hash of the a2a version and card parser source that cached cards depend on."""
+    try:
+        a2a_version = importlib.metadata.version("a2a-sdk")
+    except importlib.metadata.PackageNotFoundError:
+        a2a_version = "unknown"
+    digest = hashlib.sha256(a2a_version.encode())
+    digest.update(Path(card_module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def _card_cache_path(card_dir: Path) -> Path:
+    """Return the cache file of a card directory under the user cache dir."""
+    dir_hash = hashlib.sha256(str(card_dir.resolve()).encode()).hexdigest()[:16]
+    return get_system_cache_dir() / AGENT_CARD_CACHE_DIRNAME / f"{dir_hash}.pkl"
+
+
+def _load_card_cache(
+    card_dir: Path,
+) -> Dict[_CardCacheKey, Optional[Dict[str, Any]]]:
+    """Return the parsed-card cache of a directory, or {} if it is unusable."""
+    try:
+        with open(_card_cache_path(card_dir), "rb") as f:
+            version, fingerprint, entries = pickle.load(f)
+        if (
+            version == _AGENT_CARD_CACHE_VERSION
+            and fingerprint == _card_parser_fingerprint()
+            and isinstance(entries, dict)
+        ):
+            return entries
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable agent card cache for {card_dir}: {e}")
+    return {}
+
+
+def _save_card_cache(
+    card_dir: Path, entries: Dict[_CardCacheKey, Optional[Dict[str, Any]]]
+) -> None:
+    cache_path = _card_cache_path(card_dir)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                (_AGENT_CARD_CACHE_VERSION, _card_parser_fingerprint(), entries),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        # e.g. an unwritable home; the cards are simply parsed next time
+        logger.debug(f"Unable to write agent card cache for {card_dir}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _context_card(ctx: AgentContext) -> Optional[AgentCard]:
+    """Return the connected client's card, falling back to the local card."""
+    if ctx.client and ctx.client.agent_card:
+        return ctx.client.agent_card
+    return ctx.local_agent_card
+
+
+async def _read_card_file(json_file: str) -> bytes:
+    """Read the raw contents of an agent card file without blocking the loop."""
+    async with aiofiles.open(json_file, "rb") as f:
+        return await f.read()
+
+
+async def _read_and_parse_card(json_file: str) -> Optional[Dict[str, Any]]:
+    return _card_context_kwargs(await _read_card_file(json_file))
+
+
 class RemoteConnections:
     """Manager for remote Agent connections (client + optional listener only).
 
@@ -155,21 +359,53 @@ class RemoteConnections:
         self._contexts: Dict[str, AgentContext] = {}
         # Whether remote contexts (from configs) have been loaded
         self._remote_contexts_loaded: bool = False
+        # In-flight async load shared by concurrent callers
+        self._remote_contexts_loading: Optional[asyncio.Future] = None
         # Per-agent locks for concurrent start_agent calls
         self._agent_locks: Dict[str, asyncio.Lock] = {}
+        # In-flight agent starts, awaited by concurrent start_agent callers
+        self._agent_starts: Dict[str, asyncio.Task] = {}
+        # Strong references to long-running tasks; the event loop only keeps
+        # weak ones, so a task dropped from its context could be collected
+        self._background_tasks: set[asyncio.Task] = set()
+        # Card maps served by the card getters, rebuilt after contexts or
+        # clients change
+        self._cards_snapshot: Optional[Dict[str, AgentCard]] = None
+        self._planable_cards_snapshot: Optional[Dict[str, AgentCard]] = None
+
+    def _invalidate_card_snapshots(self) -> None:
+        self._cards_snapshot = None
+        self._planable_cards_snapshot = None
+
+    def _build_card_snapshots(self) -> None:
+        """Collect all and planable cards in a single pass over the contexts."""
+        all_cards: Dict[str, AgentCard] = {}
+        planable_cards: Dict[str, AgentCard] = {}
+        for name, ctx in self._contexts.items():
+            card = _context_card(ctx)
+            if card:
+                all_cards[name] = card
+                if not (ctx.planner_passthrough or ctx.hidden):
+                    planable_cards[name] = card
+        self._cards_snapshot = all_cards
+        self._planable_cards_snapshot = planable_cards
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Create a task that stays referenced until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
 
     def _get_agent_lock(self, agent_name: str) -> asyncio.Lock:
         """Get or create a lock for a specific agent (thread-safe)"""
-        if agent_name not in self._agent_locks:
-            self._agent_locks[agent_name] = asyncio.Lock()
-        return self._agent_locks[agent_name]
-
-    def _load_remote_contexts(self, agent_card_dir: str = None) -> None:
-        """Load remote agent contexts from JSON config files into _contexts.
+        lock = self._agent_locks.get(agent_name)
+        if lock is None:
+            lock = self._agent_locks.setdefault(agent_name, asyncio.Lock())
+        return lock
 
-        Always uses parse_local_agent_card_dict to parse/normalize the
-        AgentCard; supports custom directories via base_dir.
-        """
+    def _resolve_agent_card_dir(self, agent_card_dir: str = None) -> Optional[Path]:
+        """Return the agent card directory, or None if it does not exist."""
         if agent_card_dir is None:
             # Default to python/configs/agent_cards relative to current file
             agent_card_dir = (
@@ -179,49 +415,110 @@ class RemoteConnections:
             agent_card_dir = Path(agent_card_dir)
 
         if not agent_card_dir.exists():
-            self._remote_contexts_loaded = True
             logger.warning(
                 f"Agent card directory {agent_card_dir} does not exist; no remote agents loaded"
             )
+            return None
+        return agent_card_dir
+
+    def _register_contexts(
+        self, entries: Dict[_CardCacheKey, Optional[Dict[str, Any]]]
+    ) -> None:
+        """Create contexts from parsed card entries."""
+        contexts = [
+            AgentContext(**kwargs) for kwargs in entries.values() if kwargs is not None
+        ]
+        for ctx in contexts:
+            self._contexts[ctx.name] = ctx
+        self._invalidate_card_snapshots()
+        _warm_local_agent_classes(contexts)
+
+    def _load_remote_contexts(self, agent_card_dir: str = None) -> None:
+        """Load remote agent contexts from JSON config files into _contexts.
+
+        Always uses parse_local_agent_card_dict to parse/normalize the
+        AgentCard; supports custom directories via base_dir. Files whose
+        stat matches the directory's card cache are not read again.
+        """
+        card_dir = self._resolve_agent_card_dir(agent_card_dir)
+        if card_dir is not None:
+            cache = _load_card_cache(card_dir)
+            entries: Dict[_CardCacheKey, Optional[Dict[str, Any]]] = {}
+            for json_file, key in _scan_card_files(card_dir):
+                try:
+                    if key in cache:
+                        entries[key] = cache[key]
+                        continue
+                    with open(json_file, "rb") as f:
+                        entries[key] = _card_context_kwargs(f.read())
+                except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
+                    logger.warning(
+                        f"Failed to load agent card from {json_file}; skipping: {e}"
+                    )
+            self._register_contexts(entries)
+            if entries.keys() != cache.keys():
+                _save_card_cache(card_dir, entries)
+        self._remote_contexts_loaded = True
+
+    async def _load_remote_contexts_async(self, agent_card_dir: str = None) -> None:
+        """Async variant of `_load_remote_contexts`.
+
+        Card files missing from the cache are read concurrently off the
+        event loop, and each is parsed on the loop as soon as its read
+        completes, overlapping parsing with the remaining reads. Contexts
+        are then created in file order.
+        """
+        card_dir = self._resolve_agent_card_dir(agent_card_dir)
+        if card_dir is None:
+            self._remote_contexts_loaded = True
             return
 
-        for json_file in agent_card_dir.glob("*.json"):
+        cache = await asyncio.to_thread(_load_card_cache, card_dir)
+        keyed_files = await asyncio.to_thread(_scan_card_files, card_dir)
+        misses = [(f, key) for f, key in keyed_files if key not in cache]
+        results = await asyncio.gather(
+            *(_read_and_parse_card(json_file) for json_file, _ in misses),
+            return_exceptions=True,
+        )
+        # A synchronous load may have completed while the files were read
+        if self._remote_contexts_loaded:
+            return
+
+        parsed: Dict[_CardCacheKey, Optional[Dict[str, Any]]] = {}
+        for (json_file, key), result in zip(misses, results):
             try:
-                # Read name minimally to resolve via helper
-                with open(json_file, "r", encoding="utf-8") as f:
-                    agent_card_dict = json.load(f)
-                agent_name = agent_card_dict.get("name")
-                if not agent_name:
-                    continue
-                if not agent_card_dict.get("enabled", True):
-                    continue
-                raw_metadata = agent_card_dict.get("metadata")
-                metadata: Dict[str, Any] = (
-                    dict(raw_metadata) if isinstance(raw_metadata, dict) else {}
-                )
-                class_spec = metadata.get(AGENT_METADATA_CLASS_KEY)
-                if not isinstance(class_spec, str):
-                    class_spec = None
-                local_agent_card = parse_local_agent_card_dict(agent_card_dict)
-                if not local_agent_card:
-                    continue
-                self._contexts[agent_name] = AgentContext(
-                    name=agent_name,
-                    url=local_agent_card.url,
-                    local_agent_card=local_agent_card,
-                    metadata=metadata or None,
-                    agent_class_spec=class_spec,
-                )
+                if isinstance(result, BaseException):
+                    raise result
+                parsed[key] = result
             except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
                 logger.warning(
                     f"Failed to load agent card from {json_file}; skipping: {e}"
                 )
-                continue
+        entries = {
+            key: cache[key] if key in cache else parsed[key]
+            for _, key in keyed_files
+            if key in cache or key in parsed
+        }
+        self._register_contexts(entries)
         self._remote_contexts_loaded = True
+        if entries.keys() != cache.keys():
+            await asyncio.to_thread(_save_card_cache, card_dir, entries)
 
-    def _ensure_remote_contexts_loaded(self) -> None:
-        if not self._remote_contexts_loaded:
-            self._load_remote_contexts()
+    async def _ensure_remote_contexts_loaded_async(self) -> None:
+        if self._remote_contexts_loaded:
+            return
+        if self._remote_contexts_loading is None:
+            self._remote_contexts_loading = asyncio.ensure_future(
+                self._load_remote_contexts_async()
+            )
+            self._remote_contexts_loading.add_done_callback(
+                self._on_remote_contexts_loaded
+            )
+        # Shield so one cancelled caller does not abort the shared load
+        await asyncio.shield(self._remote_contexts_loading)
+
+    def _on_remote_contexts_loaded(self, _future: asyncio.Future) -> None:
+        self._remote_contexts_loading = None
 
     # Public helper primarily for tests or tooling to load from a custom dir
     def load_from_dir(self, config_dir: str) -> None:
@@ -240,32 +537,68 @@ class RemoteConnections:
 
         Returns the AgentCard if available from local configs; otherwise None.
         """
-        # Use agent-specific lock to prevent concurrent starts of the same agent
-        agent_lock = self._get_agent_lock(agent_name)
-        async with agent_lock:
-            ctx = await self._get_or_create_context(agent_name)
-
-            # Record listener preferences on the context
-            if with_listener:
-                ctx.desired_listener_host = listener_host
-                ctx.desired_listener_port = listener_port
-                ctx.notification_callback = notification_callback
+        # Fast path: a connected agent whose runtime is still up needs no lock
+        ctx = self._contexts.get(agent_name)
+        if (
+            ctx
+            and ctx.client
+            and ctx.client.agent_card
+            and not with_listener
+            and not (ctx.agent_task and ctx.agent_task.done())
+        ):
+            return ctx.client.agent_card
 
-            await self._ensure_agent_runtime(ctx)
+        ctx = await self._get_or_create_context(agent_name)
+
+        # The agent lock only guards deciding who starts the agent; the slow
+        # runtime/client/listener setup runs outside it, and concurrent
+        # callers await the same in-flight start
+        async with self._get_agent_lock(agent_name):
+            starting = self._agent_starts.get(agent_name)
+            is_starter = starting is None
+            if is_starter:
+                # Record listener preferences on the context
+                if with_listener:
+                    ctx.desired_listener_host = listener_host
+                    ctx.desired_listener_port = listener_port
+                    ctx.notification_callback = notification_callback
+                starting = self._spawn(self._connect_agent(ctx, with_listener))
+                self._agent_starts[agent_name] = starting
+                starting.add_done_callback(
+                    lambda done: self._forget_agent_start(agent_name, done)
+                )
 
-            # If already connected, return card
-            if ctx.client and ctx.client.agent_card:
-                return ctx.client.agent_card
+        # Shield so one cancelled caller does not abort the shared start
+        card = await asyncio.shield(starting)
+        if with_listener and not is_starter:
+            ctx.desired_listener_host = listener_host
+            ctx.desired_listener_port = listener_port
+            ctx.notification_callback = notification_callback
+        return card
 
-            # Ensure client connection (uses URL from context)
-            await self._ensure_client(ctx)
+    def _forget_agent_start(self, agent_name: str, done: asyncio.Task) -> None:
+        if self._agent_starts.get(agent_name) is done:
+            del self._agent_starts[agent_name]
 
-            # Ensure listener if requested and supported
-            if with_listener:
-                await self._ensure_listener(ctx)
+    async def _connect_agent(
+        self, ctx: AgentContext, with_listener: bool
+    ) -> Optional[AgentCard]:
+        """Launch the agent runtime if needed, then connect its client."""
+        await self._ensure_agent_runtime(ctx)
 
+        # If already connected, return card
+        if ctx.client and ctx.client.agent_card:
             return ctx.client.agent_card
 
+        # Ensure client connection (uses URL from context)
+        await self._ensure_client(ctx)
+
+        # Ensure listener if requested and supported
+        if with_listener:
+            await self._ensure_listener(ctx)
+
+        return ctx.client.agent_card
+
     async def _ensure_listener(self, ctx: AgentContext) -> None:
         """Ensure listener is running if supported by agent card."""
         if ctx.listener_task:
@@ -305,6 +638,7 @@ class RemoteConnections:
                 raise RuntimeError("Agent card resolution returned None")
             # Success: assign to context
             ctx.client = tmp_client
+            self._invalidate_card_snapshots()
             logger.info(f"Connected to agent '{ctx.name}' at {url}")
             if ctx.listener_url:
                 logger.info(f"  └─ with listener at {ctx.listener_url}")
@@ -352,9 +686,8 @@ class RemoteConnections:
             logger.info(f"Launching in-process agent '{ctx.name}'")
 
         if ctx.agent_task is None:
-            ctx.agent_task = asyncio.create_task(ctx.agent_instance.serve())
-            # Give the event loop a chance to schedule startup work
-            await asyncio.sleep(0)
+            ctx.agent_task = self._spawn(ctx.agent_instance.serve())
+            await self._wait_agent_started(ctx)
             if ctx.agent_task.done():
                 try:
                     ctx.agent_task.result()
@@ -382,10 +715,46 @@ class RemoteConnections:
                         ctx.agent_task = None
                         ctx.agent_instance = None
 
+    async def _wait_agent_started(self, ctx: AgentContext) -> None:
+        """Wait until a freshly launched agent has bound its port or exited.
+
+        Served agents expose a `started` event set once uvicorn is listening.
+        Agents without one only get a single scheduler turn to fail fast.
+        """
+        started = getattr(ctx.agent_instance, "started", None)
+        if not isinstance(started, asyncio.Event):
+            await asyncio.sleep(0)
+            return
+        started_wait = asyncio.create_task(started.wait())
+        try:
+            await asyncio.wait(
+                (ctx.agent_task, started_wait),
+                timeout=AGENT_STARTUP_TIMEOUT_S,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            started_wait.cancel()
+        if not started.is_set() and not ctx.agent_task.done():
+            logger.warning(
+                "Agent '{}' did not report startup within {}s",
+                ctx.name,
+                AGENT_STARTUP_TIMEOUT_S,
+            )
+
     async def _initialize_client(self, client: AgentClient, ctx: AgentContext) -> None:
-        """Initialize client with retry for local agents."""
+        """Initialize client with retry for local agents.
+
+        A local agent is first given the chance to report that it is
+        listening, so the first attempt usually succeeds. Retries back off
+        exponentially with jitter so racing starts do not retry in lockstep.
+        """
         retries = 3 if ctx.agent_task else 1
-        delay = 0.2
+        started = getattr(ctx.agent_instance, "started", None)
+        if ctx.agent_task and isinstance(started, asyncio.Event):
+            try:
+                await asyncio.wait_for(started.wait(), timeout=CLIENT_READY_WAIT_S)
+            except asyncio.TimeoutError:
+                pass
         for attempt in range(retries):
             try:
                 await client.ensure_initialized()
@@ -400,8 +769,7 @@ class RemoteConnections:
                     retries,
                     exc,
                 )
-                await asyncio.sleep(delay)
-                delay = min(delay * 2, 1.0)
+                await asyncio.sleep(random.uniform(0.05, 0.15) * (2**attempt))
 
     async def _start_listener(
         self,
@@ -423,15 +791,29 @@ class RemoteConnections:
         """
         if port is None:
             port = get_next_available_port(5000)
+        ready = asyncio.Event()
         listener = NotificationListener(
             host=host,
             port=port,
             notification_callback=notification_callback,
+            ready_event=ready,
         )
-        listener_task = asyncio.create_task(listener.start_async())
+        listener_task = self._spawn(listener.start_async())
         listener_url = f"http://{host}:{port}/notify"
-        await asyncio.sleep(0.3)
-        logger.info(f"Started listener at {listener_url}")
+        # Wait until the port is bound, or the listener exits early
+        ready_wait = asyncio.create_task(ready.wait())
+        try:
+            await asyncio.wait(
+                (listener_task, ready_wait),
+                timeout=LISTENER_READY_TIMEOUT_S,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            ready_wait.cancel()
+        if ready.is_set():
+            logger.info(f"Started listener at {listener_url}")
+        else:
+            logger.warning(f"Listener at {listener_url} did not report ready")
         return listener_task, listener_url
 
     async def _get_or_create_context(
@@ -440,7 +822,7 @@ class RemoteConnections:
     ) -> AgentContext:
         """Get an AgentContext for a known agent (from local configs)."""
         # Load remote contexts lazily
-        self._ensure_remote_contexts_loaded()
+        await self._ensure_remote_contexts_loaded_async()
 
         ctx = self._contexts.get(agent_name)
         if ctx:
@@ -456,8 +838,8 @@ class RemoteConnections:
         ctx = self._contexts.get(agent_name)
         if not ctx:
             return
-        agent_task = ctx.agent_task
-        if agent_task:
+
+        async def _shutdown_agent(agent_task: asyncio.Task) -> None:
             if ctx.agent_instance and hasattr(ctx.agent_instance, "shutdown"):
                 try:
                     await ctx.agent_instance.shutdown()
@@ -476,21 +858,39 @@ class RemoteConnections:
             finally:
                 ctx.agent_task = None
                 ctx.agent_instance = None
-        elif ctx.agent_instance is not None:
-            ctx.agent_instance = None
-        # Close client
-        if ctx.client:
-            await ctx.client.close()
-            ctx.client = None
-        # Stop listener
-        if ctx.listener_task:
-            ctx.listener_task.cancel()
+
+        async def _close_client(client: AgentClient) -> None:
             try:
-                await ctx.listener_task
+                await client.close()
+            finally:
+                if ctx.client is client:
+                    ctx.client = None
+                    self._invalidate_card_snapshots()
+
+        async def _stop_listener(listener_task: asyncio.Task) -> None:
+            listener_task.cancel()
+            try:
+                await listener_task
             except asyncio.CancelledError:
                 pass
             ctx.listener_task = None
             ctx.listener_url = None
+
+        # Agent runtime, client and listener are independent, so shut them
+        # down together rather than paying for each in turn
+        steps = []
+        if ctx.agent_task:
+            steps.append(_shutdown_agent(ctx.agent_task))
+        elif ctx.agent_instance is not None:
+            ctx.agent_instance = None
+        if ctx.client:
+            steps.append(_close_client(ctx.client))
+        if ctx.listener_task:
+            steps.append(_stop_listener(ctx.listener_task))
+        results = await asyncio.gather(*steps, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("Error cleaning up agent '{}': {}", agent_name, result)
         # Keep the context to allow quick reconnection; do not delete metadata
         # Removing deletion allows list_available_agents to remain stable
 
@@ -518,26 +918,24 @@ class RemoteConnections:
 
     def list_available_agents(self) -> List[str]:
         """List all available agents from local config cards"""
-        # Ensure remote contexts are loaded
-        self._ensure_remote_contexts_loaded()
+        if not self._remote_contexts_loaded:
+            self._load_remote_contexts()
         return list(self._contexts.keys())
 
     async def stop_all(self):
         """Stop all running clients and listeners"""
-        for agent_name in list(self._contexts.keys()):
-            await self.stop_agent(agent_name)
+        await asyncio.gather(
+            *(self.stop_agent(agent_name) for agent_name in list(self._contexts))
+        )
 
     def get_agent_card(self, agent_name: str) -> Optional[AgentCard]:
         """Get AgentCard for a known agent from local configs."""
-        self._ensure_remote_contexts_loaded()
+        if not self._remote_contexts_loaded:
+            self._load_remote_contexts()
         ctx = self._contexts.get(agent_name)
         if not ctx:
             return None
-        if ctx.client and ctx.client.agent_card:
-            return ctx.client.agent_card
-        if ctx.local_agent_card:
-            return ctx.local_agent_card
-        return None
+        return _context_card(ctx)
 
     def get_all_agent_cards(self) -> Dict[str, AgentCard]:
         """Get all AgentCards for known agents from local configs.
@@ -545,36 +943,26 @@ class RemoteConnections:
         Returns:
             Dict mapping agent names to their AgentCard objects.
         """
-        self._ensure_remote_contexts_loaded()
-        agent_cards = {}
-        for name, _ in self._contexts.items():
-            card = self.get_agent_card(name)
-            if card:
-                agent_cards[name] = card
-
-        return agent_cards
+        if not self._remote_contexts_loaded:
+            self._load_remote_contexts()
+        if self._cards_snapshot is None:
+            self._build_card_snapshots()
+        return dict(self._cards_snapshot)
 
     def get_planable_agent_cards(self) -> Dict[str, AgentCard]:
         """Return AgentCards that are available for planning workflows."""
-        self._ensure_remote_contexts_loaded()
-        planable_cards: Dict[str, AgentCard] = {}
-        for name, ctx in self._contexts.items():
-            if ctx.planner_passthrough or ctx.hidden:
-                continue
-            card = None
-            if ctx.client and ctx.client.agent_card:
-                card = ctx.client.agent_card
-            elif ctx.local_agent_card:
-                card = ctx.local_agent_card
-            if card:
-                planable_cards[name] = card
-        return planable_cards
+        if not self._remote_contexts_loaded:
+            self._load_remote_contexts()
+        if self._planable_cards_snapshot is None:
+            self._build_card_snapshots()
+        return dict(self._planable_cards_snapshot)
 
     def is_planner_passthrough(self, agent_name: str) -> bool:
         """Return True if the named agent is marked as planner passthrough.
 
         The flag is read from stored metadata associated with the AgentContext.
         """
-        self._ensure_remote_contexts_loaded()
+        if not self._remote_contexts_loaded:
+            self._load_remote_contexts()
         ctx = self._contexts.get(agent_name)
-        return bool(getattr(ctx, "planner_passthrough", False)) if ctx else False
+        return ctx.planner_passthrough if ctx else False
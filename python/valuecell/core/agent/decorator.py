@@ -28,6 +28,7 @@ from valuecell.core.types import (
 )
 from valuecell.utils import parse_host_port
 
+from .listener import ReadySignalServer
 from .responses import EventPredicates
 
 logger = logging.getLogger(__name__)
@@ -60,8 +61,11 @@ def _serve(agent_card: AgentCard):
                 )
                 self._executor = None
                 self._server: uvicorn.Server | None = None
+                # Set once the server has bound its port
+                self.started = asyncio.Event()
 
             async def serve(self):
+                self.started.clear()
                 # Create AgentExecutor wrapper
                 self._executor = _create_agent_executor(self)
 
@@ -90,7 +94,7 @@ def _serve(agent_card: AgentCard):
                     port=self._port,
                     log_level="info",
                 )
-                self._server = uvicorn.Server(config)
+                self._server = ReadySignalServer(config, ready_event=self.started)
                 logger.info(f"Starting {agent_name} server at {self.agent_card.url}")
                 try:
                     await self._server.serve()
@@ -12,6 +12,21 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class ReadySignalServer(uvicorn.Server):
+    """uvicorn server that sets an event once its sockets are bound."""
+
+    def __init__(
+        self, config: uvicorn.Config, ready_event: Optional[asyncio.Event] = None
+    ):
+        super().__init__(config)
+        self.ready_event = ready_event
+
+    async def startup(self, sockets=None) -> None:
+        await super().startup(sockets=sockets)
+        if self.started and self.ready_event is not None:
+            self.ready_event.set()
+
+
 class NotificationListener:
     """HTTP server for receiving push notifications from agents.
 
@@ -24,6 +39,7 @@ class NotificationListener:
         host: str = "localhost",
         port: int = 5000,
         notification_callback: Optional[Callable] = None,
+        ready_event: Optional[asyncio.Event] = None,
     ):
         """Initialize the notification listener.
 
@@ -31,10 +47,12 @@ class NotificationListener:
             host: Host to bind the server to
             port: Port to listen on
             notification_callback: Function to call when notifications are received
+            ready_event: Event set by `start_async` once the port is bound
         """
         self.host = host
         self.port = port
         self.notification_callback = notification_callback
+        self.ready_event = ready_event
         self.app = self._create_app()
 
     def _create_app(self):
@@ -81,7 +99,7 @@ class NotificationListener:
         config = uvicorn.Config(
             self.app, host=self.host, port=self.port, log_level="info"
         )
-        server = uvicorn.Server(config)
+        server = ReadySignalServer(config, ready_event=self.ready_event)
         await server.serve()
 
 
@@ -83,15 +83,22 @@ class DummyNotificationListener:
     """Dummy listener that doesn't bind a real port."""
 
     def __init__(
-        self, host: str = "localhost", port: int = 0, notification_callback=None
+        self,
+        host: str = "localhost",
+        port: int = 0,
+        notification_callback=None,
+        ready_event: Optional[asyncio.Event] = None,
     ):
         self.host = host
         self.port = port
         self.notification_callback = notification_callback
+        self.ready_event = ready_event
 
     async def start_async(self):
         # Simulate server startup without actually starting uvicorn
         await asyncio.sleep(0.01)
+        if self.ready_event is not None:
+            self.ready_event.set()
 
 
 # ----------------------------
@@ -283,6 +290,74 @@ async def test_concurrent_start_calls_single_initialization(
     assert FakeAgentClient.create_count == 1
 
 
+@pytest.mark.asyncio
+async def test_concurrent_start_shares_setup_without_holding_lock(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    card = make_card_dict("SharedStart", "http://127.0.0.1:8502", False)
+    dir_path = tmp_path / "agent_cards"
+    dir_path.mkdir(parents=True)
+    _write_card(dir_path / "SharedStart.json", card)
+
+    rc = RemoteConnections()
+    lock_held_during_connect = []
+    fail_next = [True]
+
+    class SlowClient(FakeAgentClient):
+        async def ensure_initialized(self):
+            lock_held_during_connect.append(rc._get_agent_lock("SharedStart").locked())
+            await asyncio.sleep(0.01)
+            if fail_next[0]:
+                raise RuntimeError("connect failed")
+            await super().ensure_initialized()
+
+    monkeypatch.setattr(connect_mod, "AgentClient", SlowClient)
+    FakeAgentClient.cards_by_url = {card["url"]: AgentCard.model_validate(card)}
+    SlowClient.create_count = 0
+    rc.load_from_dir(str(dir_path))
+
+    # Every concurrent caller sees the shared failure
+    results = await asyncio.gather(
+        rc.start_agent("SharedStart"),
+        rc.start_agent("SharedStart"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert SlowClient.create_count == 1
+
+    # The failed start is forgotten, so the next call retries
+    fail_next[0] = False
+    first, second = await asyncio.gather(
+        rc.start_agent("SharedStart"), rc.start_agent("SharedStart")
+    )
+    assert first is second
+    assert SlowClient.create_count == 2
+    assert lock_held_during_connect == [False, False]
+
+
+@pytest.mark.asyncio
+async def test_start_agent_fast_path_skips_agent_lock(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    card = make_card_dict("FastAgent", "http://127.0.0.1:8451", False)
+    dir_path = tmp_path / "agent_cards"
+    dir_path.mkdir(parents=True)
+    _write_card(dir_path / "FastAgent.json", card)
+
+    monkeypatch.setattr(connect_mod, "AgentClient", FakeAgentClient)
+    FakeAgentClient.cards_by_url = {card["url"]: AgentCard.model_validate(card)}
+
+    rc = RemoteConnections()
+    rc.load_from_dir(str(dir_path))
+    first = await rc.start_agent("FastAgent")
+
+    # A connected agent is returned even while its lock is held elsewhere
+    async with rc._get_agent_lock("FastAgent"):
+        again = await asyncio.wait_for(rc.start_agent("FastAgent"), timeout=1)
+
+    assert again is first
+
+
 @pytest.mark.asyncio
 async def test_stop_agent_and_stop_all(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     card1 = make_card_dict("A1", "http://127.0.0.1:8601", push_notifications=True)
@@ -354,6 +429,137 @@ async def test_disabled_agents_are_skipped(tmp_path: Path):
     assert rc.list_available_agents() == ["EnabledAgent"]
 
 
+@pytest.mark.asyncio
+async def test_async_load_reads_cards_once_for_concurrent_callers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    dir_path = tmp_path / "agent_cards"
+    dir_path.mkdir(parents=True)
+
+    _write_card(
+        dir_path / "AsyncA.json",
+        make_card_dict("AsyncA", "http://127.0.0.1:8711", True),
+    )
+    _write_card(
+        dir_path / "AsyncB.json",
+        make_card_dict("AsyncB", "http://127.0.0.1:8712", True),
+    )
+    (dir_path / "Broken.json").write_text("{not json", encoding="utf-8")
+
+    rc = RemoteConnections()
+    load_calls = 0
+    original_load = rc._load_remote_contexts_async
+
+    async def counting_load(agent_card_dir=None):
+        nonlocal load_calls
+        load_calls += 1
+        await original_load(str(dir_path))
+
+    monkeypatch.setattr(rc, "_load_remote_contexts_async", counting_load)
+
+    ctx_a, ctx_b = await asyncio.gather(
+        rc._get_or_create_context("AsyncA"), rc._get_or_create_context("AsyncB")
+    )
+
+    assert load_calls == 1
+    assert ctx_a.name == "AsyncA"
+    assert ctx_b.local_agent_card.url == "http://127.0.0.1:8712"
+    assert sorted(rc.list_available_agents()) == ["AsyncA", "AsyncB"]
+
+
+def test_card_cache_skips_unchanged_files(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    _isolated_agent_card_cache: Path,
+):
+    dir_path = tmp_path / "agent_cards"
+    dir_path.mkdir(parents=True)
+    _write_card(
+        dir_path / "Cached.json",
+        make_card_dict("Cached", "http://127.0.0.1:8721", True),
+    )
+
+    RemoteConnections().load_from_dir(str(dir_path))
+    # Written to the user cache directory, never next to the card files
+    assert connect_mod._card_cache_path(dir_path).exists()
+    assert connect_mod._card_cache_path(dir_path).is_relative_to(
+        _isolated_agent_card_cache
+    )
+    assert sorted(p.name for p in dir_path.iterdir()) == ["Cached.json"]
+
+    parsed = []
+    original_parse = connect_mod._card_context_kwargs
+
+    def tracking_parse(raw_card):
+        kwargs = original_parse(raw_card)
+        parsed.append(kwargs["name"])
+        return kwargs
+
+    monkeypatch.setattr(connect_mod, "_card_context_kwargs", tracking_parse)
+
+    rc = RemoteConnections()
+    rc.load_from_dir(str(dir_path))
+    assert parsed == []
+    assert rc.get_agent_card("Cached").url == "http://127.0.0.1:8721"
+
+    # A changed file is parsed again
+    _write_card(
+        dir_path / "Cached.json",
+        make_card_dict("Cached", "http://127.0.0.1:8722/changed", True),
+    )
+    rc = RemoteConnections()
+    rc.load_from_dir(str(dir_path))
+    assert parsed == ["Cached"]
+    assert rc.get_agent_card("Cached").url == "http://127.0.0.1:8722/changed"
+
+
+def test_card_cache_is_invalidated_by_parser_fingerprint(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    dir_path = tmp_path / "agent_cards"
+    dir_path.mkdir(parents=True)
+    _write_card(
+        dir_path / "Cached.json",
+        make_card_dict("Cached", "http://127.0.0.1:8723", True),
+    )
+    RemoteConnections().load_from_dir(str(dir_path))
+    assert connect_mod._load_card_cache(dir_path)
+
+    # A different a2a version or card parser source must not reuse entries
+    monkeypatch.setattr(connect_mod, "_card_parser_fingerprint", lambda: "other-parser")
+    assert connect_mod._load_card_cache(dir_path) == {}
+
+    parsed = []
+    original_parse = connect_mod._card_context_kwargs
+
+    def tracking_parse(raw_card):
+        kwargs = original_parse(raw_card)
+        parsed.append(kwargs["name"])
+        return kwargs
+
+    monkeypatch.setattr(connect_mod, "_card_context_kwargs", tracking_parse)
+    RemoteConnections().load_from_dir(str(dir_path))
+    assert parsed == ["Cached"]
+    assert connect_mod._load_card_cache(dir_path)
+
+
+def test_card_cache_is_kept_per_directory(tmp_path: Path):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    for dir_path, name in ((first, "First"), (second, "Second")):
+        dir_path.mkdir()
+        _write_card(
+            dir_path / "Agent.json",
+            make_card_dict(name, "http://127.0.0.1:8724", True),
+        )
+        RemoteConnections().load_from_dir(str(dir_path))
+
+    assert connect_mod._card_cache_path(first) != connect_mod._card_cache_path(second)
+    rc = RemoteConnections()
+    rc.load_from_dir(str(first))
+    assert rc.list_available_agents() == ["First"]
+
+
 @pytest.mark.asyncio
 async def test_get_all_agent_cards_returns_local_cards(tmp_path: Path):
     dir_path = tmp_path / "agent_cards"
@@ -376,6 +582,35 @@ async def test_get_all_agent_cards_returns_local_cards(tmp_path: Path):
     assert all(isinstance(card, AgentCard) for card in all_cards.values())
 
 
+@pytest.mark.asyncio
+async def test_card_snapshots_follow_client_connections(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    dir_path = tmp_path / "agent_cards"
+    dir_path.mkdir(parents=True)
+    card = make_card_dict("SnapAgent", "http://127.0.0.1:8811", False)
+    _write_card(dir_path / "SnapAgent.json", card)
+
+    remote_card = AgentCard.model_validate({**card, "description": "From remote"})
+    monkeypatch.setattr(connect_mod, "AgentClient", FakeAgentClient)
+    FakeAgentClient.cards_by_url = {card["url"]: remote_card}
+
+    rc = RemoteConnections()
+    rc.load_from_dir(str(dir_path))
+    assert rc.get_planable_agent_cards()["SnapAgent"].description == (
+        "Test card for SnapAgent"
+    )
+
+    await rc.start_agent("SnapAgent")
+    assert rc.get_all_agent_cards()["SnapAgent"] is remote_card
+    assert rc.get_planable_agent_cards()["SnapAgent"] is remote_card
+
+    await rc.stop_agent("SnapAgent")
+    assert rc.get_all_agent_cards()["SnapAgent"].description == (
+        "Test card for SnapAgent"
+    )
+
+
 def test_agent_context_reads_metadata_flags(tmp_path: Path):
     dir_path = tmp_path / "agent_cards"
     dir_path.mkdir(parents=True)
@@ -462,6 +697,45 @@ async def test_resolve_local_agent_class_from_metadata(
     assert ctx.agent_instance_class is DummyAgent
 
 
+@pytest.mark.asyncio
+async def test_load_warms_local_agent_class(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    dir_path = tmp_path / "agent_cards"
+    dir_path.mkdir(parents=True)
+    card = make_card_dict("WarmAgent", "http://127.0.0.1:9002", False)
+    card["metadata"] = {connect_mod.AGENT_METADATA_CLASS_KEY: "warm:Spec"}
+    _write_card(dir_path / "WarmAgent.json", card)
+
+    class DummyAgent:
+        pass
+
+    resolved = []
+
+    def fake_resolve(spec):
+        resolved.append(spec)
+        connect_mod._LOCAL_AGENT_CLASS_CACHE[spec] = DummyAgent
+        return DummyAgent
+
+    monkeypatch.setattr(connect_mod, "_resolve_local_agent_class", fake_resolve)
+    monkeypatch.setattr(connect_mod, "create_wrapped_agent", lambda cls: cls)
+
+    rc = RemoteConnections()
+    try:
+        rc.load_from_dir(str(dir_path))
+        pending = connect_mod._PENDING_CLASS_RESOLUTIONS.get("warm:Spec")
+        if pending is not None:
+            await asyncio.wrap_future(pending)
+        assert connect_mod._LOCAL_AGENT_CLASS_CACHE["warm:Spec"] is DummyAgent
+
+        result = await connect_mod._build_local_agent(rc._contexts["WarmAgent"])
+
+        assert result is DummyAgent
+        assert resolved == ["warm:Spec"]
+    finally:
+        connect_mod._LOCAL_AGENT_CLASS_CACHE.pop("warm:Spec", None)
+
+
 @pytest.mark.asyncio
 async def test_initialize_client_retries():
     rc = RemoteConnections()
@@ -502,6 +776,37 @@ async def test_initialize_client_retries():
     assert client.agent_card is not None
 
 
+@pytest.mark.asyncio
+async def test_initialize_client_waits_for_started_agent():
+    rc = RemoteConnections()
+    ctx = connect_mod.AgentContext(name="StartingAgent")
+    ctx.agent_task = True
+
+    class StartingInstance:
+        def __init__(self):
+            self.started = asyncio.Event()
+
+    ctx.agent_instance = StartingInstance()
+
+    class ReadyOnlyClient:
+        attempts = 0
+        agent_card = None
+
+        async def ensure_initialized(self):
+            self.attempts += 1
+            if not ctx.agent_instance.started.is_set():
+                raise RuntimeError("not listening yet")
+            self.agent_card = object()
+
+    client = ReadyOnlyClient()
+    asyncio.get_running_loop().call_later(0.01, ctx.agent_instance.started.set)
+
+    await rc._initialize_client(client, ctx)
+
+    assert client.attempts == 1
+    assert client.agent_card is not None
+
+
 def test_resolve_local_agent_class_empty_spec_returns_none():
     assert connect_mod._resolve_local_agent_class("") is None
 
@@ -618,6 +923,65 @@ async def test_ensure_agent_runtime_new_task_failure(monkeypatch: pytest.MonkeyP
     assert ctx.agent_instance is None
 
 
+@pytest.mark.asyncio
+async def test_ensure_agent_runtime_waits_for_started_event(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    rc = RemoteConnections()
+    ctx = connect_mod.AgentContext(name="StartedAgent")
+
+    class SlowBindingAgent:
+        def __init__(self):
+            self.started = asyncio.Event()
+
+        async def serve(self):
+            for _ in range(3):
+                await asyncio.sleep(0)
+            self.started.set()
+            await asyncio.Event().wait()
+
+    agent = SlowBindingAgent()
+
+    async def _factory(_):
+        return agent
+
+    monkeypatch.setattr(connect_mod, "_build_local_agent", _factory)
+
+    await rc._ensure_agent_runtime(ctx)
+
+    assert agent.started.is_set()
+    assert ctx.agent_task is not None and not ctx.agent_task.done()
+    ctx.agent_task.cancel()
+    await asyncio.gather(ctx.agent_task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_ensure_agent_runtime_detects_late_startup_failure(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    rc = RemoteConnections()
+    ctx = connect_mod.AgentContext(name="LateFailingAgent")
+
+    class LateFailingAgent:
+        def __init__(self):
+            self.started = asyncio.Event()
+
+        async def serve(self):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("bind failed")
+
+    async def _factory(_):
+        return LateFailingAgent()
+
+    monkeypatch.setattr(connect_mod, "_build_local_agent", _factory)
+
+    with pytest.raises(RuntimeError, match="LateFailingAgent"):
+        await rc._ensure_agent_runtime(ctx)
+
+    assert ctx.agent_task is None
+    assert ctx.agent_instance is None
+
+
 @pytest.mark.asyncio
 async def test_cleanup_agent_handles_timeout(monkeypatch: pytest.MonkeyPatch):
     rc = RemoteConnections()
@@ -654,6 +1018,34 @@ async def test_cleanup_agent_handles_timeout(monkeypatch: pytest.MonkeyPatch):
         await task
 
 
+@pytest.mark.asyncio
+async def test_cleanup_agent_shuts_down_resources_concurrently():
+    rc = RemoteConnections()
+    agent_name = "ParallelAgent"
+    ctx = connect_mod.AgentContext(name=agent_name)
+    client_closing = asyncio.Event()
+
+    class DummyInstance:
+        async def shutdown(self):
+            # Only completes if the client is being closed at the same time
+            await client_closing.wait()
+
+    class DummyClient:
+        async def close(self):
+            client_closing.set()
+
+    ctx.agent_task = asyncio.create_task(asyncio.sleep(0))
+    ctx.agent_instance = DummyInstance()
+    ctx.client = DummyClient()
+    rc._contexts[agent_name] = ctx
+
+    await asyncio.wait_for(rc._cleanup_agent(agent_name), timeout=1)
+
+    assert ctx.agent_task is None
+    assert ctx.agent_instance is None
+    assert ctx.client is None
+
+
 @pytest.mark.asyncio
 async def test_cleanup_agent_clears_idle_resources():
     rc = RemoteConnections()
@@ -671,3 +1063,17 @@ async def test_cleanup_agent_clears_idle_resources():
     assert ctx.listener_task is None
     assert ctx.listener_url is None
     assert listener.cancelled() or listener.done()
+
+
+@pytest.mark.asyncio
+async def test_spawn_holds_task_reference_until_done():
+    rc = RemoteConnections()
+    release = asyncio.Event()
+
+    task = rc._spawn(release.wait())
+    assert task in rc._background_tasks
+
+    release.set()
+    await task
+    await asyncio.sleep(0)
+    assert task not in rc._background_tasks
@@ -328,7 +328,7 @@ class TestServeDecorator:
         assert instance.agent_card == mock_card
 
     @patch("valuecell.core.agent.decorator.find_local_agent_card_by_agent_name")
-    @patch("uvicorn.Server")
+    @patch("valuecell.core.agent.decorator.ReadySignalServer")
     @patch("httpx.AsyncClient")
     @patch("valuecell.core.agent.decorator.A2AStarletteApplication")
     @patch("valuecell.core.agent.decorator.DefaultRequestHandler")
@@ -4,12 +4,14 @@ Unit tests for valuecell.core.agent.listener module
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from starlette.testclient import TestClient
 
 from valuecell.core.agent.listener import NotificationListener
+from valuecell.utils import get_next_available_port
 
 
 class TestNotificationListener:
@@ -34,6 +36,22 @@ class TestNotificationListener:
 
         assert listener.notification_callback == callback
 
+    @pytest.mark.asyncio
+    async def test_start_async_sets_ready_event_once_bound(self):
+        """Test that start_async signals readiness after binding its port."""
+        ready = asyncio.Event()
+        listener = NotificationListener(
+            "127.0.0.1", get_next_available_port(5600), ready_event=ready
+        )
+
+        task = asyncio.create_task(listener.start_async())
+        try:
+            await asyncio.wait_for(ready.wait(), timeout=5)
+            assert not task.done()
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
     def test_create_app(self):
         """Test that _create_app creates a Starlette app with routes."""
         listener = NotificationListener()
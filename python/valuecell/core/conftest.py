@@ -0,0 +1,11 @@
+import pytest
+
+from valuecell.core.agent import connect
+
+
+@pytest.fixture(autouse=True)
+def _isolated_agent_card_cache(tmp_path_factory, monkeypatch):
+    """Keep the parsed agent card cache out of the user cache directory."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setattr(connect, "get_system_cache_dir", lambda: cache_dir)
+    return cache_dir
@@ -35,6 +35,27 @@ def get_system_env_path() -> Path:
     return get_system_env_dir() / ".env"
 
 
+def get_system_cache_dir() -> Path:
+    """Return the OS user cache directory for ValueCell.
+
+    - macOS: ~/Library/Caches/ValueCell
+    - Linux: $XDG_CACHE_HOME/valuecell (default ~/.cache/valuecell)
+    - Windows: %LOCALAPPDATA%\\ValueCell\\Cache
+    """
+    home = Path.home()
+    # Windows
+    if os.name == "nt":
+        local_appdata = os.getenv("LOCALAPPDATA")
+        base = Path(local_appdata) if local_appdata else (home / "AppData" / "Local")
+        return base / "ValueCell" / "Cache"
+    # macOS (posix with darwin kernel)
+    if sys_platform_is_darwin():
+        return home / "Library" / "Caches" / "ValueCell"
+    # Linux and other Unix-like
+    xdg_cache = os.getenv("XDG_CACHE_HOME")
+    return (Path(xdg_cache) if xdg_cache else home / ".cache") / "valuecell"
+
+
 def ensure_system_env_dir() -> Path:
     """Ensure the system config directory exists and return it."""
     d = get_system_env_dir()